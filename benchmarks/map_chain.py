@@ -0,0 +1,100 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the wall time it takes a map to visit deep dependency chains where
+each resource only does a token amount of work. The clock stops once every
+worker thread has exited, so any time beyond ``depth * delay`` is scheduling
+overhead.
+
+Usage::
+
+    python benchmarks/map_chain.py [--depth 20] [--width 4] [--delay 0.001]
+"""
+
+from __future__ import print_function
+
+import argparse
+import threading
+import time
+
+from touchdown.core.dependencies import DependencyMap
+from touchdown.core.map import ParallelMap, SerialMap
+
+
+class Node(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.dependencies = set()
+
+    def __str__(self):
+        return self.name
+
+    def __lt__(self, other):
+        return self.name < other.name
+
+
+class UI(object):
+
+    def echo(self, text):
+        print(text)
+
+    def failure(self, text):
+        print(text)
+
+
+def build_chains(depth, width):
+    root = Node("root")
+    for chain in range(width):
+        previous = None
+        for link in range(depth):
+            node = Node("chain{}-link{}".format(chain, link))
+            if previous:
+                node.dependencies.add(previous)
+            previous = node
+        root.dependencies.add(previous)
+    return root
+
+
+def run(map_class, depth, width, delay):
+    root = build_chains(depth, width)
+    start = time.time()
+    for status in map_class(UI(), DependencyMap(root), lambda resource: time.sleep(delay)):
+        pass
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread():
+            thread.join()
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--width", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=0.001)
+    args = parser.parse_args()
+
+    for map_class in (SerialMap, ParallelMap):
+        duration = run(map_class, args.depth, args.width, args.delay)
+        print("{}: {} chains of depth {} in {:.4f}s".format(
+            map_class.__name__,
+            args.width,
+            args.depth,
+            duration,
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures how long the ``touchdown`` CLI takes to start up when nothing needs
+to talk to AWS. Each run is a fresh interpreter that builds the argument
+parser and prints ``--help`` from an empty directory. That imports the goals,
+but resource types are only imported when a ``Touchdownfile`` uses them, so
+this is mostly the cost of importing Touchdown's core and its dependencies.
+
+Usage::
+
+    python benchmarks/startup.py [--runs 10]
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+SCRIPT = "from touchdown.core.main import main; main(['--help'])"
+
+
+def run(cwd):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+
+    start = time.time()
+    with open(os.devnull, "w") as devnull:
+        subprocess.check_call([sys.executable, "-c", SCRIPT], cwd=cwd, env=env, stdout=devnull)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    cwd = tempfile.mkdtemp()
+    try:
+        # Warm up the filesystem cache and any .pyc files
+        run(cwd)
+        durations = sorted(run(cwd) for i in range(args.runs))
+    finally:
+        shutil.rmtree(cwd)
+
+    print("touchdown --help: min {:.3f}s, median {:.3f}s over {} runs".format(
+        durations[0],
+        durations[len(durations) // 2],
+        args.runs,
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,14 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import touchdown.aws  # noqa
-import touchdown.config  # noqa
-import touchdown.gpg  # noqa
-import touchdown.local  # noqa
-import touchdown.provisioner  # noqa
-import touchdown.ssh  # noqa
+# Resource packages (touchdown.aws, touchdown.ssh, etc) are imported the
+# first time a Touchdownfile uses them - see touchdown.core.registry
 import touchdown.goals  # noqa
-import touchdown.notifications  # noqa
 
 from touchdown.core import Workspace
 
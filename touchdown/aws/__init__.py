@@ -12,32 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from . import (
-    account,
-    vpc,
-    acm,
-    apigateway,
-    ec2,
-    cloudfront,
-    cloudwatch,
-    cloudtrail,
-    cost,
-    elasticache,
-    elastictranscoder,
-    elb,
-    events,
-    iam,
-    kms,
-    lambda_,
-    logs,
-    rds,
-    route53,
-    s3,
-    sns,
-    sqs,
-    external_account,
-    password_policy,
-)
+# The service packages are imported on first use - see touchdown.core.registry
 
 __all__ = [
     'account',
@@ -68,7 +68,7 @@ class Null(Plan):
                         session = Session.fromjson(self.cache[cache_key])
 
                     if not session or session.expiration <= now():
-                        client = base_session.create_client("sts")
+                        client = base_session.get_client("sts")
                         creds = client.get_session_token(
                             SerialNumber=self.resource.mfa_serial,
                             TokenCode=self.ui.prompt(
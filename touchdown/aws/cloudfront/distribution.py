@@ -206,6 +206,7 @@ class LoggingConfig(Resource):
 class Distribution(Resource):
 
     resource_name = "distribution"
+    expected_duration = 1200
 
     extra_serializers = {
         "CallerReference": serializers.Expression(
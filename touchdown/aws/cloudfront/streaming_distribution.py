@@ -43,6 +43,7 @@ class StreamingLoggingConfig(Resource):
 class StreamingDistribution(Resource):
 
     resource_name = "streaming_distribution"
+    expected_duration = 1200
 
     extra_serializers = {
         "CallerReference": serializers.Expression(
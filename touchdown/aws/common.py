@@ -13,15 +13,19 @@
 # limitations under the License.
 
 import datetime
+import json
 import logging
+import threading
 import time
 
 import jmespath
+from botocore import xform_name
 from botocore.exceptions import ClientError
 
 from touchdown.core import errors, resource, serializers
-from touchdown.core.action import Action
+from touchdown.core.action import Action, PollingAction
 from touchdown.core.plan import Present
+from touchdown.core.reactor import BackoffPoll
 
 logger = logging.getLogger(__name__)
 
@@ -33,15 +37,118 @@ class Resource(resource.Resource):
         return d.matches()
 
 
-class Waiter(Action):
+def filter_envelope(response, path, predicate):
+    """
+    Returns a copy of ``response`` that only contains the objects under
+    ``path`` that match ``predicate``. ``path`` is a list of keys, each of
+    which holds a list (e.g. ``["Reservations", "Instances"]``).
+    """
+    head, rest = path[0], path[1:]
+    if not rest:
+        matches = [obj for obj in response.get(head, []) if predicate(obj)]
+    else:
+        matches = []
+        for item in response.get(head, []):
+            item = filter_envelope(item, rest, predicate)
+            if item[rest[0]]:
+                matches.append(item)
+    response = dict(response)
+    response[head] = matches
+    return response
+
+
+class WaiterBatch(object):
+
+    """
+    Waiters that poll the same API for objects they know the id of share one
+    of these. Each call asks about every id that is still being waited for,
+    and a response is reused by the other waiters for up to ``max_age``
+    seconds.
+    """
+
+    def __init__(self, operation, ids_param):
+        self.operation = operation
+        self.ids_param = ids_param
+        self.waiting = set()
+        self.polled = frozenset()
+        self.response = None
+        self.fetched = 0
+        self.lock = threading.Lock()
+
+    def poll(self, object_id, max_age):
+        with self.lock:
+            self.waiting.add(object_id)
+            if object_id not in self.polled or time.time() - self.fetched > max_age:
+                self.polled = frozenset(self.waiting)
+                logger.debug("Polling {} for {}".format(self.ids_param, sorted(self.polled)))
+                self.response = self.operation(**{self.ids_param: sorted(self.polled)})
+                self.fetched = time.time()
+            return self.response
+
+    def discard(self, object_id):
+        with self.lock:
+            self.waiting.discard(object_id)
+
+
+class Waiter(PollingAction):
+
+    # Waiters back off exponentially from the delay botocore suggests up to
+    # this many seconds between polls (or the suggested delay if larger)
+    max_delay = 60
 
     def __init__(self, plan, description, waiter, eventual_consistency_threshold):
         super(Waiter, self).__init__(plan)
         self.description = description
         self.waiter = self.plan.client.get_waiter(waiter)
         self.eventual_consistency_threshold = eventual_consistency_threshold
+        self.batch = None
+
+    def get_batch(self):
+        """
+        Waiters can share polls when they know the id of the object they are
+        waiting for and the API takes a list of ids (e.g. ``SubnetIds`` for
+        ``SubnetId``).
+        """
+        if not self.plan.resource_id:
+            return None
+
+        # The response is picked apart with ``describe_envelope``
+        if xform_name(self.waiter.config.operation) != self.plan.describe_action:
+            return None
+
+        path = self.plan.describe_envelope.rstrip("[]").split("[].")
+        if not all(part.isalnum() for part in path):
+            return None
+
+        operation = self.plan.client.meta.service_model.operation_model(self.waiter.config.operation)
+        ids_param = self.plan.key + "s"
+        if not operation.input_shape or ids_param not in operation.input_shape.members:
+            return None
+
+        # This isn't a listing, so it is deliberately keyed so that it isn't
+        # invalidated when something changes
+        cache_key = ("waiters", ) + self.plan.get_cache_prefix() + (
+            self.plan.api_version,
+            self.waiter.config.operation,
+        )
+        batch = self.plan.runner.run_cache.get_or_create(
+            cache_key,
+            lambda: WaiterBatch(self.waiter._operation_method, ids_param),
+        )
+        return batch, path
+
+    def poll(self, shared=True):
+        if self.batch is None:
+            self.batch = self.get_batch() or False
+
+        if self.batch and shared:
+            batch, path = self.batch
+            resource_id = self.plan.resource_id
+            response = batch.poll(resource_id, self.waiter.config.delay)
+            # If any of the ids were bad the whole call fails, so ask on our own
+            if 'Error' not in response:
+                return filter_envelope(response, path, lambda obj: obj.get(self.plan.key) == resource_id)
 
-    def poll(self):
         filters = self.plan.get_describe_filters()
         logger.debug("Polling with waiter {} and filters {}".format(self.waiter, filters))
         return self.waiter._operation_method(**filters)
@@ -50,7 +157,8 @@ class Waiter(Action):
         acceptors = list(self.waiter.config.acceptors)
         for i in range(self.eventual_consistency_threshold):
             current_state = 'waiting'
-            response = self.poll()
+            # Every check after the first needs a fresh response
+            response = self.poll(shared=(i == 0))
             for acceptor in acceptors:
                 if acceptor.matcher_func(response):
                     current_state = acceptor.state
@@ -67,27 +175,25 @@ class Waiter(Action):
 
         return True
 
-    def run(self):
-        last = datetime.datetime.now()
-        for i in range(self.waiter.config.max_attempts):
-            if self.ready():
-                break
-
-            now = datetime.datetime.now()
-            if (now - last).total_seconds() > 60:
-                attempts_remaining = self.waiter.config.max_attempts - i
-                time_remaining = attempts_remaining * self.waiter.config.delay
-
-                self.plan.ui.echo("Still waiting for {}. {} till timeout occurs.".format(
-                    self.plan.resource,
-                    datetime.timedelta(seconds=time_remaining),
-                ))
-                last = now
+    def notify(self, time_remaining):
+        self.plan.ui.echo("Still waiting for {}. {} till timeout occurs.".format(
+            self.plan.resource,
+            datetime.timedelta(seconds=int(time_remaining)),
+        ))
 
-            time.sleep(self.waiter.config.delay)
-
-        else:
-            raise errors.Error("Operation took too long to complete")
+    def run_async(self):
+        config = self.waiter.config
+        try:
+            yield BackoffPoll(
+                self.ready,
+                config.delay,
+                config.max_attempts,
+                max_delay=self.max_delay,
+                notify=self.notify,
+            )
+        finally:
+            if self.batch:
+                self.batch[0].discard(self.plan.resource_id)
 
 
 class GenericAction(Action):
@@ -245,9 +351,20 @@ class SimplePlan(object):
     def client(self):
         session = self.session
         if not self._client:
-            self._client = session.create_client(self.service_name, self.api_version)
+            self._client = session.get_client(
+                self.service_name,
+                self.api_version,
+                cache=self.runner.run_cache,
+            )
         return self._client
 
+    def get_cache_prefix(self):
+        return (
+            self.session.access_key_id,
+            self.session.region,
+            self.service_name,
+        )
+
 
 class SimpleDescribe(SimplePlan):
 
@@ -256,6 +373,16 @@ class SimpleDescribe(SimplePlan):
     describe_filters = None
     describe_notfound_exception = None
 
+    # Some API's are used to look up objects with a filter on a single
+    # distinguishing value (e.g. a security group name) alongside filters
+    # that many resources share (e.g. a VPC id). Set ``coalesce_filter`` to the
+    # name of the distinguishing filter and ``coalesce_expression`` to a
+    # jmespath expression that finds the same value in a described object.
+    # All candidates matching the shared filters are then listed once per run
+    # and each plan picks out its own objects.
+    coalesce_filter = None
+    coalesce_expression = None
+
     signature = (
         Present('name'),
     )
@@ -311,10 +438,15 @@ class SimpleDescribe(SimplePlan):
         logger.debug("Filters are: {}".format(filters))
 
         try:
-            results = self.unwrap(
-                self.get_paginated(self.describe_action, **filters),
-                self.describe_envelope,
-            )
+            if self.describe_filters is not None:
+                results = self.get_cached_objects(filters)
+            elif self.coalesce_filter:
+                results = self.get_coalesced_objects(filters)
+            else:
+                results = self.unwrap(
+                    self.get_paginated(self.describe_action, **filters),
+                    self.describe_envelope,
+                )
         except ClientError as e:
             if e.response['Error']['Code'] == self.describe_notfound_exception:
                 return []
@@ -324,6 +456,55 @@ class SimpleDescribe(SimplePlan):
 
         return results or []
 
+    def get_cached_objects(self, filters):
+        """
+        When ``describe_filters`` is static every plan of this type lists
+        exactly the same objects, so each listing is only fetched once per
+        goal run. Callers get shallow copies so they can safely annotate them.
+        """
+        cache_key = self.get_cache_prefix() + (
+            self.api_version,
+            self.describe_action,
+            json.dumps(filters, sort_keys=True),
+        )
+        objects = self.runner.run_cache.get_or_create(
+            cache_key,
+            lambda: list(self.unwrap(
+                self.get_paginated(self.describe_action, **filters),
+                self.describe_envelope,
+            )),
+        )
+        return [dict(obj) for obj in objects]
+
+    def get_coalesced_objects(self, filters):
+        shared = []
+        values = None
+        for f in filters.get("Filters", []):
+            if f["Name"] == self.coalesce_filter:
+                values = set(f["Values"])
+            else:
+                shared.append(f)
+
+        # Without any shared filters the listing would be everything of this
+        # type in the region
+        if values is None or not shared:
+            return self.unwrap(
+                self.get_paginated(self.describe_action, **filters),
+                self.describe_envelope,
+            )
+
+        shared_filters = dict(filters)
+        shared_filters["Filters"] = shared
+
+        results = []
+        for obj in self.get_cached_objects(shared_filters):
+            found = jmespath.search(self.coalesce_expression, obj)
+            if not isinstance(found, list):
+                found = [found]
+            if values.intersection(found):
+                results.append(obj)
+        return results
+
     def describe_object_matches(self, object):
         """
         Client side filtering of objects. Not all AWS API's support server side
@@ -381,7 +562,7 @@ class SimpleDescribe(SimplePlan):
         return Waiter(self, description, waiter, eventual_consistency_threshold)
 
     def get_actions(self):
-        self.object = self.describe_object()
+        self.object = self.runner.get_remote_object(self)
 
         if not self.object:
             raise errors.NotFound("Object '{}' could not be found, and is not scheduled to be created".format(self.resource))
@@ -457,7 +638,7 @@ class SimpleApply(SimpleDescribe):
                 )
 
     def get_actions(self):
-        self.object = self.describe_object()
+        self.object = self.runner.get_remote_object(self)
 
         for change in self.prepare_to_create():
             yield change
@@ -549,7 +730,7 @@ class SimpleDestroy(SimpleDescribe):
         return True
 
     def get_actions(self):
-        self.object = self.describe_object()
+        self.object = self.runner.get_remote_object(self)
 
         if not self.object:
             logger.debug("Resource '{}' not found - assuming already destroyed".format(self.resource))
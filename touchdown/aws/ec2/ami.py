@@ -38,6 +38,7 @@ def resource_id(prefix='', length=8, chars=string.ascii_lowercase+string.digits)
 class Image(Resource):
 
     resource_name = "image"
+    expected_duration = 900
     immutable_tags = True
 
     name = argument.String(min=3, max=128, field="Name")
@@ -25,6 +25,7 @@ class ImageCopy(Resource):
 
     resource_name = "image_copy"
     immutable_tags = True
+    expected_duration = 600
 
     name = argument.String(min=3, max=128, field="Name")
     description = argument.String(field="Description")
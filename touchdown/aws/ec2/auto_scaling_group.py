@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import random
-import time
 
 from touchdown import ssh
 from touchdown.core import argument, errors, serializers
-from touchdown.core.action import Action
+from touchdown.core.action import PollingAction
 from touchdown.core.plan import Plan, Present
+from touchdown.core.reactor import Poll
 from touchdown.core.resource import Resource
 
 from ..account import BaseAccount
@@ -43,6 +44,7 @@ class AutoScalingGroupTag(Resource):
 class AutoScalingGroup(Resource):
 
     resource_name = "auto_scaling_group"
+    expected_duration = 300
 
     name = argument.String(field="AutoScalingGroupName")
     launch_configuration = argument.Resource(LaunchConfiguration, field="LaunchConfigurationName")
@@ -81,7 +83,7 @@ class AutoScalingGroup(Resource):
     account = argument.Resource(BaseAccount)
 
 
-class WaitForHealthy(Action):
+class WaitForHealthy(PollingAction):
 
     @property
     def description(self):
@@ -89,15 +91,15 @@ class WaitForHealthy(Action):
             self.resource.min_size,
         )
 
-    def run(self):
-        while True:
-            asg = self.plan.object = self.plan.describe_object()
-            if len([i for i in asg['Instances'] if i['LifecycleState'] == 'InService']) >= self.resource.min_size:
-                return True
-            time.sleep(5)
+    def healthy(self):
+        asg = self.plan.object = self.plan.describe_object()
+        return len([i for i in asg['Instances'] if i['LifecycleState'] == 'InService']) >= self.resource.min_size
 
+    def run_async(self):
+        yield Poll(self.healthy, 5)
 
-class ReplaceInstances(Action):
+
+class ReplaceInstances(PollingAction):
 
     scaling_processes = [
         "AlarmNotification",
@@ -130,28 +132,24 @@ class ReplaceInstances(Action):
             ShouldDecrementDesiredCapacity=False,
         )
 
-    def wait_for_healthy_elb(self, elb):
-        self.plan.echo("Waiting for load balancer {} to report healthy".format(elb))
+    def elb_healthy(self, elb):
         obj = self.runner.get_plan(elb)
-        while True:
-            result = obj.client.describe_instance_health(
-                LoadBalancerName=obj.resource_id,
-            )
-            states = result.get("InstanceStates", [])
-            if len(filter(lambda s: s['State'] != 'InService', states)) == 0:
-                return True
+        result = obj.client.describe_instance_health(
+            LoadBalancerName=obj.resource_id,
+        )
+        states = result.get("InstanceStates", [])
+        return len([s for s in states if s['State'] != 'InService']) == 0
 
-            time.sleep(5)
+    def asg_healthy(self):
+        asg = self.plan.describe_object()
+        return self.desired_capacity == len([i for i in asg['Instances'] if i['LifecycleState'] == 'InService'])
 
     def wait_for_healthy_asg(self):
         self.plan.echo("Waiting for scaling group to become healthy")
-        while True:
-            asg = self.plan.describe_object()
-            if self.desired_capacity == len([i for i in asg['Instances'] if i['LifecycleState'] == 'InService']):
-                for elb in self.resource.load_balancers:
-                    self.wait_for_healthy_elb(elb)
-                return True
-            time.sleep(5)
+        yield Poll(self.asg_healthy, 5)
+        for elb in self.resource.load_balancers:
+            self.plan.echo("Waiting for load balancer {} to report healthy".format(elb))
+            yield Poll(functools.partial(self.elb_healthy, elb), 5)
 
     def resume_processes(self):
         self.plan.client.resume_processes(
@@ -159,17 +157,24 @@ class ReplaceInstances(Action):
             ScalingProcesses=self.scaling_processes,
         )
 
-    def run(self):
+    def run_async(self):
         self.plan.echo("Suspend autoscaling activities")
         self.suspend_processes()
         try:
-            self.scale()
+            for poll in self.scale():
+                yield poll
             try:
                 for instance_id in self.instance_ids:
                     self.terminate_instance(instance_id)
-                    self.wait_for_healthy_asg()
-            finally:
-                self.unscale()
+                    for poll in self.wait_for_healthy_asg():
+                        yield poll
+            except BaseException:
+                # We might be being closed, so we can't yield here
+                for poll in self.unscale():
+                    poll.wait()
+                raise
+            for poll in self.unscale():
+                yield poll
         finally:
             self.plan.echo("Resuming autoscaling activities")
             self.resume_processes()
@@ -194,7 +199,7 @@ class GracefulReplacement(ReplaceInstances):
             MaxSize=max,
             DesiredCapacity=self.desired_capacity,
         )
-        self.wait_for_healthy_asg()
+        return self.wait_for_healthy_asg()
 
     def unscale(self):
         self.plan.echo("Restoring scaling group to original capacity")
@@ -204,16 +209,16 @@ class GracefulReplacement(ReplaceInstances):
             MaxSize=self.resource.max_size,
             DesiredCapacity=min(self.resource.max_size, self.desired_capacity),
         )
-        self.wait_for_healthy_asg()
+        return self.wait_for_healthy_asg()
 
 
 class SingletonReplacement(ReplaceInstances):
 
     def scale(self):
-        pass
+        return iter(())
 
     def unscale(self):
-        pass
+        return iter(())
 
 
 class Describe(SimpleDescribe, Plan):
@@ -300,7 +305,7 @@ class Apply(SimpleApply, Describe):
             yield klass(self, instances)
 
 
-class TerminateASGInstances(Action):
+class TerminateASGInstances(PollingAction):
 
     @property
     def description(self):
@@ -310,7 +315,15 @@ class TerminateASGInstances(Action):
         for instance in self.plan.object.get('Instances', []):
             yield instance['InstanceId']
 
-    def run(self):
+    def instances_terminated(self):
+        asg = self.plan.describe_object()
+        return len(asg.get("Instances", [])) == 0
+
+    def activities_stopped(self):
+        activities = self.plan.client.describe_scaling_activities(AutoScalingGroupName=self.resource.name)['Activities']
+        return len(tuple(a for a in activities if a['StatusCode'] == 'InProgress')) == 0
+
+    def run_async(self):
         # Destroy all the instances in the ASG
         self.plan.client.update_auto_scaling_group(
             AutoScalingGroupName=self.resource.name,
@@ -320,18 +333,10 @@ class TerminateASGInstances(Action):
         )
 
         # Wait until all the ASG instances have gone away
-        while True:
-            asg = self.plan.describe_object()
-            if len(asg.get("Instances", [])) == 0:
-                break
-            time.sleep(10)
+        yield Poll(self.instances_terminated, 10)
 
         # Wait until any ASG activies have stopped
-        while True:
-            activities = self.plan.client.describe_scaling_activities(AutoScalingGroupName=self.resource.name)['Activities']
-            if len(tuple(a for a in activities if a['StatusCode'] == 'InProgress')) == 0:
-                break
-            time.sleep(10)
+        yield Poll(self.activities_stopped, 10)
 
 
 class Destroy(SimpleDestroy, Describe):
@@ -351,21 +356,18 @@ class Instance(ssh.Instance):
 
     def get_instances(self, runner):
         plan = runner.get_plan(self.adapts)
-        obj = plan.describe_object()
+        obj = runner.get_remote_object(plan)
         if len(obj.get("Instances", [])) == 0:
             raise errors.Error("No instances currently running in group {}".format(self.adapts))
 
-        asg_inservice = filter(
-            lambda x: x['LifecycleState'] == 'InService',
-            obj.get('Instances', []),
-        )
+        asg_inservice = [i for i in obj.get('Instances', []) if i['LifecycleState'] == 'InService']
 
         if len(asg_inservice) == 0:
             raise errors.Error("None of the instances in {} are in service".format(self.adapts))
 
         # Annoyingly we have to get antother client (different API) to get info
         # on teh EC2 instances in our asg
-        client = plan.session.create_client("ec2")
+        client = plan.session.get_client("ec2")
 
         reservations = client.describe_instances(
             InstanceIds=[i["InstanceId"] for i in asg_inservice],
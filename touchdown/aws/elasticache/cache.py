@@ -24,6 +24,8 @@ from .subnet_group import SubnetGroup
 
 class BaseCacheCluster(Resource):
 
+    expected_duration = 600
+
     instance_class = argument.String(field="CacheNodeType", update=False)
     engine = argument.String(field='Engine', update=False)
     engine_version = argument.String(field='EngineVersion')
@@ -12,11 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
-
-from touchdown.core import argument, errors, serializers
-from touchdown.core.action import Action
+from touchdown.core import argument, serializers
+from touchdown.core.action import PollingAction
 from touchdown.core.plan import Plan, Present
+from touchdown.core.reactor import Poll
 from touchdown.core.resource import Resource
 
 from .. import route53
@@ -186,31 +185,29 @@ class Apply(SimpleApply, Describe):
             yield action
 
 
-class WaitForNetworkInterfaces(Action):
+class WaitForNetworkInterfaces(PollingAction):
 
     description = ["Wait for network interfaces to be released"]
 
-    def run(self):
-        # We have to query ec2 and not elb api, so create a new client
-        client = self.plan.session.create_client("ec2")
-
-        description = "ELB {}".format(self.plan.resource.name)
-        for i in range(120):
-            interfaces = client.describe_network_interfaces(
-                Filters=[
-                    {"Name": "description", "Values": [description]},
-                ]
-            ).get('NetworkInterfaces', [])
-
-            if len(interfaces) == 0:
-                return
-
-            time.sleep(1)
-
-        raise errors.Error(
-            "Load balancer {} still hanging around in Elastic Network Interfaces after deletion for over 2 minutes.".format(
+    def interfaces_released(self):
+        interfaces = self.client.describe_network_interfaces(
+            Filters=[
+                {"Name": "description", "Values": ["ELB {}".format(self.plan.resource.name)]},
+            ]
+        ).get('NetworkInterfaces', [])
+        return len(interfaces) == 0
+
+    def run_async(self):
+        # We have to query ec2 and not elb api, so use an ec2 client
+        self.client = self.plan.session.get_client("ec2")
+
+        yield Poll(
+            self.interfaces_released,
+            1,
+            120,
+            timeout_message="Load balancer {} still hanging around in Elastic Network Interfaces after deletion for over 2 minutes.".format(
                 self.plan.resource_id,
-            )
+            ),
         )
 
 
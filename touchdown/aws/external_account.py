@@ -68,7 +68,7 @@ class Describe(Plan):
     def client(self):
         session = self.runner.get_plan(self.resource.account).session
         if not self._client:
-            self._client = session.create_client("sts")
+            self._client = session.get_client("sts")
         return self._client
 
     # def get_actions(self):
@@ -171,7 +171,7 @@ class Plan(Describe):
     def get_signin_url(self):
         role = self.describe_object()
 
-        sts = self.runner.get_plan(self.resource.account).session.create_client("sts")
+        sts = self.runner.get_plan(self.resource.account).session.get_client("sts")
         creds = sts.assume_role(
             RoleArn=role['Arn'],
             RoleSessionName="touchdown-get-signin-url",
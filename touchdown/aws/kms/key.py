@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from multiprocessing.pool import ThreadPool
+
 from botocore.exceptions import ClientError
 
 from touchdown.core import argument, errors, serializers
@@ -42,6 +44,8 @@ class Describe(SimpleDescribe, Plan):
     describe_filters = {}
     key = 'KeyId'
 
+    describe_concurrency = 8
+
     def create_data_key(self, context=None):
         self.object = self.describe_object()
         response = self.client.generate_data_key(
@@ -61,18 +65,43 @@ class Describe(SimpleDescribe, Plan):
             raise errors.Error("Key decryption failed: {}".format(e))
         return response['Plaintext']
 
-    def describe_object_matches(self, key):
+    def describe_key(self, key_id):
         try:
-            metadata = self.client.describe_key(KeyId=key['KeyId'])
+            return self.client.describe_key(KeyId=key_id)['KeyMetadata']
         except ClientError as e:
             if e.response['Error']['Code'] == 'AccessDeniedException':
-                return False
+                return None
             raise
 
-        if not metadata['KeyMetadata']['Enabled']:
-            return False
+    def build_key_index(self):
+        key_ids = [key['KeyId'] for key in self.get_cached_objects(self.describe_filters)]
+        if not key_ids:
+            return {}
 
-        return metadata['KeyMetadata']['Description'] == self.resource.name
+        pool = ThreadPool(min(self.describe_concurrency, len(key_ids)))
+        try:
+            results = pool.map(self.describe_key, key_ids)
+        finally:
+            pool.close()
+            pool.join()
+
+        return dict((metadata['KeyId'], metadata) for metadata in results if metadata)
+
+    def get_key_index(self):
+        """
+        Returns the ``KeyMetadata`` of every key in the account indexed by
+        ``KeyId``. It is built once per run and shared by every key plan.
+        """
+        return self.runner.run_cache.get_or_create(
+            self.get_cache_prefix() + ("key_index", ),
+            self.build_key_index,
+        )
+
+    def describe_object_matches(self, key):
+        metadata = self.get_key_index().get(key['KeyId'])
+        if not metadata or not metadata['Enabled']:
+            return False
+        return metadata['Description'] == self.resource.name
 
 
 class Apply(SimpleApply, Describe):
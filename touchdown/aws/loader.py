@@ -0,0 +1,97 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+
+import botocore
+from botocore.loaders import Loader, instance_cache
+
+from touchdown.core.utils import write_atomically
+
+logger = logging.getLogger(__name__)
+
+
+def _fingerprint_search_paths(search_paths):
+    """
+    Everything that can change what a model looks like once it is loaded -
+    the botocore release, the Python version (for pickle compatibility) and
+    the contents of any search path that doesn't ship with botocore (such as
+    the overrides in ``touchdown/aws/data``).
+    """
+    digest = hashlib.sha1()
+    digest.update("{} {}".format(botocore.__version__, sys.version_info[:2]).encode("utf-8"))
+    for search_path in search_paths:
+        if search_path == Loader.BUILTIN_DATA_PATH:
+            continue
+        for root, dirs, files in sorted(os.walk(search_path)):
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                digest.update(path.encode("utf-8"))
+                with open(path, "rb") as fp:
+                    digest.update(hashlib.sha1(fp.read()).digest())
+    return digest.hexdigest()
+
+
+class CachingLoader(Loader):
+
+    """
+    A botocore ``Loader`` that keeps pickles of the service models, waiter
+    configs and paginators it has parsed (with any overrides and extras
+    applied) in ``cache_dir``. Parsing the larger JSON models (especially
+    EC2) is a noticeable part of starting a run, and unpickling is much
+    quicker.
+    """
+
+    def __init__(self, cache_dir, *args, **kwargs):
+        super(CachingLoader, self).__init__(*args, **kwargs)
+        self.cache_dir = cache_dir
+        self._fingerprint = None
+
+    def get_cache_path(self, service_name, type_name, api_version):
+        if not self._fingerprint:
+            self._fingerprint = _fingerprint_search_paths(self.search_paths)
+        return os.path.join(
+            self.cache_dir,
+            self._fingerprint,
+            "{}-{}-{}.pickle".format(service_name, api_version or "latest", type_name),
+        )
+
+    def read_cache(self, path):
+        try:
+            with open(path, "rb") as fp:
+                return pickle.load(fp)
+        except (IOError, OSError):
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable model cache {}: {}".format(path, e))
+            return None
+
+    def write_cache(self, path, model):
+        try:
+            write_atomically(path, lambda fp: pickle.dump(model, fp, pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            logger.debug("Unable to write model cache {}: {}".format(path, e))
+
+    @instance_cache
+    def load_service_model(self, service_name, type_name, api_version=None):
+        path = self.get_cache_path(service_name, type_name, api_version)
+        model = self.read_cache(path)
+        if model is None:
+            model = super(CachingLoader, self).load_service_model(service_name, type_name, api_version)
+            self.write_cache(path, model)
+        return model
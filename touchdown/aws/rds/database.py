@@ -27,6 +27,7 @@ from .subnet_group import SubnetGroup
 class Database(Resource):
 
     resource_name = "database"
+    expected_duration = 900
 
     name = argument.String(field="DBInstanceIdentifier")
     db_name = argument.String(field="DBName")
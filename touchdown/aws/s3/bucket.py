@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import json
 import re
+from multiprocessing.pool import ThreadPool
 
 from botocore.exceptions import ClientError
 
-from touchdown.core import argument, serializers
+from touchdown.core import argument, errors, serializers
+from touchdown.core.action import Action
 from touchdown.core.errors import InvalidParameter
 from touchdown.core.plan import Plan
 from touchdown.core.resource import Resource
@@ -236,30 +239,111 @@ class Apply(SimpleApply, Describe):
             yield action
 
 
+class EmptyBucket(Action):
+
+    """
+    Deletes every object in a bucket, including old versions and delete
+    markers, so that the bucket itself can be deleted.
+
+    Pages of objects are deleted by a pool of ``delete_concurrency``
+    threads. Only a few pages are listed ahead of the deletes, so only
+    those are ever held in memory, however big the bucket is.
+    """
+
+    description = ["Delete all objects and object versions"]
+
+    batch_size = 1000
+    progress_interval = 10000
+
+    def __init__(self, plan):
+        super(EmptyBucket, self).__init__(plan)
+        self.deleted = 0
+
+    def get_batches(self):
+        if self.plan.list_versions:
+            paginator = self.plan.client.get_paginator("list_object_versions")
+            for page in paginator.paginate(Bucket=self.resource.name):
+                objects = [
+                    {"Key": o["Key"], "VersionId": o["VersionId"]}
+                    for o in page.get("Versions", []) + page.get("DeleteMarkers", [])
+                ]
+                for i in range(0, len(objects), self.batch_size):
+                    yield objects[i:i + self.batch_size]
+            return
+
+        paginator = self.plan.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.resource.name):
+            objects = [{"Key": o["Key"]} for o in page.get("Contents", [])]
+            for i in range(0, len(objects), self.batch_size):
+                yield objects[i:i + self.batch_size]
+
+    def progress(self, count):
+        before = self.deleted // self.progress_interval
+        self.deleted += count
+        if self.deleted // self.progress_interval != before:
+            self.plan.echo("Deleted {} objects".format(self.deleted))
+
+    def delete(self, objects):
+        response = self.plan.client.delete_objects(
+            Bucket=self.resource.name,
+            Delete={"Objects": objects, "Quiet": True},
+        )
+        failures = response.get("Errors", [])
+        if failures:
+            raise errors.Error("Unable to delete {} objects, including {}: {}".format(
+                len(failures),
+                failures[0]['Key'],
+                failures[0]['Message'],
+            ))
+        return len(objects)
+
+    def run(self):
+        concurrency = self.plan.delete_concurrency
+        batches = self.get_batches()
+
+        pool = ThreadPool(concurrency)
+        try:
+            while True:
+                pending = list(itertools.islice(batches, concurrency * 2))
+                if not pending:
+                    break
+                for count in pool.imap_unordered(self.delete, pending):
+                    self.progress(count)
+        finally:
+            pool.close()
+            pool.join()
+
+
 class Destroy(SimpleDestroy, Describe):
 
     destroy_action = "delete_bucket"
     # waiter = "bucket_not_exists"
 
+    delete_concurrency = 8
+
     def get_destroy_serializer(self):
         return serializers.Dict(
             Bucket=self.resource.name,
         )
 
-    def destroy_object(self):
-        keys = []
-        for page in self.client.get_paginator("list_objects").paginate(Bucket=self.resource.name):
-            keys.extend(o['Key'] for o in page.get("Contents", []))
-        keys.sort()
+    # Whether old versions can be seen. Without s3:ListBucketVersions only
+    # the current objects are deleted.
+    list_versions = True
 
-        for i in range(0, len(keys), 1000):
-            chunk = keys[i:i+1000]
-            yield self.generic_action(
-                "Delete items '{}' through '{}'".format(chunk[0], chunk[-1]),
-                self.client.delete_objects,
-                Bucket=self.resource.name,
-                Delete={"Objects": [{"Key": k} for k in chunk], "Quiet": True},
-            )
+    def has_objects(self):
+        try:
+            page = self.client.list_object_versions(Bucket=self.resource.name, MaxKeys=1)
+        except ClientError as e:
+            if e.response['Error']['Code'] != "AccessDenied":
+                raise
+            self.list_versions = False
+            page = self.client.list_objects_v2(Bucket=self.resource.name, MaxKeys=1)
+            return bool(page.get("Contents"))
+        return bool(page.get("Versions") or page.get("DeleteMarkers"))
+
+    def destroy_object(self):
+        if self.has_objects():
+            yield EmptyBucket(self)
 
         for action in super(Destroy, self).destroy_object():
             yield action
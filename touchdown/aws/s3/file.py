@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 from botocore.client import ClientError
 
 from touchdown.core import argument, serializers
@@ -42,18 +44,80 @@ class Describe(SimpleDescribe, Plan):
 
     resource = File
     service_name = 's3'
-    describe_action = "list_objects"
+    describe_action = "list_objects_v2"
     describe_envelope = "Contents"
     key = 'Name'
 
-    def get_describe_filters(self):
+    def get_directory(self, resource):
+        return (resource.bucket.name, resource.name.rpartition("/")[0])
+
+    def find_files(self):
+        files = {}
+        for resource, deps in self.runner.get_plan_order().items():
+            if isinstance(resource, File):
+                files.setdefault(self.get_directory(resource), set()).add(resource.name)
+        return files
+
+    def get_sibling_keys(self):
+        """
+        The keys of every file in this run that is in the same bucket and
+        directory as this one. Files at the top of a bucket share no useful
+        prefix, so they are looked up on their own.
+        """
+        directory = self.get_directory(self.resource)
+        if not directory[1]:
+            return [self.resource.name]
+        files = self.runner.run_cache.get_or_create(("s3", "file_keys"), self.find_files)
+        return sorted(files.get(directory, set()) | set([self.resource.name]))
+
+    def build_object_index(self, keys):
+        """
+        Lists the objects whose keys fall between the first and last of
+        ``keys`` (with the longest prefix they share), rather than the whole
+        bucket. With a single key this is a point lookup.
+        """
+        prefix = os.path.commonprefix(keys)
+        if len(keys) == 1:
+            pages = [self.client.list_objects_v2(
+                Bucket=self.resource.bucket.name,
+                Prefix=prefix,
+                MaxKeys=1,
+            )]
+        else:
+            filters = {
+                "Bucket": self.resource.bucket.name,
+                "Prefix": prefix,
+            }
+            if len(keys[0]) > len(prefix):
+                filters["StartAfter"] = keys[0][:-1]
+            pages = self.get_paginated(self.describe_action, **filters)
+
+        index = {}
+        for obj in self.unwrap(pages, self.describe_envelope):
+            if obj['Key'] > keys[-1]:
+                break
+            index[obj['Key']] = obj
+        return index
+
+    def get_object_index(self):
+        """
+        Returns the objects that the files in this directory might be, indexed
+        by ``Key``. It is built once per run and shared by every file plan in
+        the directory.
+        """
+        keys = self.get_sibling_keys()
+        return self.runner.run_cache.get_or_create(
+            self.get_cache_prefix() + ("file_index", self.resource.bucket.name, keys[0], keys[-1]),
+            lambda: self.build_object_index(keys),
+        )
+
+    def get_possible_objects(self):
         if not self.runner.get_plan(self.resource.bucket).resource_id:
             # If the bucket doesn't exist yet, the file can't. So bail out.
-            return
+            return []
 
-        return {
-            "Bucket": self.resource.bucket.name,
-        }
+        obj = self.get_object_index().get(self.resource.name)
+        return [dict(obj)] if obj else []
 
     def describe_object_matches(self, obj):
         if obj['Key'] == self.resource.name:
@@ -12,15 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import hashlib
 import mimetypes
 import os
+from multiprocessing.pool import ThreadPool
 
-from touchdown.core import argument
+from touchdown.core import argument, errors
+from touchdown.core.action import Action
+from touchdown.core.errors import InvalidParameter
 from touchdown.core.plan import Plan
 from touchdown.core.resource import Resource
 
-from ..common import SimpleApply, SimpleDescribe
+from ..common import RetryAction, SimpleApply, SimpleDescribe
+from . import hashing
 from .bucket import Bucket
 
 
@@ -37,8 +40,16 @@ class Folder(Resource):
         field="ACL",
     )
 
+    # Files bigger than this are uploaded in parts of this size
+    part_size = argument.Integer(default=8 * 1024 * 1024)
+
     bucket = argument.Resource(Bucket, field="Bucket")
 
+    def clean_part_size(self, value):
+        if value < 5 * 1024 * 1024:
+            raise InvalidParameter("S3 parts must be at least 5MB")
+        return value
+
 
 class Describe(SimpleDescribe, Plan):
 
@@ -74,6 +85,133 @@ class Describe(SimpleDescribe, Plan):
         }
 
 
+class UploadFile(Action):
+
+    """
+    Uploads a local file to the folder. The file isn't opened until the
+    action runs, and it is streamed from disk. Files bigger than
+    ``part_size`` are uploaded in parts, so no more than one part is held
+    in memory at a time.
+    """
+
+    def __init__(self, plan, description, path, **kwargs):
+        super(UploadFile, self).__init__(plan)
+        self._description = description
+        self.path = path
+        self.kwargs = kwargs
+
+    @property
+    def description(self):
+        return [self._description]
+
+    def run(self):
+        if os.path.getsize(self.path) <= self.resource.part_size:
+            with open(self.path, "rb") as fp:
+                self.plan.client.put_object(Body=fp, **self.kwargs)
+            return
+
+        upload_id = self.plan.client.create_multipart_upload(**self.kwargs)['UploadId']
+        try:
+            parts = self.upload_parts(upload_id)
+        except Exception:
+            self.plan.client.abort_multipart_upload(
+                Bucket=self.kwargs['Bucket'],
+                Key=self.kwargs['Key'],
+                UploadId=upload_id,
+            )
+            raise
+
+        self.plan.client.complete_multipart_upload(
+            Bucket=self.kwargs['Bucket'],
+            Key=self.kwargs['Key'],
+            UploadId=upload_id,
+            MultipartUpload={'Parts': parts},
+        )
+
+    def upload_parts(self, upload_id):
+        parts = []
+        with open(self.path, "rb") as fp:
+            for part_number, body in enumerate(iter(lambda: fp.read(self.resource.part_size), b""), 1):
+                response = self.plan.client.upload_part(
+                    Bucket=self.kwargs['Bucket'],
+                    Key=self.kwargs['Key'],
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+        return parts
+
+
+class SyncFolder(Action):
+
+    """
+    Applies every change to a folder as a single action. Uploads are run by
+    a pool of ``transfer_concurrency`` threads (API calls are still subject
+    to the per-service limits), and then objects that have gone are removed
+    with ``delete_objects``, up to 1000 keys per call.
+    """
+
+    delete_batch_size = 1000
+    progress_interval = 100
+
+    def __init__(self, plan, uploads, deletions):
+        super(SyncFolder, self).__init__(plan)
+        self.uploads = uploads
+        self.deletions = deletions
+        self.transferred = 0
+
+    @property
+    def description(self):
+        description = ["Upload {} files and remove {} files".format(len(self.uploads), len(self.deletions))]
+        for upload in self.uploads:
+            description.extend(upload.description)
+        description.extend("Remove {}".format(key) for key in self.deletions)
+        return description
+
+    def progress(self, count):
+        total = len(self.uploads) + len(self.deletions)
+        before = self.transferred // self.progress_interval
+        self.transferred += count
+        if self.transferred == total or self.transferred // self.progress_interval != before:
+            self.plan.echo("Synchronised {} of {} files".format(self.transferred, total))
+
+    def delete(self, keys):
+        response = self.plan.client.delete_objects(
+            Bucket=self.resource.bucket.name,
+            Delete={
+                "Objects": [{"Key": key} for key in keys],
+                "Quiet": True,
+            },
+        )
+        failures = response.get("Errors", [])
+        if failures:
+            raise errors.Error("Unable to remove {} objects, including {}: {}".format(
+                len(failures),
+                failures[0]['Key'],
+                failures[0]['Message'],
+            ))
+        return len(keys)
+
+    def run(self):
+        batches = [
+            self.deletions[i:i + self.delete_batch_size]
+            for i in range(0, len(self.deletions), self.delete_batch_size)
+        ]
+
+        pool = ThreadPool(max(1, min(self.plan.transfer_concurrency, len(self.uploads) + len(batches))))
+        try:
+            for upload in pool.imap_unordered(lambda upload: upload.run(), self.uploads):
+                self.progress(1)
+            # Only remove things once everything that might refer to them
+            # has been replaced
+            for count in pool.imap_unordered(self.delete, batches):
+                self.progress(count)
+        finally:
+            pool.close()
+            pool.join()
+
+
 class Apply(SimpleApply, Describe):
 
     create_action = "put_object"
@@ -81,54 +219,83 @@ class Apply(SimpleApply, Describe):
 
     default_content_type = 'application/octet-stream'
 
-    def update_object(self):
-        remote = {}
-        local = {}
+    hash_cache_path = os.path.join("~", ".touchdown", "hashes.db")
+    hash_concurrency = 8
+    transfer_concurrency = 16
+
+    def get_hash_cache(self):
+        return self.runner.run_cache.get_or_create(
+            ("s3", "hash_cache"),
+            lambda: hashing.HashCache(os.path.expanduser(self.hash_cache_path)),
+        )
 
+    def get_local_contents(self):
         base = self.resource.source
+        paths = {}
         for root, dirs, files in os.walk(base):
             for f in files:
                 path = os.path.join(root, f)
-                with open(path) as fp:
-                    h = hashlib.md5(fp.read())
-                local[os.path.relpath(path, base)] = {
-                    "Md5": h.hexdigest(),
-                }
+                paths[os.path.relpath(path, base)] = path
+
+        hashes = hashing.hash_files(
+            list(paths.values()),
+            part_size=self.resource.part_size,
+            cache=self.get_hash_cache(),
+            concurrency=self.hash_concurrency,
+        )
+
+        local = {}
+        for name, path in paths.items():
+            md5, etag = hashes[path]
+            local[name] = {"Path": path, "Md5": md5, "ETag": etag}
+        return local
+
+    def is_unchanged(self, local, remote):
+        if remote['Md5'] in (local['Md5'], local['ETag']):
+            return True
+
+        # The object was uploaded in parts, but not with our part size. Work
+        # out what its ETag would be with the part sizes it could have used.
+        # These are cached too, so the file is only read again if it changes.
+        md5, sep, parts = remote['Md5'].partition("-")
+        if not sep or not parts.isdigit():
+            return False
+        for part_size in hashing.guess_part_sizes(remote['Size'], int(parts)):
+            if part_size == self.resource.part_size:
+                continue
+            hashes = hashing.hash_files([local['Path']], part_size=part_size, cache=self.get_hash_cache())
+            if hashes[local['Path']][1] == remote['Md5']:
+                return True
+        return False
+
+    def upload_file(self, description, path, local):
+        contenttype = mimetypes.guess_type(path)[0] or self.default_content_type
+        return RetryAction(self, UploadFile(
+            self,
+            "{} {} ({})".format(description, path, contenttype),
+            local['Path'],
+            Key=os.path.join(self.resource.name, path),
+            ACL=self.resource.acl,
+            Bucket=self.resource.bucket.name,
+            CacheControl="max-age=0",
+            ContentType=contenttype,
+        ))
+
+    def update_object(self):
+        remote = {}
+        local = self.get_local_contents()
 
         if self.runner.get_plan(self.resource.bucket).resource_id:
             remote = {k: v for k, v in self.get_folder_contents()}
 
-        for path in local:
-            contenttype = mimetypes.guess_type(path)[0] or self.default_content_type
-
+        uploads = []
+        for path in sorted(local):
             if path not in remote:
-                yield self.generic_action(
-                    "Add {} ({})".format(path, contenttype),
-                    self.client.put_object,
-                    Key=os.path.join(self.resource.name, path),
-                    Body=open(os.path.join(base, path)).read(),
-                    ACL=self.resource.acl,
-                    Bucket=self.resource.bucket.name,
-                    CacheControl="max-age=0",
-                    ContentType=contenttype,
-                )
-            elif local[path]['Md5'] != remote[path]['Md5']:
-                yield self.generic_action(
-                    "Update {} ({})".format(path, contenttype),
-                    self.client.put_object,
-                    Key=os.path.join(self.resource.name, path),
-                    Body=open(os.path.join(base, path)).read(),
-                    ACL=self.resource.acl,
-                    Bucket=self.resource.bucket.name,
-                    CacheControl="max-age=0",
-                    ContentType=contenttype,
-                )
+                uploads.append(self.upload_file("Add", path, local[path]))
+            elif not self.is_unchanged(local[path], remote[path]):
+                uploads.append(self.upload_file("Update", path, local[path]))
 
-        for path in remote:
-            if path not in local:
-                yield self.generic_action(
-                    "Remove {}".format(path),
-                    self.client.delete_object,
-                    Bucket=self.resource.bucket.name,
-                    Key=os.path.join(self.resource.name, path),
-                )
+        deletions = [os.path.join(self.resource.name, path) for path in sorted(remote) if path not in local]
+
+        if uploads or deletions:
+            yield SyncFolder(self, uploads, deletions)
@@ -0,0 +1,186 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Working out whether local files match what is in S3 means knowing their
+MD5's (and, for files uploaded in parts, their ETags). Files are hashed a
+chunk at a time so they are never held in memory, and the results are kept
+in a ``HashCache`` so a file that hasn't been touched since the last run
+isn't read at all.
+"""
+
+import hashlib
+import os
+from multiprocessing.pool import ThreadPool
+
+from touchdown.core import database
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def get_signature(st):
+    """
+    The parts of a ``stat`` result that change when a file is changed. The
+    inode is included so that replacing a file with another one (as most
+    build tools do) is noticed even if it has the same size and mtime.
+    """
+    mtime_ns = getattr(st, "st_mtime_ns", None)
+    if mtime_ns is None:
+        mtime_ns = int(st.st_mtime * 1000000000)
+    return (st.st_size, mtime_ns, st.st_ino)
+
+
+def get_etag(md5, part_digests):
+    """
+    The ETag S3 gives an object. For an object that was uploaded in parts
+    this is the MD5 of the (binary) MD5's of each part followed by the
+    number of parts, otherwise it is just the MD5 of the object.
+    """
+    if len(part_digests) < 2:
+        return md5
+    return "{}-{}".format(hashlib.md5(b"".join(part_digests)).hexdigest(), len(part_digests))
+
+
+def hash_file(path, part_size=None, chunk_size=CHUNK_SIZE):
+    """
+    Returns the MD5 of the file at ``path`` and the ETag it would get if it
+    was uploaded in parts of ``part_size`` bytes. The file is only read once.
+    """
+    digest = hashlib.md5()
+    part_digest = hashlib.md5()
+    part_digests = []
+    remaining = part_size
+
+    with open(path, "rb") as fp:
+        while True:
+            chunk = fp.read(min(chunk_size, remaining) if part_size else chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            if not part_size:
+                continue
+            part_digest.update(chunk)
+            remaining -= len(chunk)
+            if not remaining:
+                part_digests.append(part_digest.digest())
+                part_digest = hashlib.md5()
+                remaining = part_size
+
+    if part_size and remaining != part_size:
+        part_digests.append(part_digest.digest())
+
+    return digest.hexdigest(), get_etag(digest.hexdigest(), part_digests)
+
+
+def guess_part_sizes(size, parts, preferred=()):
+    """
+    S3 doesn't record what part size an object was uploaded with. Returns
+    the part sizes that are likely to have been used to upload ``size``
+    bytes in ``parts`` parts - ``preferred`` sizes first, then the sizes
+    common tools use, then the smallest whole number of megabytes.
+    """
+    def count(part_size):
+        return (size + part_size - 1) // part_size
+
+    mb = 1024 * 1024
+    candidates = list(preferred) + [8 * mb, 16 * mb, 5 * mb, 15 * mb, 64 * mb, 100 * mb]
+    smallest = (size + parts - 1) // parts
+    candidates.append(((smallest + mb - 1) // mb) * mb)
+
+    guesses = []
+    for candidate in candidates:
+        if candidate and count(candidate) == parts and candidate not in guesses:
+            guesses.append(candidate)
+    return guesses
+
+
+class HashCache(object):
+
+    """
+    Remembers the MD5 and ETag of every file that has been hashed with each
+    part size, along with the signature of the file at the time. The cache
+    lives in a sqlite database so it outlives a single run.
+
+    If the database can't be used the files are just hashed again.
+    """
+
+    batch_size = 500
+
+    def __init__(self, path):
+        self.path = path
+        self.db = database.Database(path, schema=[
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "path TEXT, size INTEGER, mtime_ns INTEGER, inode INTEGER, part_size INTEGER, "
+            "md5 TEXT, etag TEXT, PRIMARY KEY (path, part_size))",
+        ])
+
+    def get_many(self, signatures, part_size=None):
+        """
+        Takes a dictionary of ``path -> signature`` and returns a dictionary
+        of ``path -> (md5, etag)`` for every path whose signature hasn't
+        changed since it was hashed with the same ``part_size``.
+        """
+        hashes = {}
+        paths = list(signatures.keys())
+        for i in range(0, len(paths), self.batch_size):
+            batch = paths[i:i + self.batch_size]
+            rows = self.db.execute(
+                "SELECT path, size, mtime_ns, inode, md5, etag FROM hashes WHERE part_size = ? AND path IN ({})".format(
+                    ", ".join("?" * len(batch))
+                ),
+                part_size or 0,
+                *batch
+            )
+            for path, size, mtime_ns, inode, md5, etag in rows:
+                if signatures[path] == (size, mtime_ns, inode):
+                    hashes[path] = (md5, etag)
+        return hashes
+
+    def set_many(self, entries, part_size=None):
+        """ Takes a list of ``(path, signature, (md5, etag))`` tuples """
+        self.db.executemany(
+            "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(path, ) + tuple(signature) + (part_size or 0, ) + tuple(hashes) for path, signature, hashes in entries],
+        )
+
+
+def hash_files(paths, part_size=None, cache=None, concurrency=8):
+    """
+    Returns a dictionary of ``path -> (md5, etag)`` for every path in
+    ``paths``, where ``etag`` is the ETag the file would have if it was
+    uploaded in parts of ``part_size`` bytes.
+
+    Files are looked up in ``cache`` (a ``HashCache``) first. Anything that
+    is missing or has changed is hashed by a pool of ``concurrency``
+    threads - ``hashlib`` releases the GIL while it works, so this can keep
+    several cores and the disk busy at once.
+    """
+    signatures = dict((os.path.abspath(path), get_signature(os.stat(path))) for path in paths)
+
+    hashes = cache.get_many(signatures, part_size) if cache else {}
+    missing = [path for path in signatures if path not in hashes]
+
+    if missing:
+        pool = ThreadPool(max(1, min(concurrency, len(missing))))
+        try:
+            results = pool.map(lambda path: hash_file(path, part_size), missing)
+        finally:
+            pool.close()
+            pool.join()
+
+        hashes.update(zip(missing, results))
+        if cache:
+            cache.set_many([(path, signatures[path], hashes[path]) for path in missing], part_size)
+
+    return dict((path, hashes[os.path.abspath(path)]) for path in paths)
@@ -13,18 +13,110 @@
 # limitations under the License.
 
 import os
+import threading
+import weakref
 
 from botocore import session
+from botocore.config import Config
 from dateutil import parser
 
-session = session.get_session()
+from touchdown.core.throttle import throttles
 
-# Provide our own botocore json to override (and increase) various timeouts
-session.get_component('data_loader')._search_paths[1:1] = [os.path.join(os.path.dirname(__file__), "data")]
+from .loader import CachingLoader
 
-# Force botocore to initialise - this avoids race conditions around
-# get_component
-session.create_client("ec2", "eu-west-1")
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Returns the shared botocore session, setting it up on first use. Goals
+    that never talk to AWS never pay for this.
+    """
+    global _session
+    with _session_lock:
+        if not _session:
+            botocore_session = session.get_session()
+
+            # Keep parsed models under ~/.touchdown, and provide our own
+            # botocore json to override (and increase) various timeouts
+            search_paths = list(botocore_session.get_component('data_loader').search_paths)
+            search_paths[1:1] = [os.path.join(os.path.dirname(__file__), "data")]
+            botocore_session.register_component('data_loader', CachingLoader(
+                os.path.expanduser(os.path.join("~", ".touchdown", "botocore")),
+                extra_search_paths=search_paths,
+                include_default_search_paths=False,
+            ))
+
+            # Force botocore to initialise - this avoids race conditions around
+            # get_component. STS has the smallest service model to load.
+            botocore_session.create_client("sts", "eu-west-1")
+
+            _session = botocore_session
+    return _session
+
+
+THROTTLING_ERRORS = frozenset((
+    "Throttling",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "TooManyRequestsException",
+    "SlowDown",
+))
+
+
+def throttle_client(client, throttle):
+    """
+    Route every API call made by ``client`` through ``throttle``. botocore
+    retries throttled requests itself, so each throttled attempt is reported
+    from its ``needs-retry`` event rather than when the call finally fails.
+    """
+    local = threading.local()
+    make_api_call = client._make_api_call
+
+    def _make_api_call(operation_name, api_params):
+        local.generation = throttle.acquire()
+        try:
+            response = make_api_call(operation_name, api_params)
+        finally:
+            throttle.release()
+        throttle.success()
+        return response
+
+    def _needs_retry(response=None, **kwargs):
+        if not response:
+            return
+        if response[1].get("Error", {}).get("Code") in THROTTLING_ERRORS:
+            throttle.throttled(getattr(local, "generation", throttle.generation))
+
+    client._make_api_call = _make_api_call
+    client.meta.events.register("needs-retry", _needs_retry)
+    return client
+
+
+# API calls with these prefixes never change anything
+READ_ONLY_PREFIXES = ("Describe", "List", "Get", "Head")
+
+# API calls that don't change anything even though their names don't say so,
+# by service
+READ_ONLY_OPERATIONS = {
+    # Using a key doesn't change it, so don't throw away the key index
+    "kms": frozenset((
+        "Encrypt",
+        "Decrypt",
+        "ReEncrypt",
+        "GenerateDataKey",
+        "GenerateDataKeyWithoutPlaintext",
+        "GenerateRandom",
+    )),
+}
+
+
+def is_read_only(service, operation_name):
+    if operation_name.startswith(READ_ONLY_PREFIXES):
+        return True
+    return operation_name in READ_ONLY_OPERATIONS.get(service, ())
 
 
 class Session(object):
@@ -36,15 +128,66 @@ class Session(object):
         self.expiration = expiration
         self.region = region
 
+        self.clients = {}
+        self.clients_lock = threading.Lock()
+
     def create_client(self, service, api_version=None):
-        return session.create_client(
+        client = get_session().create_client(
             service_name=service,
             region_name=self.region,
             api_version=api_version,
             aws_access_key_id=self.access_key_id,
             aws_secret_access_key=self.secret_access_key,
             aws_session_token=self.session_token,
+            config=Config(
+                # Enough connections for every call the throttle will let
+                # through at once
+                max_pool_connections=throttles.get_maximum(service),
+            ),
         )
+        return throttle_client(
+            client,
+            throttles.get(service, self.region, self.access_key_id),
+        )
+
+    def invalidate_caches(self, client, service, caches):
+        """
+        Any call made by ``client`` that might change something makes cached
+        listings for its account, region and service unsafe to use, so they
+        are dropped from every cache in ``caches``.
+        """
+        prefix = (self.access_key_id, self.region, service)
+
+        def _invalidate(model, **kwargs):
+            if is_read_only(service, model.name):
+                return
+            with self.clients_lock:
+                caches_to_invalidate = list(caches)
+            for cache in caches_to_invalidate:
+                cache.invalidate(lambda key: key[:len(prefix)] == prefix)
+
+        client.meta.events.register("before-call.*.*", _invalidate)
+
+    def get_client(self, service, api_version=None, cache=None):
+        """
+        Returns a client that is shared with everything else using this
+        session. botocore clients are thread safe, and creating them is
+        expensive, so prefer this to ``create_client``.
+
+        Listings kept in ``cache`` (a ``MemoryCache``) are invalidated when
+        the client is used to change something.
+        """
+        key = (self.access_key_id, self.region, service, api_version)
+        with self.clients_lock:
+            if key not in self.clients:
+                client = self.create_client(service, api_version)
+                caches = weakref.WeakSet()
+                self.invalidate_caches(client, service, caches)
+                self.clients[key] = (client, caches)
+            client, caches = self.clients[key]
+            if cache is not None:
+                caches.add(cache)
+            return client
 
     def tojson(self):
         return {
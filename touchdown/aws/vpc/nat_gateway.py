@@ -24,6 +24,7 @@ from .subnet import Subnet
 class NatGateway(Resource):
 
     resource_name = "nat_gateway"
+    expected_duration = 120
 
     name = argument.Callable(lambda r: r.subnet.name)
 
@@ -63,6 +63,8 @@ class Describe(SimpleDescribe, Plan):
     service_name = 'ec2'
     describe_action = "describe_route_tables"
     describe_envelope = "RouteTables"
+    coalesce_filter = "tag:Name"
+    coalesce_expression = "Tags[?Key=='Name'].Value"
     key = "RouteTableId"
 
     def get_describe_filters(self):
@@ -73,6 +75,7 @@ class Describe(SimpleDescribe, Plan):
         return {
             "Filters": [
                 {'Name': 'tag:Name', 'Values': [self.resource.name]},
+                {'Name': 'vpc-id', 'Values': [vpc.resource_id]},
             ],
         }
 
@@ -117,6 +117,8 @@ class Describe(SimpleDescribe, Plan):
     service_name = 'ec2'
     describe_action = "describe_security_groups"
     describe_envelope = "SecurityGroups"
+    coalesce_filter = "group-name"
+    coalesce_expression = "GroupName"
     key = 'GroupId'
 
     def get_describe_filters(self):
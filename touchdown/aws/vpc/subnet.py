@@ -48,6 +48,8 @@ class Describe(SimpleDescribe, Plan):
     service_name = 'ec2'
     describe_action = "describe_subnets"
     describe_envelope = "Subnets"
+    coalesce_filter = "cidrBlock"
+    coalesce_expression = "CidrBlock"
     key = 'SubnetId'
 
     def get_describe_filters(self):
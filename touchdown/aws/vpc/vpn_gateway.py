@@ -12,18 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
-
 from touchdown.core import argument, errors, serializers
-from touchdown.core.action import Action
+from touchdown.core.action import PollingAction
 from touchdown.core.plan import Plan
+from touchdown.core.reactor import Poll
 from touchdown.core.resource import Resource
 
 from ..common import SimpleApply, SimpleDescribe, SimpleDestroy, TagsMixin
 from .vpc import VPC
 
 
-class AttachmentStateWaiter(Action):
+class AttachmentStateWaiter(PollingAction):
 
     def __init__(self, plan, target_state, error_states):
         super(AttachmentStateWaiter, self).__init__(plan)
@@ -43,12 +42,13 @@ class AttachmentStateWaiter(Action):
                 return False
         return True
 
-    def run(self):
-        for i in range(60):
-            if self.check():
-                return
-            time.sleep(5)
-        raise errors.Error("Took too long for attachment to enter state {}".format(self.target_state))
+    def run_async(self):
+        yield Poll(
+            self.check,
+            5,
+            60,
+            timeout_message="Took too long for attachment to enter state {}".format(self.target_state),
+        )
 
 
 class VpnGateway(Resource):
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .reactor import wait_all
+
 
 class Action(object):
 
@@ -23,5 +25,22 @@ class Action(object):
     def get_plan(self, resource):
         return self.runner.get_plan(resource)
 
+    def run_async(self):
+        """
+        Like ``run``, but rather than blocking while it waits for something
+        remote to happen an action can yield ``Poll`` objects. The caller
+        must wait for each one to succeed before resuming the iteration.
+        """
+        self.run()
+        return iter(())
+
     def __str__(self):
         return "\n".join(self.description)
+
+
+class PollingAction(Action):
+
+    """ An action that is implemented in terms of ``run_async`` """
+
+    def run(self):
+        wait_all(self.run_async())
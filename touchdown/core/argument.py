@@ -382,6 +382,7 @@ class Resource(Argument):
             resource = cls(self, **arguments)
             self.workspace.add_dependency(resource)
             return resource
+        _.factory_for = cls
         setattr(self.resource_class, 'add_%s' % cls.resource_name, _)
 
         def _(self, **kwargs):
@@ -391,6 +392,7 @@ class Resource(Argument):
             resource = cls(self, **arguments)
             self.workspace.add_dependency(resource)
             return resource
+        _.factory_for = cls
         setattr(self.resource_class, 'get_%s' % cls.resource_name, _)
 
 
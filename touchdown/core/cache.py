@@ -15,6 +15,7 @@
 import json
 import os
 import string
+import threading
 
 from touchdown.core import errors
 
@@ -89,3 +90,69 @@ class JSONFileCache(FileCache):
         except (ValueError,):
             raise
             raise errors.Error("''%s' cannot be deserialised" % contents)
+
+
+class MemoryCache(Cache):
+
+    """
+    A thread-safe cache that only lives as long as the object that owns it
+    (typically a single goal run).
+
+    ``get_or_create`` makes sure that when several threads ask for the same
+    missing key at once only one of them calls ``creator`` - the rest wait
+    for its result.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {}
+        self.pending = {}
+        self.stale = set()
+
+    def __contains__(self, cache_key):
+        with self.lock:
+            return cache_key in self.values
+
+    def __getitem__(self, cache_key):
+        with self.lock:
+            return self.values[cache_key]
+
+    def __setitem__(self, cache_key, value):
+        with self.lock:
+            self.values[cache_key] = value
+
+    def invalidate(self, predicate):
+        """ Forget every key for which ``predicate(key)`` is true """
+        with self.lock:
+            for cache_key in list(self.values.keys()):
+                if predicate(cache_key):
+                    del self.values[cache_key]
+            # Anything being computed right now may already be out of date
+            for cache_key in self.pending.keys():
+                if predicate(cache_key):
+                    self.stale.add(cache_key)
+
+    def get_or_create(self, cache_key, creator):
+        while True:
+            with self.lock:
+                if cache_key in self.values:
+                    return self.values[cache_key]
+                event = self.pending.get(cache_key, None)
+                if not event:
+                    event = self.pending[cache_key] = threading.Event()
+                    break
+            # Another thread is already fetching this value. Wait for it and
+            # then try again - if it failed we will try to create it ourself.
+            event.wait()
+
+        try:
+            value = creator()
+            with self.lock:
+                if cache_key not in self.stale:
+                    self.values[cache_key] = value
+            return value
+        finally:
+            with self.lock:
+                del self.pending[cache_key]
+                self.stale.discard(cache_key)
+            event.set()
@@ -0,0 +1,74 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class Database(object):
+
+    """
+    A sqlite database for the caches Touchdown keeps between runs, shared
+    by every thread. It is created the first time it is used, and
+    ``schema`` is run against it then.
+
+    Callers can always fall back to doing the work again, so if the
+    database can't be used the error is logged and queries return no rows.
+    """
+
+    def __init__(self, path, schema=()):
+        self.path = path
+        self.schema = schema
+        self.lock = threading.Lock()
+        self._db = None
+
+    def connect(self):
+        if not self._db:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            db = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            # Losing the last few writes in a crash is fine, waiting for the
+            # disk after every one isn't
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=OFF")
+            for statement in self.schema:
+                db.execute(statement)
+            db.commit()
+            self._db = db
+        return self._db
+
+    def execute(self, sql, *args):
+        with self.lock:
+            try:
+                db = self.connect()
+                rows = db.execute(sql, args).fetchall()
+                db.commit()
+                return rows
+            except (sqlite3.Error, IOError, OSError) as e:
+                logger.debug("Unable to use {}: {}".format(self.path, e))
+                return []
+
+    def executemany(self, sql, rows):
+        with self.lock:
+            try:
+                db = self.connect()
+                db.executemany(sql, rows)
+                db.commit()
+            except (sqlite3.Error, IOError, OSError) as e:
+                logger.debug("Unable to use {}: {}".format(self.path, e))
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+
 from . import errors
 
 
@@ -24,62 +26,146 @@ class DependencyMap(object):
     If ``tips_first`` is False then the most dependended upon nodes will be
     visited first. This is the default, and is used when creating and apply
     changes - a VPC needs to exist before you can create a subnet in it.
+
+    Internally each node tracks how many of the nodes it waits on are still
+    incomplete, and the reverse edges are kept so that completing a node only
+    has to touch the nodes that are waiting on it.
+
+    Each node is also given a ``priority`` - the expected duration of the
+    longest chain of work that cannot start until it has completed (including
+    itself). Executors should start the highest priority ready nodes first so
+    that the critical path is never left waiting.
+
+    If ``nodes`` is set then only those nodes (and the dependencies between
+    them) are included, rather than everything reachable from ``node``.
     """
 
-    def __init__(self, node, tips_first=False):
+    def __init__(self, node, tips_first=False, nodes=None):
         self.node = node
         self.tips_first = tips_first
+        self.nodes = nodes
+
+        # node -> the set of nodes it must wait for
         self.map = {}
+        # node -> the set of nodes that are waiting for it
+        self.dependents = {}
+        # node -> number of nodes it is still waiting for
+        self.waiting = {}
+        # Incomplete nodes that have nothing left to wait for
+        self.ready = set()
+        # node -> expected duration of the longest path through its dependents
+        self.priority = {}
+
         self._prepare()
 
     def _add_dependency(self, node, dep):
         if self.tips_first:
-            self.map.setdefault(dep, set()).add(node)
-        else:
-            self.map.setdefault(node, set()).add(dep)
+            node, dep = dep, node
+        if dep not in self.map[node]:
+            self.map[node].add(dep)
+            self.dependents[dep].add(node)
+
+    def _add_node(self, node):
+        self.map[node] = set()
+        self.dependents[node] = set()
 
     def _prepare(self):
-        queue = [self.node]
-        visiting = set()
-        visited = set()
+        roots = [self.node] if self.nodes is None else self.nodes
+        for node in roots:
+            self._add_node(node)
+        queue = collections.deque(roots)
 
         while queue:
-            node = queue.pop(0)
-            visiting.add(node)
-
-            self.map.setdefault(node, set())
-
+            node = queue.popleft()
             for dep in node.dependencies:
-                if dep in visiting:
-                    raise errors.CycleError(
-                        'Circular reference between %s and %s' % (node, dep)
-                    )
-                self._add_dependency(node, dep)
-                if dep not in visited and dep not in queue:
+                if self.nodes is not None and dep not in self.nodes:
+                    continue
+                if dep not in self.map:
+                    self._add_node(dep)
                     queue.append(dep)
+                self._add_dependency(node, dep)
+
+        for node, deps in self.map.items():
+            self.waiting[node] = len(deps)
+            if not deps:
+                self.ready.add(node)
 
-            visiting.remove(node)
-            visited.add(node)
+        self._prioritise(self._sort())
+
+    def _sort(self):
+        """ Returns all nodes in the order they can be visited """
+        waiting = dict(self.waiting)
+        queue = collections.deque(self.ready)
+        order = []
+
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for dependent in self.dependents[node]:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    queue.append(dependent)
+
+        if len(order) != len(self.map):
+            stuck = sorted(node for node, count in waiting.items() if count)
+            raise errors.CycleError(
+                'Circular reference between %s' % ', '.join(str(node) for node in stuck)
+            )
+
+        return order
+
+    def _prioritise(self, order):
+        for node in reversed(order):
+            downstream = [self.priority[dependent] for dependent in self.dependents[node]]
+            self.priority[node] = self.get_weight(node) + max([0] + downstream)
+
+    def get_weight(self, node):
+        return getattr(node, "expected_duration", 1)
 
     def items(self):
         return self.map.items()
 
+    def get_closure(self, nodes):
+        """
+        Returns ``nodes`` and every node that has to be visited before them.
+        That is everything they depend on, or with ``tips_first`` everything
+        that depends on them.
+        """
+        closure = set(nodes)
+        queue = collections.deque(closure)
+        while queue:
+            for dep in self.map[queue.popleft()]:
+                if dep not in closure:
+                    closure.add(dep)
+                    queue.append(dep)
+        return closure
+
     def get_ready(self):
         """ Yields resources that are ready to be applied """
-        for node, deps in self.map.items():
-            if not deps:
-                yield node
+        for node in list(self.ready):
+            yield node
 
     def complete(self, node):
-        """ Marks a node as complete - it's dependents may proceed """
-        del self.map[node]
-        for deps in self.map.values():
-            deps.difference_update((node,))
+        """
+        Marks a node as complete - it's dependents may proceed. Returns the
+        nodes that this made ready.
+        """
+        del self.waiting[node]
+        self.ready.discard(node)
+        ready = []
+        for dependent in self.dependents[node]:
+            if dependent not in self.waiting:
+                continue
+            self.waiting[dependent] -= 1
+            if not self.waiting[dependent]:
+                self.ready.add(dependent)
+                ready.append(dependent)
+        return ready
 
     def all(self):
         """ Visits all remaining nodes in order immediately """
-        while self.map:
-            ready = sorted(list(self.get_ready()))
+        while self.waiting:
+            ready = sorted(self.ready)
             if not ready:
                 return
 
@@ -91,4 +177,4 @@ class DependencyMap(object):
         return len(self) == 0
 
     def __len__(self):
-        return len(self.map)
+        return len(self.waiting)
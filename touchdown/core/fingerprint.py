@@ -0,0 +1,109 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A fingerprint summarises how a resource (and everything it depends on) is
+configured, so that it is possible to tell if it has changed between runs
+without talking to any remote API's.
+"""
+
+import binascii
+import hashlib
+import json
+import types
+
+import six
+
+from .resource import Resource
+from .workspace import Workspace
+
+
+def get_path(resource):
+    """ A name for ``resource`` that is stable between runs, e.g. ``vpc 'main'/subnet 'a'`` """
+    parts = []
+    while resource is not None and not isinstance(resource, Workspace):
+        parts.append(str(resource))
+        resource = resource.parent
+    return "/".join(reversed(parts))
+
+
+def _sorted(values):
+    return sorted(values, key=lambda v: json.dumps(v, sort_keys=True))
+
+
+def _describe(value, seen):
+    """
+    Turn ``value`` into something that can be dumped as JSON, in a way that
+    doesn't change between runs. Anything unrecognised falls back to its
+    ``repr``, which at worst means the fingerprint never matches.
+    """
+    if value is None or isinstance(value, (bool, float) + six.integer_types + six.string_types):
+        return value
+    if isinstance(value, six.binary_type):
+        return ["bytes", binascii.hexlify(value).decode("ascii")]
+    if isinstance(value, Resource):
+        # Its settings are covered by the fingerprints of the dependencies
+        return ["resource", get_path(value)]
+    if isinstance(value, type):
+        return ["class", value.__module__, value.__name__]
+
+    if id(value) in seen:
+        return ["cycle"]
+    seen = seen | set([id(value)])
+
+    if isinstance(value, (list, tuple)):
+        return [_describe(v, seen) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return _sorted(_describe(v, seen) for v in value)
+    if isinstance(value, dict):
+        return _sorted([_describe(k, seen), _describe(v, seen)] for k, v in value.items())
+    return _describe_object(value, seen)
+
+
+def _describe_object(value, seen):
+    if isinstance(value, types.CodeType):
+        return [
+            "code",
+            binascii.hexlify(value.co_code).decode("ascii"),
+            _describe(value.co_consts, seen),
+            _describe(value.co_names, seen),
+        ]
+    if isinstance(value, types.FunctionType):
+        cells = [cell.cell_contents for cell in value.__closure__ or ()]
+        return ["function", value.__module__, value.__name__, _describe(value.__code__, seen), _describe(cells, seen)]
+    if isinstance(value, types.MethodType):
+        return ["method", _describe(value.__self__, seen), _describe(value.__func__, seen)]
+    if hasattr(value, "__dict__"):
+        return ["object", _describe(type(value), seen), _describe(vars(value), seen)]
+    return ["repr", repr(value)]
+
+
+class Fingerprints(object):
+
+    """ Works out (and remembers) the fingerprints of resources """
+
+    def __init__(self):
+        self.fingerprints = {}
+
+    def get(self, resource):
+        if resource not in self.fingerprints:
+            digest = hashlib.sha1()
+            digest.update(json.dumps(
+                [_describe(type(resource), set()), _describe(resource._values, set())],
+                sort_keys=True,
+            ).encode("utf-8"))
+            for fingerprint in sorted(self.get(dep) for dep in resource.dependencies):
+                digest.update(fingerprint.encode("utf-8"))
+            self.fingerprints[resource] = digest.hexdigest()
+        return self.fingerprints[resource]
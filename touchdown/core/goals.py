@@ -16,8 +16,8 @@ from __future__ import division
 
 import os
 
-from . import dependencies, errors, map
-from .cache import JSONFileCache
+from . import dependencies, errors, fingerprint, map
+from .cache import JSONFileCache, MemoryCache
 
 
 class GoalFactory(object):
@@ -44,13 +44,19 @@ class Goal(object):
     execute_in_reverse = False
     mutator = False
 
-    def __init__(self, workspace, ui, map=map.ParallelMap, cache=None):
+    def __init__(self, workspace, ui, map=map.ParallelMap, cache=None, state=None):
         self.ui = ui
         self.cache = cache
         if not self.cache:
             self.cache = JSONFileCache(os.path.expanduser('~/.touchdown'))
+        # State that can be shared between plans, but only for this run
+        self.run_cache = MemoryCache()
+        # Remote objects described by previous runs (a snapshot.StateStore)
+        self.state = state
+        self.fingerprints = fingerprint.Fingerprints()
         self.workspace = workspace
         self.resources = {}
+        self.resource_index = None
         self.Map = map
 
     @classmethod
@@ -80,6 +86,34 @@ class Goal(object):
     def get_execution_order(self):
         return dependencies.DependencyMap(self.workspace, tips_first=self.execute_in_reverse)
 
+    def can_use_state(self, plan):
+        """
+        Whether ``plan`` can be given a recent snapshot rather than a fresh
+        description. Goals that change things have to look at the current
+        state of anything they might change.
+        """
+        return not self.mutator or plan.name == "describe"
+
+    def get_remote_object(self, plan):
+        """
+        Returns the remote object that ``plan`` manages. By default this asks
+        the plan to describe it, but a goal can supply a snapshot instead.
+        """
+        if not self.state:
+            return plan.describe_object()
+
+        key = fingerprint.get_path(plan.resource)
+        resource_fingerprint = self.fingerprints.get(plan.resource)
+        if self.can_use_state(plan):
+            obj = self.state.get(key, resource_fingerprint)
+            if obj is not None:
+                return obj
+
+        obj = plan.describe_object()
+        resource_id = obj.get(getattr(plan, "key", None)) if isinstance(obj, dict) else None
+        self.state.set(key, resource_fingerprint, resource_id, obj)
+        return obj
+
     def visit(self, message, dep_map, callable):
         with self.ui.progressbar(max_value=len(dep_map)) as pb:
             for status in self.Map(self.ui, dep_map, callable):
@@ -105,6 +139,32 @@ class Goal(object):
         self.visit("Building plan...", self.get_plan_order(), _)
         return collected
 
+    def get_resource_index(self):
+        """
+        Maps ``(plan name, resource name)`` to a resource. This only looks
+        up plan classes - no plans are created or validated.
+        """
+        if self.resource_index is None:
+            index = {}
+            for resource, deps in self.get_plan_order().items():
+                klass = self.get_plan_class(resource)
+                if klass and hasattr(resource, "name"):
+                    index[(klass.name, resource.name)] = resource
+            self.resource_index = index
+        return self.resource_index
+
+    def collect_one(self, plan_name, name):
+        """
+        Returns the ``plan_name`` plan for the resource called ``name``, or
+        ``None``. Only that resource and the resources it depends on are
+        planned.
+        """
+        resource = self.get_resource_index().get((plan_name, name), None)
+        if not resource:
+            return None
+        self.visit("Building plan...", dependencies.DependencyMap(resource), self.get_plan)
+        return self.get_plan(resource)
+
 
 goals = GoalFactory()
 register = goals.register
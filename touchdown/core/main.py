@@ -15,11 +15,14 @@
 from __future__ import print_function
 
 import argparse
+import functools
 import inspect
 import logging
+import os
 import sys
 
-from touchdown.core import errors, goals, map
+from touchdown.core import errors, goals, map, snapshot
+from touchdown.core.throttle import throttles
 from touchdown.core.workspace import Touchdownfile
 from touchdown.frontends import ConsoleFrontend
 
@@ -44,11 +47,13 @@ class SubCommand(object):
 
     def __call__(self, args):
         try:
-            self.workspace.load()
+            self.workspace.load(cache_graph=args.cache_workspace)
+            throttles.configure(args.workers, dict(args.service_limits))
             g = self.goal(
                 self.workspace,
                 self.console,
-                map.ParallelMap if not args.serial else map.SerialMap
+                functools.partial(map.ParallelMap, workers=args.workers) if not args.serial else map.SerialMap,
+                state=get_state(args),
             )
             self.console.start(self, g)
             args, kwargs = self.get_args_and_kwargs(g.execute, args)
@@ -60,10 +65,70 @@ class SubCommand(object):
             self.console.finish()
 
 
+def get_state(args):
+    """
+    Returns somewhere to remember what was described, but only if something
+    asked to reuse it. Descriptions can contain secrets, so by default they
+    aren't kept at all.
+    """
+    if not args.state_ttl and not getattr(args, "skip_unchanged", 0):
+        return None
+    return snapshot.StateStore(
+        os.path.expanduser(os.path.join("~", ".touchdown", "state.db")),
+        ttl=args.state_ttl,
+        namespace=os.getcwd(),
+    )
+
+
+def positive_integer(value):
+    try:
+        value = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError("{!r} is not an integer".format(value))
+    if value < 1:
+        raise argparse.ArgumentTypeError("{!r} must be at least 1".format(value))
+    return value
+
+
+def service_limit(value):
+    service, sep, limit = value.partition("=")
+    if not sep or not service:
+        raise argparse.ArgumentTypeError("{!r} is not in the form SERVICE=N".format(value))
+    return service, positive_integer(limit)
+
+
 def configure_parser(parser, workspace, console):
     parser.add_argument("--debug", default=False, action="store_true")
     parser.add_argument("--serial", default=False, action="store_true")
+    parser.add_argument(
+        "--workers",
+        default=map.ParallelMap.workers,
+        type=positive_integer,
+        help="The maximum number of resources to process at once",
+    )
+    parser.add_argument(
+        "--service-concurrency",
+        dest="service_limits",
+        default=[],
+        action="append",
+        type=service_limit,
+        metavar="SERVICE=N",
+        help="The maximum number of concurrent API calls to a service, e.g. ec2=4",
+    )
     parser.add_argument("--unattended", default=False, action="store_true")
+    parser.add_argument(
+        "--cache-workspace",
+        default=False,
+        action="store_true",
+        help="Reuse the resources built by an unchanged Touchdownfile",
+    )
+    parser.add_argument(
+        "--state-ttl",
+        default=0,
+        type=positive_integer,
+        metavar="SECONDS",
+        help="Reuse what was described about a resource in the last SECONDS, unless it is about to be changed",
+    )
 
     sub = parser.add_subparsers()
     for name, goal in goals.registered():
@@ -14,13 +14,16 @@
 
 from __future__ import division
 
+import collections
+import functools
+import heapq
+import itertools
 import logging
 import threading
-import time
-
-from six.moves import queue
+import types
 
 from . import errors
+from .reactor import Reactor, wait_all
 
 logger = logging.getLogger(__name__)
 
@@ -36,117 +39,232 @@ class SerialMap(object):
     def __iter__(self):
         plan = list(self.resources.all())
         for current, resource in enumerate(plan):
-            self.callable(resource)
+            result = self.callable(resource)
+            if isinstance(result, types.GeneratorType):
+                wait_all(result)
             yield current
 
 
-class InteruptibleQueue(queue.Queue):
-
-    def _init(self, maxsize):
-        queue.Queue._init(self, maxsize)
-        self.stopped = False
-
-    def stop(self):
-        self.stopped = True
-
-    def __iter__(self):
-        while not self.stopped:
-            try:
-                yield self.get(timeout=1)
-                self.task_done()
-            except queue.Empty:
-                pass
-
-
-class QueueOnce(InteruptibleQueue):
+class ParallelMap(object):
 
-    def _init(self, maxsize):
-        InteruptibleQueue._init(self, maxsize)
-        self._items = set()
+    """
+    Visits resources using a pool of worker threads. Workers and the thread
+    driving the map sleep on condition variables and are woken as soon as
+    there is new work or a resource has completed.
 
-    def _put(self, item):
-        if item not in self._items:
-            InteruptibleQueue._put(self, item)
-            self._items.add(item)
+    Ready resources are handed out highest ``priority`` first, so that the
+    resources on the critical path are started as early as possible.
 
+    If ``callable`` returns a generator it is driven on the worker thread
+    until it yields a ``Poll`` that isn't satisfied yet. The resource is then
+    parked on a ``Reactor`` and the worker is free to pick up other work. Once
+    the poll succeeds the resource goes back on the ready queue and the next
+    free worker resumes the generator. If the poll fails the error is thrown
+    into the generator by the next free worker instead, so that the action
+    can clean up after itself.
 
-class ParallelMap(object):
+    The timed waits on the main thread do not add latency - they are there so
+    that it stays responsive to ``KeyboardInterrupt``.
+    """
 
     workers = 8
-    ABORT = object()
+    interrupt_interval = 1
 
-    def __init__(self, ui, resources, callable):
+    def __init__(self, ui, resources, callable, workers=None):
         self.ui = ui
         self.resources = resources
         self.callable = callable
+        if workers:
+            self.workers = workers
+
+        self.lock = threading.Lock()
+        self.work_ready = threading.Condition(self.lock)
+        self.work_done = threading.Condition(self.lock)
 
-        self.ready = QueueOnce()
-        self.done = InteruptibleQueue()
+        self.ready = []
+        self.sequence = itertools.count()
+        self.done = collections.deque()
         self.active = set()
+        self.parked = {}
+        self.failed = {}
+        self.stopped = False
+        self.threads = []
+        self.reactor = Reactor()
 
         self.total = len(self.resources)
         self.current = 0
 
+    def queue_ready(self, resources):
+        # Must be called with self.lock held
+        for resource in resources:
+            priority = self.resources.priority.get(resource, 0)
+            heapq.heappush(self.ready, (-priority, next(self.sequence), resource))
+        if self.ready:
+            self.work_ready.notify_all()
+
+    def park(self, resource, generator, poll):
+        with self.lock:
+            self.active.remove(resource)
+            self.parked[resource] = generator
+        self.reactor.add(
+            poll,
+            functools.partial(self.resume, resource),
+            functools.partial(self.fail, resource),
+        )
+
+    def resume(self, resource):
+        # Called from the reactor thread when a parked resource can continue
+        with self.lock:
+            if self.stopped:
+                return
+            priority = self.resources.priority.get(resource, 0)
+            heapq.heappush(self.ready, (-priority, next(self.sequence), resource))
+            self.work_ready.notify()
+
+    def fail(self, resource, exc):
+        # Called from the reactor thread when polling a parked resource failed
+        with self.lock:
+            if self.stopped:
+                return
+            self.failed[resource] = exc
+            priority = self.resources.priority.get(resource, 0)
+            heapq.heappush(self.ready, (-priority, next(self.sequence), resource))
+            self.work_ready.notify()
+
+    def advance(self, resource, generator, exc=None):
+        """
+        Run ``generator`` until it has to wait for a poll that isn't ready
+        yet. Returns False if the resource was parked, True if it finished.
+
+        If checking a poll fails the error is thrown into the generator. It
+        is raised from here if the generator doesn't handle it.
+        """
+        try:
+            while True:
+                if exc is not None:
+                    poll, exc = generator.throw(exc), None
+                else:
+                    poll = next(generator)
+                try:
+                    ready = poll.check()
+                except Exception as e:
+                    exc = e
+                    continue
+                if not ready:
+                    self.park(resource, generator, poll)
+                    return False
+        except StopIteration:
+            return True
+
+    def get_work(self):
+        with self.lock:
+            while not self.ready and not self.stopped:
+                self.work_ready.wait()
+            if self.stopped:
+                return None
+            resource = heapq.heappop(self.ready)[2]
+            self.active.add(resource)
+            return resource, self.parked.pop(resource, None), self.failed.pop(resource, None)
+
     def worker(self):
-        for resource in self.ready:
+        while True:
+            work = self.get_work()
+            if work is None:
+                return
+
+            resource, result, exc = work
             try:
-                self.active.add(resource)
-                try:
-                    self.callable(resource)
-                finally:
-                    self.active.remove(resource)
-                self.done.put(resource)
+                if result is None:
+                    result = self.callable(resource)
+                if isinstance(result, types.GeneratorType) and not self.advance(resource, result, exc):
+                    continue
             except BaseException as e:
-                self.done.put(e)
+                with self.lock:
+                    self.active.remove(resource)
+                    self.done.append(e)
+                    self.work_done.notify()
                 continue
 
-    def pump_once(self):
-        try:
-            resource = self.done.get(timeout=1)
-        except queue.Empty:
-            return
+            # Inform the dep solver straight away so that any work this
+            # unblocks is queued before this worker picks its next task.
+            with self.lock:
+                self.active.remove(resource)
+                self.queue_ready(self.resources.complete(resource))
+                self.done.append(resource)
+                self.work_done.notify()
 
-        if isinstance(resource, BaseException):
-            raise resource
+    def pump_once(self):
+        with self.lock:
+            if not self.done:
+                self.work_done.wait(self.interrupt_interval)
+            if not self.done:
+                return
 
-        self.current += 1
+            resource = self.done.popleft()
+            if isinstance(resource, BaseException):
+                raise resource
 
-        self.resources.complete(resource)
-        for resource in self.resources.get_ready():
-            self.ready.put(resource)
-        self.done.task_done()
+            self.current += 1
 
     def pump(self):
         # Now we block on the "done" queue. Resources put in the queue are
-        # complete - so we can inform the dep solver and ask for any new work
-        # that this might unblock.
-        while not self.resources.empty():
+        # complete - we just need to report progress and surface errors.
+        while self.current < self.total:
             self.pump_once()
             yield self.current
 
+    def stop(self):
+        with self.lock:
+            self.stopped = True
+            self.work_ready.notify_all()
+        self.reactor.stop()
+        self.close_parked()
+
+    def close_parked(self):
+        # Nothing will resume the resources that are still parked, but give
+        # them the chance to clean up after themselves
+        with self.lock:
+            parked, self.parked = self.parked, {}
+            self.failed = {}
+        for resource, generator in parked.items():
+            try:
+                generator.close()
+            except Exception:
+                logger.exception("Error whilst cancelling {}".format(resource))
+
     def wait_for_remaining(self):
         # No more dependencies to process - we just need to wait for any
         # remaining tasks to complete
-        remaining = None
-        while len(self.active) > 0:
-            if len(self.active) != remaining:
+        while True:
+            with self.lock:
                 remaining = len(self.active)
-                self.current = self.total - remaining
-            time.sleep(1)
+                if not remaining:
+                    break
+                self.work_done.wait(self.interrupt_interval)
+                if len(self.active) == remaining:
+                    continue
+                remaining = len(self.active)
+            self.current = self.total - remaining
             yield self.current
 
+        for thread in self.threads:
+            thread.join()
+
     def __iter__(self):
         caught_error = None
         try:
+            self.reactor.start()
+
             # Start up as many workers as requested.
             for i in range(self.workers):
                 t = threading.Thread(target=self.worker, name="worker{}".format(i))
                 t.start()
+                self.threads.append(t)
 
             # Seed the workers with the initial batch of work
             # These are all the tasks that have no dependencies
-            for resource in self.resources.get_ready():
-                self.ready.put(resource)
+            with self.lock:
+                self.queue_ready(self.resources.get_ready())
 
             for current in self.pump():
                 yield current
@@ -164,9 +282,10 @@ class ParallelMap(object):
             self.ui.echo("Unhandled error. Cleaning up.")
 
         finally:
+            # Stop handing out work, then let anything in flight finish.
+            self.stop()
             for current in self.wait_for_remaining():
                 yield current
-            self.ready.stop()
 
             if caught_error:
                 raise caught_error
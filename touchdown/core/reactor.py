@@ -0,0 +1,201 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import division
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+
+from . import errors
+
+logger = logging.getLogger(__name__)
+
+
+class Poll(object):
+
+    """
+    Something an action needs to wait for. ``check`` is called every
+    ``delay`` seconds until it returns True. If it still isn't True after
+    ``max_attempts`` checks an error is raised.
+
+    Actions yield these from ``run_async`` rather than sleeping. A parallel
+    executor can then hand them to a ``Reactor`` and use the worker thread for
+    something else in the meantime. ``wait`` is for callers that are happy to
+    block.
+    """
+
+    notify_interval = 60
+
+    def __init__(self, check, delay, max_attempts=None, notify=None, timeout_message=None):
+        self.check_func = check
+        self.delay = delay
+        self.max_attempts = max_attempts
+        self.notify = notify
+        self.timeout_message = timeout_message or "Operation took too long to complete"
+        self.attempts = 0
+        self.last_notified = time.time()
+
+    def get_delay(self):
+        return self.delay
+
+    def get_time_remaining(self):
+        if self.max_attempts:
+            return (self.max_attempts - self.attempts) * self.delay
+
+    def exhausted(self):
+        return self.max_attempts and self.attempts >= self.max_attempts
+
+    def check(self):
+        self.attempts += 1
+        if self.check_func():
+            return True
+
+        if self.exhausted():
+            raise errors.Error(self.timeout_message)
+
+        now = time.time()
+        if self.notify and now - self.last_notified > self.notify_interval:
+            self.notify(self.get_time_remaining())
+            self.last_notified = now
+
+        return False
+
+    def wait(self):
+        while not self.check():
+            time.sleep(self.get_delay())
+
+
+def wait_all(generator):
+    """
+    Drives ``generator`` to completion, blocking on each ``Poll`` it yields.
+    If a poll fails the error is thrown into the generator, so that it can
+    handle it or clean up after itself before the error reaches the caller.
+    """
+    exc = None
+    while True:
+        try:
+            if exc is not None:
+                poll, exc = generator.throw(exc), None
+            else:
+                poll = next(generator)
+        except StopIteration:
+            return
+        try:
+            poll.wait()
+        except Exception as e:
+            exc = e
+
+
+class BackoffPoll(Poll):
+
+    """
+    A ``Poll`` that backs off exponentially from ``delay`` to ``max_delay``
+    between checks, with some jitter so that polls started together don't
+    stay in lock step. As the gaps vary ``max_attempts`` is treated as a time
+    limit of ``delay * max_attempts`` seconds, not as a number of checks.
+    """
+
+    def __init__(self, check, delay, max_attempts=None, max_delay=None, **kwargs):
+        super(BackoffPoll, self).__init__(check, delay, max_attempts, **kwargs)
+        self.max_delay = max(delay, max_delay or delay)
+        self.deadline = None
+        if max_attempts:
+            self.deadline = time.time() + delay * max_attempts
+
+    def get_delay(self):
+        delay = min(self.max_delay, self.delay * 2 ** min(max(self.attempts - 1, 0), 16))
+        return random.uniform(delay / 2, delay)
+
+    def get_time_remaining(self):
+        if self.deadline:
+            return max(0, self.deadline - time.time())
+
+    def exhausted(self):
+        return self.deadline and time.time() >= self.deadline
+
+
+class Reactor(object):
+
+    """
+    Checks parked ``Poll`` objects on a timer from a single thread. When a
+    poll succeeds its ``callback`` is called, and if checking it fails its
+    ``errback`` is called with the exception.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.scheduled = []
+        self.sequence = itertools.count()
+        self.stopped = False
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="reactor")
+        self.thread.start()
+
+    def stop(self):
+        """ Stop polling and abandon anything that is still parked """
+        with self.lock:
+            self.stopped = True
+            self.scheduled = []
+            self.changed.notify()
+        if self.thread:
+            self.thread.join()
+
+    def add(self, poll, callback, errback):
+        with self.lock:
+            heapq.heappush(
+                self.scheduled,
+                (time.time() + poll.get_delay(), next(self.sequence), poll, callback, errback),
+            )
+            self.changed.notify()
+
+    def __len__(self):
+        with self.lock:
+            return len(self.scheduled)
+
+    def get_due(self):
+        with self.lock:
+            while not self.stopped:
+                if not self.scheduled:
+                    self.changed.wait()
+                    continue
+                timeout = self.scheduled[0][0] - time.time()
+                if timeout <= 0:
+                    return heapq.heappop(self.scheduled)[2:]
+                self.changed.wait(timeout)
+
+    def run(self):
+        while True:
+            due = self.get_due()
+            if not due:
+                return
+
+            poll, callback, errback = due
+            try:
+                ready = poll.check()
+            except Exception as e:
+                logger.debug("Poll {} failed: {}".format(poll, e))
+                errback(e)
+                continue
+
+            if ready:
+                callback()
+            else:
+                self.add(poll, callback, errback)
@@ -0,0 +1,170 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Resource types are spread over a lot of packages and importing all of them
+is slow. Most of the time a package only matters once a resource it defines
+is used, but some packages also contribute factory methods (``add_subnet``)
+or plans (``cost``) to resource types that live elsewhere. Those are
+recorded in a generated index, so the package can be imported the first
+time one is needed.
+
+After adding or moving resources or plans, regenerate the index with::
+
+    python -m touchdown.core.registry
+"""
+
+from __future__ import print_function
+
+import importlib
+import os
+import sys
+
+PACKAGES = [
+    "touchdown.aws.account",
+    "touchdown.aws.acm",
+    "touchdown.aws.apigateway",
+    "touchdown.aws.cloudfront",
+    "touchdown.aws.cloudtrail",
+    "touchdown.aws.cloudwatch",
+    "touchdown.aws.cost",
+    "touchdown.aws.ec2",
+    "touchdown.aws.elasticache",
+    "touchdown.aws.elastictranscoder",
+    "touchdown.aws.elb",
+    "touchdown.aws.events",
+    "touchdown.aws.external_account",
+    "touchdown.aws.iam",
+    "touchdown.aws.kms",
+    "touchdown.aws.lambda_",
+    "touchdown.aws.logs",
+    "touchdown.aws.password_policy",
+    "touchdown.aws.rds",
+    "touchdown.aws.route53",
+    "touchdown.aws.s3",
+    "touchdown.aws.sns",
+    "touchdown.aws.sqs",
+    "touchdown.aws.vpc",
+    "touchdown.config",
+    "touchdown.gpg",
+    "touchdown.local",
+    "touchdown.notifications",
+    "touchdown.provisioner",
+    "touchdown.ssh",
+]
+
+INDEX_PATH = os.path.join(os.path.dirname(__file__), "registry_index.py")
+
+
+def get_package(module_name):
+    """ The entry in ``PACKAGES`` that has to be imported to get ``module_name`` """
+    parts = module_name.split(".")
+    if parts[:2] == ["touchdown", "aws"]:
+        return ".".join(parts[:3])
+    return ".".join(parts[:2])
+
+
+def get_qualified_name(cls):
+    return ".".join((cls.__module__, cls.__name__))
+
+
+def _import(packages):
+    imported = False
+    for package in sorted(packages):
+        if package not in sys.modules:
+            importlib.import_module(package)
+            imported = True
+    return imported
+
+
+def _lookup(index, cls, name):
+    packages = set()
+    for klass in cls.mro():
+        packages.update(index.get((get_qualified_name(klass), name), ()))
+    return packages
+
+
+def import_factory(cls, name):
+    """
+    Import whatever provides the factory method ``name`` on resource class
+    ``cls``. Returns True if anything new was imported.
+    """
+    from .registry_index import FACTORIES
+    return _import(_lookup(FACTORIES, cls, name))
+
+
+def import_plan(cls, name):
+    """
+    Import whatever provides the plan ``name`` for resource class ``cls``.
+    Returns True if anything new was imported.
+    """
+    from .registry_index import PLANS
+    return _import(_lookup(PLANS, cls, name))
+
+
+def import_all():
+    _import(PACKAGES)
+
+
+def build_index():
+    from .resource import ResourceType
+
+    import_all()
+
+    factories = {}
+    plans = {}
+    for cls in ResourceType.__all_resources__.values():
+        if not cls.__module__.startswith("touchdown.") or cls.__module__.startswith("touchdown.tests."):
+            continue
+        package = get_package(cls.__module__)
+
+        for name, value in vars(cls).items():
+            factory_for = getattr(value, "factory_for", None)
+            if factory_for is None:
+                continue
+            provider = get_package(factory_for.__module__)
+            if provider != package and provider in PACKAGES:
+                factories.setdefault((get_qualified_name(cls), name), set()).add(provider)
+
+        for name, plan in cls.meta.plans.items():
+            provider = get_package(plan.__module__)
+            if provider != package and provider in PACKAGES:
+                plans.setdefault((get_qualified_name(cls), name), set()).add(provider)
+
+    return (
+        {key: tuple(sorted(value)) for key, value in factories.items()},
+        {key: tuple(sorted(value)) for key, value in plans.items()},
+    )
+
+
+def _format(name, index):
+    lines = ["{} = {{".format(name)]
+    for key, value in sorted(index.items()):
+        lines.append("    {!r}: {!r},".format(key, value))
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def write_index(path=INDEX_PATH):
+    factories, plans = build_index()
+    with open(path, "w") as fp:
+        print("# Generated by python -m touchdown.core.registry - do not edit", file=fp)
+        print("", file=fp)
+        print(_format("FACTORIES", factories), file=fp)
+        print("", file=fp)
+        print(_format("PLANS", plans), file=fp)
+
+
+if __name__ == "__main__":
+    write_index()
@@ -0,0 +1,166 @@
+# Generated by python -m touchdown.core.registry - do not edit
+
+FACTORIES = {
+    ('touchdown.aws.account.BaseAccount', 'add_acm_certificate'): ('touchdown.aws.acm',),
+    ('touchdown.aws.account.BaseAccount', 'add_alarm'): ('touchdown.aws.cloudwatch',),
+    ('touchdown.aws.account.BaseAccount', 'add_alias'): ('touchdown.aws.kms',),
+    ('touchdown.aws.account.BaseAccount', 'add_auto_scaling_group'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'add_bucket'): ('touchdown.aws.s3',),
+    ('touchdown.aws.account.BaseAccount', 'add_cache_cluster'): ('touchdown.aws.elasticache',),
+    ('touchdown.aws.account.BaseAccount', 'add_cache_subnet_group'): ('touchdown.aws.elasticache',),
+    ('touchdown.aws.account.BaseAccount', 'add_database'): ('touchdown.aws.rds',),
+    ('touchdown.aws.account.BaseAccount', 'add_db_subnet_group'): ('touchdown.aws.rds',),
+    ('touchdown.aws.account.BaseAccount', 'add_distribution'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.account.BaseAccount', 'add_ec2_instance'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'add_elastic_ip'): ('touchdown.aws.vpc',),
+    ('touchdown.aws.account.BaseAccount', 'add_event_rule'): ('touchdown.aws.events',),
+    ('touchdown.aws.account.BaseAccount', 'add_external_role'): ('touchdown.aws.external_account',),
+    ('touchdown.aws.account.BaseAccount', 'add_hosted_zone'): ('touchdown.aws.route53',),
+    ('touchdown.aws.account.BaseAccount', 'add_image'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'add_image_copy'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'add_instance_profile'): ('touchdown.aws.iam',),
+    ('touchdown.aws.account.BaseAccount', 'add_key'): ('touchdown.aws.kms',),
+    ('touchdown.aws.account.BaseAccount', 'add_keypair'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'add_lambda_function'): ('touchdown.aws.lambda_',),
+    ('touchdown.aws.account.BaseAccount', 'add_launch_configuration'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'add_load_balancer'): ('touchdown.aws.elb',),
+    ('touchdown.aws.account.BaseAccount', 'add_log_group'): ('touchdown.aws.logs',),
+    ('touchdown.aws.account.BaseAccount', 'add_metric'): ('touchdown.aws.cloudwatch',),
+    ('touchdown.aws.account.BaseAccount', 'add_password_policy'): ('touchdown.aws.password_policy',),
+    ('touchdown.aws.account.BaseAccount', 'add_pipeline'): ('touchdown.aws.elastictranscoder',),
+    ('touchdown.aws.account.BaseAccount', 'add_queue'): ('touchdown.aws.sqs',),
+    ('touchdown.aws.account.BaseAccount', 'add_replication_group'): ('touchdown.aws.elasticache',),
+    ('touchdown.aws.account.BaseAccount', 'add_rest_api'): ('touchdown.aws.apigateway',),
+    ('touchdown.aws.account.BaseAccount', 'add_role'): ('touchdown.aws.iam',),
+    ('touchdown.aws.account.BaseAccount', 'add_server_certificate'): ('touchdown.aws.iam',),
+    ('touchdown.aws.account.BaseAccount', 'add_streaming_distribution'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.account.BaseAccount', 'add_topic'): ('touchdown.aws.sns',),
+    ('touchdown.aws.account.BaseAccount', 'add_trail'): ('touchdown.aws.cloudtrail',),
+    ('touchdown.aws.account.BaseAccount', 'add_vpc'): ('touchdown.aws.vpc',),
+    ('touchdown.aws.account.BaseAccount', 'get_acm_certificate'): ('touchdown.aws.acm',),
+    ('touchdown.aws.account.BaseAccount', 'get_alarm'): ('touchdown.aws.cloudwatch',),
+    ('touchdown.aws.account.BaseAccount', 'get_alias'): ('touchdown.aws.kms',),
+    ('touchdown.aws.account.BaseAccount', 'get_auto_scaling_group'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'get_bucket'): ('touchdown.aws.s3',),
+    ('touchdown.aws.account.BaseAccount', 'get_cache_cluster'): ('touchdown.aws.elasticache',),
+    ('touchdown.aws.account.BaseAccount', 'get_cache_subnet_group'): ('touchdown.aws.elasticache',),
+    ('touchdown.aws.account.BaseAccount', 'get_database'): ('touchdown.aws.rds',),
+    ('touchdown.aws.account.BaseAccount', 'get_db_subnet_group'): ('touchdown.aws.rds',),
+    ('touchdown.aws.account.BaseAccount', 'get_distribution'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.account.BaseAccount', 'get_ec2_instance'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'get_elastic_ip'): ('touchdown.aws.vpc',),
+    ('touchdown.aws.account.BaseAccount', 'get_event_rule'): ('touchdown.aws.events',),
+    ('touchdown.aws.account.BaseAccount', 'get_external_role'): ('touchdown.aws.external_account',),
+    ('touchdown.aws.account.BaseAccount', 'get_hosted_zone'): ('touchdown.aws.route53',),
+    ('touchdown.aws.account.BaseAccount', 'get_image'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'get_image_copy'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'get_instance_profile'): ('touchdown.aws.iam',),
+    ('touchdown.aws.account.BaseAccount', 'get_key'): ('touchdown.aws.kms',),
+    ('touchdown.aws.account.BaseAccount', 'get_keypair'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'get_lambda_function'): ('touchdown.aws.lambda_',),
+    ('touchdown.aws.account.BaseAccount', 'get_launch_configuration'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.account.BaseAccount', 'get_load_balancer'): ('touchdown.aws.elb',),
+    ('touchdown.aws.account.BaseAccount', 'get_log_group'): ('touchdown.aws.logs',),
+    ('touchdown.aws.account.BaseAccount', 'get_metric'): ('touchdown.aws.cloudwatch',),
+    ('touchdown.aws.account.BaseAccount', 'get_password_policy'): ('touchdown.aws.password_policy',),
+    ('touchdown.aws.account.BaseAccount', 'get_pipeline'): ('touchdown.aws.elastictranscoder',),
+    ('touchdown.aws.account.BaseAccount', 'get_queue'): ('touchdown.aws.sqs',),
+    ('touchdown.aws.account.BaseAccount', 'get_replication_group'): ('touchdown.aws.elasticache',),
+    ('touchdown.aws.account.BaseAccount', 'get_rest_api'): ('touchdown.aws.apigateway',),
+    ('touchdown.aws.account.BaseAccount', 'get_role'): ('touchdown.aws.iam',),
+    ('touchdown.aws.account.BaseAccount', 'get_server_certificate'): ('touchdown.aws.iam',),
+    ('touchdown.aws.account.BaseAccount', 'get_streaming_distribution'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.account.BaseAccount', 'get_topic'): ('touchdown.aws.sns',),
+    ('touchdown.aws.account.BaseAccount', 'get_trail'): ('touchdown.aws.cloudtrail',),
+    ('touchdown.aws.account.BaseAccount', 'get_vpc'): ('touchdown.aws.vpc',),
+    ('touchdown.aws.acm.certificate.Certificate', 'add_distribution'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.acm.certificate.Certificate', 'add_listener'): ('touchdown.aws.elb',),
+    ('touchdown.aws.acm.certificate.Certificate', 'get_distribution'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.acm.certificate.Certificate', 'get_listener'): ('touchdown.aws.elb',),
+    ('touchdown.aws.elb.load_balancer.LoadBalancer', 'add_elb_origin'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.elb.load_balancer.LoadBalancer', 'get_elb_origin'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.iam.instance_profile.InstanceProfile', 'add_ec2_instance'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.iam.instance_profile.InstanceProfile', 'add_launch_configuration'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.iam.instance_profile.InstanceProfile', 'get_ec2_instance'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.iam.instance_profile.InstanceProfile', 'get_launch_configuration'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.iam.role.Role', 'add_event_rule'): ('touchdown.aws.events',),
+    ('touchdown.aws.iam.role.Role', 'add_lambda_function'): ('touchdown.aws.lambda_',),
+    ('touchdown.aws.iam.role.Role', 'add_pipeline'): ('touchdown.aws.elastictranscoder',),
+    ('touchdown.aws.iam.role.Role', 'add_trail'): ('touchdown.aws.cloudtrail',),
+    ('touchdown.aws.iam.role.Role', 'get_event_rule'): ('touchdown.aws.events',),
+    ('touchdown.aws.iam.role.Role', 'get_lambda_function'): ('touchdown.aws.lambda_',),
+    ('touchdown.aws.iam.role.Role', 'get_pipeline'): ('touchdown.aws.elastictranscoder',),
+    ('touchdown.aws.iam.role.Role', 'get_trail'): ('touchdown.aws.cloudtrail',),
+    ('touchdown.aws.iam.server_certificate.ServerCertificate', 'add_distribution'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.iam.server_certificate.ServerCertificate', 'add_listener'): ('touchdown.aws.elb',),
+    ('touchdown.aws.iam.server_certificate.ServerCertificate', 'get_distribution'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.iam.server_certificate.ServerCertificate', 'get_listener'): ('touchdown.aws.elb',),
+    ('touchdown.aws.kms.key.Key', 'add_database'): ('touchdown.aws.rds',),
+    ('touchdown.aws.kms.key.Key', 'get_database'): ('touchdown.aws.rds',),
+    ('touchdown.aws.lambda_.function.Function', 'add_event_target'): ('touchdown.aws.events',),
+    ('touchdown.aws.lambda_.function.Function', 'get_event_target'): ('touchdown.aws.events',),
+    ('touchdown.aws.logs.group.LogGroup', 'add_trail'): ('touchdown.aws.cloudtrail',),
+    ('touchdown.aws.logs.group.LogGroup', 'get_trail'): ('touchdown.aws.cloudtrail',),
+    ('touchdown.aws.s3.bucket.Bucket', 'add_load_balancer'): ('touchdown.aws.elb',),
+    ('touchdown.aws.s3.bucket.Bucket', 'add_logging_config'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.s3.bucket.Bucket', 'add_pipeline'): ('touchdown.aws.elastictranscoder',),
+    ('touchdown.aws.s3.bucket.Bucket', 'add_s3_origin'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.s3.bucket.Bucket', 'add_streaming_distribution'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.s3.bucket.Bucket', 'add_streaming_logging_config'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.s3.bucket.Bucket', 'add_trail'): ('touchdown.aws.cloudtrail',),
+    ('touchdown.aws.s3.bucket.Bucket', 'get_load_balancer'): ('touchdown.aws.elb',),
+    ('touchdown.aws.s3.bucket.Bucket', 'get_logging_config'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.s3.bucket.Bucket', 'get_pipeline'): ('touchdown.aws.elastictranscoder',),
+    ('touchdown.aws.s3.bucket.Bucket', 'get_s3_origin'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.s3.bucket.Bucket', 'get_streaming_distribution'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.s3.bucket.Bucket', 'get_streaming_logging_config'): ('touchdown.aws.cloudfront',),
+    ('touchdown.aws.s3.bucket.Bucket', 'get_trail'): ('touchdown.aws.cloudtrail',),
+    ('touchdown.aws.s3.file.File', 'add_lambda_function'): ('touchdown.aws.lambda_',),
+    ('touchdown.aws.s3.file.File', 'get_lambda_function'): ('touchdown.aws.lambda_',),
+    ('touchdown.aws.sns.topic.Topic', 'add_pipeline'): ('touchdown.aws.elastictranscoder',),
+    ('touchdown.aws.sns.topic.Topic', 'add_trail'): ('touchdown.aws.cloudtrail',),
+    ('touchdown.aws.sns.topic.Topic', 'get_pipeline'): ('touchdown.aws.elastictranscoder',),
+    ('touchdown.aws.sns.topic.Topic', 'get_trail'): ('touchdown.aws.cloudtrail',),
+    ('touchdown.aws.vpc.subnet.Subnet', 'add_ec2_instance'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.vpc.subnet.Subnet', 'get_ec2_instance'): ('touchdown.aws.ec2',),
+    ('touchdown.aws.vpc.vpc.VPC', 'add_hosted_zone'): ('touchdown.aws.route53',),
+    ('touchdown.aws.vpc.vpc.VPC', 'get_hosted_zone'): ('touchdown.aws.route53',),
+    ('touchdown.config.string.String', 'add_elastic_ip'): ('touchdown.aws.vpc',),
+    ('touchdown.config.string.String', 'get_elastic_ip'): ('touchdown.aws.vpc',),
+    ('touchdown.core.workspace.Workspace', 'add_aws'): ('touchdown.aws.account',),
+    ('touchdown.core.workspace.Workspace', 'add_echo'): ('touchdown.notifications',),
+    ('touchdown.core.workspace.Workspace', 'add_fuselage_bundle'): ('touchdown.provisioner',),
+    ('touchdown.core.workspace.Workspace', 'add_gpg'): ('touchdown.gpg',),
+    ('touchdown.core.workspace.Workspace', 'add_local'): ('touchdown.provisioner',),
+    ('touchdown.core.workspace.Workspace', 'add_local_folder'): ('touchdown.local',),
+    ('touchdown.core.workspace.Workspace', 'add_newrelic_deployment_notification'): ('touchdown.notifications',),
+    ('touchdown.core.workspace.Workspace', 'add_provisioner'): ('touchdown.provisioner',),
+    ('touchdown.core.workspace.Workspace', 'add_script'): ('touchdown.provisioner',),
+    ('touchdown.core.workspace.Workspace', 'add_slack_notification'): ('touchdown.notifications',),
+    ('touchdown.core.workspace.Workspace', 'add_ssh_connection'): ('touchdown.ssh',),
+    ('touchdown.core.workspace.Workspace', 'get_aws'): ('touchdown.aws.account',),
+    ('touchdown.core.workspace.Workspace', 'get_echo'): ('touchdown.notifications',),
+    ('touchdown.core.workspace.Workspace', 'get_fuselage_bundle'): ('touchdown.provisioner',),
+    ('touchdown.core.workspace.Workspace', 'get_gpg'): ('touchdown.gpg',),
+    ('touchdown.core.workspace.Workspace', 'get_local'): ('touchdown.provisioner',),
+    ('touchdown.core.workspace.Workspace', 'get_local_folder'): ('touchdown.local',),
+    ('touchdown.core.workspace.Workspace', 'get_newrelic_deployment_notification'): ('touchdown.notifications',),
+    ('touchdown.core.workspace.Workspace', 'get_provisioner'): ('touchdown.provisioner',),
+    ('touchdown.core.workspace.Workspace', 'get_script'): ('touchdown.provisioner',),
+    ('touchdown.core.workspace.Workspace', 'get_slack_notification'): ('touchdown.notifications',),
+    ('touchdown.core.workspace.Workspace', 'get_ssh_connection'): ('touchdown.ssh',),
+    ('touchdown.interfaces.file.File', 'add_cipher'): ('touchdown.gpg',),
+    ('touchdown.interfaces.file.File', 'add_ini_file'): ('touchdown.config',),
+    ('touchdown.interfaces.file.File', 'get_cipher'): ('touchdown.gpg',),
+    ('touchdown.interfaces.file.File', 'get_ini_file'): ('touchdown.config',),
+    ('touchdown.provisioner.provisioner.Provisioner', 'add_image'): ('touchdown.aws.ec2',),
+    ('touchdown.provisioner.provisioner.Provisioner', 'get_image'): ('touchdown.aws.ec2',),
+}
+
+PLANS = {
+    ('touchdown.aws.ec2.auto_scaling_group.AutoScalingGroup', 'cost'): ('touchdown.aws.cost',),
+    ('touchdown.aws.elasticache.cache.CacheCluster', 'cost'): ('touchdown.aws.cost',),
+    ('touchdown.aws.elasticache.replication_group.ReplicationGroup', 'cost'): ('touchdown.aws.cost',),
+    ('touchdown.aws.elb.load_balancer.LoadBalancer', 'cost'): ('touchdown.aws.cost',),
+    ('touchdown.aws.rds.database.Database', 'cost'): ('touchdown.aws.cost',),
+}
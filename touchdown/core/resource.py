@@ -16,7 +16,7 @@ import logging
 
 import six
 
-from . import argument, errors, serializers
+from . import argument, errors, registry, serializers
 
 logger = logging.getLogger(__name__)
 marker = object()
@@ -78,11 +78,18 @@ class Meta(object):
         self.fields = {}
         self.field_order = []
 
-    def get_plan(self, plan):
+    def find_plan(self, plan):
         for cls in self.mro:
             if hasattr(cls, "meta") and plan in cls.meta.plans:
                 return cls.meta.plans[plan]
 
+    def get_plan(self, plan):
+        found = self.find_plan(plan)
+        # The plan might be provided by a package that isn't imported yet
+        if not found and registry.import_plan(self.mro[0], plan):
+            found = self.find_plan(plan)
+        return found
+
     def iter_fields_in_order(self):
         for name in self.field_order:
             yield self.fields[name]
@@ -155,6 +162,11 @@ class Resource(six.with_metaclass(ResourceType)):
     dot_ignore = False
     default_plan = None
 
+    # A rough guess at how many seconds it takes to converge this type of
+    # resource. The scheduler uses it to start work on the slowest chain of
+    # dependencies first.
+    expected_duration = 1
+
     ensure = argument.List(argument.String())
 
     def __init__(self, parent, **kwargs):
@@ -242,6 +254,13 @@ class Resource(six.with_metaclass(ResourceType)):
         if self.workspace != dependency:
             self.dependencies.add(dependency)
 
+    def __getattr__(self, name):
+        # Factory methods like ``add_subnet`` only exist once the package that
+        # defines the resource has been imported. Import it on first use.
+        if name.startswith(("add_", "get_")) and registry.import_factory(type(self), name):
+            return getattr(self, name)
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
     def __str__(self):
         if hasattr(self, "name"):
             return "{} '{}'".format(self.resource_name, self.name)
@@ -0,0 +1,155 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Snapshots of remote objects (as returned by ``describe_object``) are kept as
+JSON, in saved plans and in the ``StateStore``. botocore returns timestamps
+as ``datetime`` objects and blobs as ``bytes``, so these are tagged on the
+way out and restored on the way in.
+"""
+
+import base64
+import datetime
+import json
+import logging
+import time
+
+import six
+from dateutil import parser
+
+from . import database
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(value):
+    if isinstance(value, datetime.datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, six.binary_type):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    raise TypeError("{!r} is not JSON serializable".format(value))
+
+
+def _decode(value):
+    if "__datetime__" in value:
+        return parser.parse(value["__datetime__"])
+    if "__bytes__" in value:
+        return base64.b64decode(value["__bytes__"])
+    return value
+
+
+def dumps(value):
+    return json.dumps(value, default=_encode, sort_keys=True)
+
+
+def loads(payload):
+    return json.loads(payload, object_hook=_decode)
+
+
+class StateStore(object):
+
+    """
+    Remembers the remote object that was last described for each resource,
+    along with its identifier, the fingerprint of the resource at the time
+    and when it was described. The store lives in a sqlite database, so it
+    outlives a single run.
+
+    Snapshots are only handed back if they are less than ``ttl`` seconds old
+    and the resource hasn't been reconfigured since. With no ``ttl`` the
+    store is still kept up to date but never read. Several projects can
+    share a store by using a different ``namespace``.
+
+    Anything that goes wrong with the database is logged and the store
+    carries on as if it were empty - the objects can always be described
+    again.
+    """
+
+    def __init__(self, path, ttl=0, namespace=""):
+        self.path = path
+        self.ttl = ttl
+        self.namespace = namespace
+        self.db = database.Database(path, schema=[
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "namespace TEXT, key TEXT, fingerprint TEXT, resource_id TEXT, object TEXT, updated REAL, "
+            "PRIMARY KEY (namespace, key))",
+            "CREATE TABLE IF NOT EXISTS converged ("
+            "namespace TEXT, key TEXT, fingerprint TEXT, "
+            "PRIMARY KEY (namespace, key))",
+        ])
+
+    def execute(self, sql, *args):
+        return self.db.execute(sql, *args)
+
+    def get(self, key, fingerprint):
+        """ Returns a fresh snapshot of the object for ``key``, or ``None`` """
+        if not self.ttl:
+            return None
+        rows = self.execute(
+            "SELECT object FROM snapshots WHERE namespace = ? AND key = ? AND fingerprint = ? AND updated > ?",
+            self.namespace,
+            key,
+            fingerprint,
+            time.time() - self.ttl,
+        )
+        if rows:
+            return loads(rows[0][0])
+
+    def set(self, key, fingerprint, resource_id, obj):
+        try:
+            payload = dumps(obj)
+        except (TypeError, ValueError) as e:
+            logger.debug("Not storing snapshot of {}: {}".format(key, e))
+            self.discard(key)
+            return
+        self.execute(
+            "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?)",
+            self.namespace,
+            key,
+            fingerprint,
+            resource_id,
+            payload,
+            time.time(),
+        )
+        # It's not known to be converged until it has been planned against
+        self.execute("DELETE FROM converged WHERE namespace = ? AND key = ?", self.namespace, key)
+
+    def mark_converged(self, key, fingerprint):
+        """
+        Record that when ``key`` was last described it needed no changes to
+        match its configuration.
+        """
+        self.execute("INSERT OR REPLACE INTO converged VALUES (?, ?, ?)", self.namespace, key, fingerprint)
+
+    def get_converged(self, key, fingerprint, max_age):
+        """
+        Returns the snapshot of ``key`` if it was converged at
+        ``fingerprint`` when it was described, less than ``max_age`` seconds
+        ago. Otherwise returns ``None``.
+        """
+        rows = self.execute(
+            "SELECT snapshots.object FROM snapshots JOIN converged USING (namespace, key) "
+            "WHERE namespace = ? AND key = ? AND snapshots.fingerprint = ? AND converged.fingerprint = ? "
+            "AND updated > ?",
+            self.namespace,
+            key,
+            fingerprint,
+            fingerprint,
+            time.time() - max_age,
+        )
+        if rows:
+            return loads(rows[0][0])
+
+    def discard(self, key):
+        self.execute("DELETE FROM snapshots WHERE namespace = ? AND key = ?", self.namespace, key)
+        self.execute("DELETE FROM converged WHERE namespace = ? AND key = ?", self.namespace, key)
@@ -0,0 +1,100 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import division
+
+import threading
+
+
+class Throttle(object):
+
+    """
+    Limits how many callers can be inside a block of code at once. The limit
+    is adjusted with AIMD (additive increase, multiplicative decrease) - every
+    success nudges it up towards ``maximum``, and being throttled by the
+    remote end halves it.
+
+    ``acquire`` returns a generation number. Only the first throttling
+    reported for a generation shrinks the limit, so a burst of requests that
+    were all in flight at the same time only backs off once.
+    """
+
+    def __init__(self, maximum, minimum=1):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.limit = float(maximum)
+        self.active = 0
+        self.generation = 0
+
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+
+    def acquire(self):
+        with self.lock:
+            while self.active >= int(self.limit):
+                self.changed.wait()
+            self.active += 1
+            return self.generation
+
+    def release(self):
+        with self.lock:
+            self.active -= 1
+            self.changed.notify()
+
+    def success(self):
+        with self.lock:
+            previous = int(self.limit)
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            if int(self.limit) > previous:
+                self.changed.notify_all()
+
+    def throttled(self, generation):
+        with self.lock:
+            if generation != self.generation:
+                return
+            self.generation += 1
+            self.limit = max(self.minimum, self.limit / 2)
+
+
+class ThrottleRegistry(object):
+
+    """
+    Hands out a shared ``Throttle`` for each key. ``maximum`` is the ceiling
+    for any key, and ``limits`` can lower it for specific services.
+    """
+
+    def __init__(self, maximum=8):
+        self.maximum = maximum
+        self.limits = {}
+        self.throttles = {}
+        self.lock = threading.Lock()
+
+    def configure(self, maximum, limits=None):
+        with self.lock:
+            self.maximum = maximum
+            self.limits = dict(limits or {})
+            self.throttles = {}
+
+    def get_maximum(self, service):
+        return min(self.maximum, self.limits.get(service, self.maximum))
+
+    def get(self, service, *key):
+        key = (service, ) + key
+        with self.lock:
+            if key not in self.throttles:
+                self.throttles[key] = Throttle(self.get_maximum(service))
+            return self.throttles[key]
+
+
+throttles = ThrottleRegistry()
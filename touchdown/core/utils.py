@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
+
 import six
 
 
@@ -39,3 +42,23 @@ def force_bytes(s):
     elif isinstance(s, six.text_type):
         return s.encode("utf-8")
     raise ValueError("Not a string")
+
+
+def write_atomically(path, writer):
+    """
+    Calls ``writer`` with a file opened for writing in binary mode, then
+    moves what it wrote to ``path``. Readers either see the old file or the
+    whole new one. If anything goes wrong the partial file is removed and
+    the error is raised.
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or None)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            writer(fp)
+        os.rename(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
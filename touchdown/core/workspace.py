@@ -12,7 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import logging
+import marshal
+import os
+import pickle
+import sys
+
 from .resource import Resource
+from .utils import write_atomically
+
+logger = logging.getLogger(__name__)
 
 
 class Workspace(Resource):
@@ -27,16 +37,151 @@ class Workspace(Resource):
     def workspace(self):
         return self
 
-    def load(self):
+    def load(self, cache_graph=False):
         pass
 
 
+class GraphPickler(pickle.Pickler):
+
+    """ Pickles a resource graph, leaving out the workspace at its root """
+
+    def __init__(self, fp, workspace):
+        pickle.Pickler.__init__(self, fp, pickle.HIGHEST_PROTOCOL)
+        self.workspace = workspace
+
+    def persistent_id(self, obj):
+        if obj is self.workspace:
+            return "workspace"
+
+
+class GraphUnpickler(pickle.Unpickler):
+
+    """ Unpickles a resource graph, reattaching it to ``workspace`` """
+
+    def __init__(self, fp, workspace):
+        pickle.Unpickler.__init__(self, fp)
+        self.workspace = workspace
+
+    def persistent_load(self, pid):
+        if pid == "workspace":
+            return self.workspace
+        raise pickle.UnpicklingError("Unknown persistent id {!r}".format(pid))
+
+
+def _stat_modules(names):
+    modules = []
+    for name in sorted(names):
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if not path:
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        modules.append((path, st.st_mtime, st.st_size))
+    return modules
+
+
+def _modules_unchanged(modules):
+    for path, mtime, size in modules:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if (st.st_mtime, st.st_size) != (mtime, size):
+            return False
+    return True
+
+
+class WorkspaceCache(object):
+
+    """
+    Keeps the compiled bytecode of a Touchdownfile, and optionally the
+    resource graph it builds, in ``cache_directory``. Entries are keyed by a
+    hash of the source and the Python version. A graph is only reused if
+    none of the modules that were loaded when it was built have changed.
+    """
+
+    def __init__(self, cache_directory, source):
+        self.cache_directory = cache_directory
+        digest = hashlib.sha1(sys.version.encode("utf-8"))
+        digest.update(source)
+        self.key = digest.hexdigest()
+
+    def get_path(self, extension):
+        return os.path.join(self.cache_directory, self.key + extension)
+
+    def read(self, extension, reader):
+        path = self.get_path(extension)
+        try:
+            with open(path, "rb") as fp:
+                return reader(fp)
+        except (IOError, OSError):
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable workspace cache {}: {}".format(path, e))
+            return None
+
+    def write(self, extension, writer):
+        path = self.get_path(extension)
+        try:
+            write_atomically(path, writer)
+        except Exception as e:
+            # Anything defined in the Touchdownfile itself (a lambda passed
+            # to a serializer, say) can't be pickled.
+            logger.debug("Unable to write workspace cache {}: {}".format(path, e))
+
+    def load_code(self):
+        return self.read(".code", marshal.load)
+
+    def save_code(self, code):
+        self.write(".code", lambda fp: marshal.dump(code, fp))
+
+    def load_graph(self, workspace):
+        def reader(fp):
+            if not _modules_unchanged(pickle.load(fp)):
+                return None
+            return GraphUnpickler(fp, workspace).load()
+
+        graph = self.read(".graph", reader)
+        if graph is None:
+            return False
+        workspace._values, workspace.dependencies = graph
+        return True
+
+    def save_graph(self, workspace, modules):
+        def writer(fp):
+            pickle.dump(_stat_modules(modules), fp, pickle.HIGHEST_PROTOCOL)
+            GraphPickler(fp, workspace).dump((workspace._values, workspace.dependencies))
+
+        self.write(".graph", writer)
+
+
 class Touchdownfile(Workspace):
 
     resource_name = "touchdown_file"
 
-    def load(self):
+    cache_directory = os.path.expanduser(os.path.join("~", ".touchdown", "workspace"))
+
+    def load(self, cache_graph=False):
+        with open("Touchdownfile", "rb") as f:
+            source = f.read()
+
+        cache = WorkspaceCache(self.cache_directory, source)
+        if cache_graph and cache.load_graph(self):
+            return
+
+        code = cache.load_code()
+        if code is None:
+            code = compile(source, "Touchdownfile", "exec")
+            cache.save_code(code)
+
+        before = set(sys.modules)
         g = {"workspace": self}
-        with open("Touchdownfile") as f:
-            code = compile(f.read(), "Touchdownfile", "exec")
-            exec(code, g)
+        exec(code, g)
+
+        if cache_graph:
+            # The graph depends on touchdown itself and on anything the
+            # Touchdownfile imported
+            modules = set(name for name in sys.modules if name not in before or name.startswith("touchdown."))
+            cache.save_graph(self, modules)
@@ -12,9 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
+import copy
+import logging
+
 import six
 
-from touchdown.core import errors
+from touchdown.core import dependencies, errors, fingerprint, snapshot
+
+logger = logging.getLogger(__name__)
+
+
+def resource_target(value):
+    resource_name, sep, name = value.partition(":")
+    if not sep or not resource_name or not name:
+        raise argparse.ArgumentTypeError("{!r} is not in the form TYPE:NAME".format(value))
+    return resource_name, name
 
 
 class ActionGoalMixin(object):
@@ -23,15 +36,199 @@ class ActionGoalMixin(object):
 
     def __init__(self, *args, **kwargs):
         super(ActionGoalMixin, self).__init__(*args, **kwargs)
+        # The resources to execute, or None for all of them
+        self.closure = None
+        # The resources to plan, or None for all of them. Anything that isn't
+        # in ``closure`` is only described.
+        self.plan_closure = None
+        # The resources from a plan saved with --plan-out, by path
+        self.saved_plan = None
+        # Resources that were converged this many seconds ago can be skipped
+        self.skip_unchanged = 0
         self.reset_changes()
 
+    @classmethod
+    def setup_argparse(cls, parser):
+        if cls.execute_in_reverse:
+            closure = "everything that depends on it"
+        else:
+            closure = "everything it depends on"
+        parser.add_argument(
+            "--target",
+            dest="targets",
+            default=[],
+            action="append",
+            type=resource_target,
+            metavar="TYPE:NAME",
+            help="Only {} this resource (e.g. security_group:web) and {}. Can be given multiple times.".format(
+                cls.name,
+                closure,
+            ),
+        )
+        group = parser.add_mutually_exclusive_group()
+        group.add_argument(
+            "--plan-out",
+            metavar="FILE",
+            help="Save the plan to FILE instead of carrying it out",
+        )
+        group.add_argument(
+            "--plan-in",
+            metavar="FILE",
+            help="Carry out the plan saved in FILE. Resources that haven't changed since aren't described again.",
+        )
+
+    def set_targets(self, targets):
+        """
+        Restrict planning and execution to ``targets`` - a list of
+        ``(resource_name, name)`` pairs - and the resources that have to be
+        visited before them.
+        """
+        if not targets:
+            self.closure = self.plan_closure = None
+            return
+
+        dep_map = dependencies.DependencyMap(self.workspace, tips_first=self.execute_in_reverse)
+        index = {}
+        for resource in dep_map.map:
+            index.setdefault((resource.resource_name, getattr(resource, "name", None)), []).append(resource)
+
+        resources = []
+        for resource_name, name in targets:
+            matches = index.get((resource_name, name), [])
+            if not matches:
+                raise errors.Error("No such resource '{}:{}'".format(resource_name, name))
+            if len(matches) > 1:
+                raise errors.Error("Target '{}:{}' is ambiguous - there are {} resources with that name".format(
+                    resource_name,
+                    name,
+                    len(matches),
+                ))
+            resources.append(matches[0])
+
+        self.closure = dep_map.get_closure(resources)
+
+        # Plans look up the things they depend on (e.g. a security group
+        # needs its VPC's id), so those are described too. The workspace
+        # depends on everything, so it doesn't count.
+        upstream = dependencies.DependencyMap(self.workspace, tips_first=False)
+        self.plan_closure = upstream.get_closure(self.closure - set([self.workspace])) | self.closure
+
+    def get_plan(self, resource):
+        if self.closure is None or resource in self.closure:
+            return super(ActionGoalMixin, self).get_plan(resource)
+        klass = resource.meta.get_plan("describe") or resource.meta.get_plan("null")
+        return self.get_service(resource, klass.name)
+
+    def get_plan_order(self):
+        return dependencies.DependencyMap(self.workspace, tips_first=False, nodes=self.plan_closure)
+
+    def get_execution_order(self):
+        return dependencies.DependencyMap(self.workspace, tips_first=self.execute_in_reverse, nodes=self.closure)
+
+    def get_remote_object(self, plan):
+        if self.saved_plan is not None:
+            saved = self.saved_plan.get(fingerprint.get_path(plan.resource), {})
+            if "object" in saved and saved["fingerprint"] == self.fingerprints.get(plan.resource):
+                return copy.deepcopy(saved["object"])
+        return super(ActionGoalMixin, self).get_remote_object(plan)
+
+    def get_descriptions(self, changes):
+        return [[six.text_type(line) for line in change.description] for change in changes]
+
+    def save_plan(self, path):
+        """
+        Write out the actions planned for each resource, along with the remote
+        objects they were planned against and a fingerprint of the resource.
+        """
+        resources = {}
+        duplicates = set()
+        for resource, changes in self.changes.items():
+            key = fingerprint.get_path(resource)
+            if key in resources:
+                duplicates.add(key)
+            entry = resources[key] = {
+                "fingerprint": self.fingerprints.get(resource),
+                "actions": self.get_descriptions(changes),
+            }
+            obj = getattr(self.get_plan(resource), "object", None)
+            if isinstance(obj, dict):
+                entry["object"] = obj
+
+        # Resources that can't be told apart can't be matched up again later
+        for key in duplicates:
+            del resources[key]
+
+        try:
+            with open(path, "w") as fp:
+                fp.write(snapshot.dumps({"goal": self.name, "resources": resources}))
+        except (IOError, OSError) as e:
+            raise errors.Error("Unable to save plan to {}: {}".format(path, e))
+
+    def load_plan(self, path):
+        try:
+            with open(path) as fp:
+                saved = snapshot.loads(fp.read())
+        except (IOError, OSError, ValueError) as e:
+            raise errors.Error("Unable to load plan from {}: {}".format(path, e))
+        if saved.get("goal") != self.name:
+            raise errors.Error("{} is a plan for '{}', not '{}'".format(path, saved.get("goal"), self.name))
+        self.saved_plan = saved["resources"]
+
+    def check_saved_plan(self, plan, path):
+        """ Make sure ``plan`` is what was saved (and so what was reviewed) """
+        planned = {}
+        for resource, changes in plan:
+            planned[fingerprint.get_path(resource)] = self.get_descriptions(changes)
+
+        for key in set(planned) | set(self.saved_plan):
+            if planned.get(key, []) != self.saved_plan.get(key, {}).get("actions", []):
+                raise errors.Error(
+                    "The plan for {} has changed since it was saved to {}. "
+                    "Use --plan-out to save a new plan.".format(key, path)
+                )
+
     def reset_changes(self):
         self.changes = {}
 
+    def can_skip(self, plan):
+        # Only plans that describe a remote object can be skipped - the
+        # snapshot stands in for it so that dependents can still find ids
+        return bool(self.state) and plan.name != "destroy" and hasattr(plan, "describe_object")
+
+    def get_converged_object(self, plan):
+        if self.skip_unchanged <= 0 or not self.can_skip(plan):
+            return None
+        return self.state.get_converged(
+            fingerprint.get_path(plan.resource),
+            self.fingerprints.get(plan.resource),
+            self.skip_unchanged,
+        )
+
+    def get_plan_changes(self, plan):
+        if self.closure is not None and plan.resource not in self.closure:
+            # Only described for the benefit of the targets. If it doesn't
+            # exist then neither can they.
+            try:
+                plan.get_actions()
+            except errors.NotFound:
+                pass
+            return []
+
+        obj = self.get_converged_object(plan)
+        if obj is not None:
+            logger.debug("Skipping {} - it hasn't changed since it was last converged".format(plan.resource))
+            plan.object = obj
+            return []
+
+        changes = list(plan.get_actions())
+        if not changes and self.can_skip(plan):
+            self.state.mark_converged(fingerprint.get_path(plan.resource), self.fingerprints.get(plan.resource))
+        return changes
+
     def get_changes(self, resource):
         if resource not in self.changes:
             try:
-                self.changes[resource] = list(self.get_plan(resource).get_actions())
+                self.changes[resource] = self.get_plan_changes(self.get_plan(resource))
             except Exception as e:
                 six.raise_from(errors.Error("{}: {}".format(resource, e)), e)
         return self.changes[resource]
@@ -49,12 +246,34 @@ class ActionGoalMixin(object):
                 yield resource, changes
 
     def apply_resource(self, resource):
-        for change in self.get_changes(resource):
+        changes = self.get_changes(resource)
+        if changes and self.state:
+            # Whatever was last described is about to be out of date
+            self.state.discard(fingerprint.get_path(resource))
+        for change in changes:
             description = list(change.description)
             self.ui.echo("[{}] {}".format(resource, description[0]))
             for line in description[1:]:
                 self.ui.echo("[{}]     {}".format(resource, line))
-            change.run()
+            # Not a plain loop: errors the executor throws in here have to
+            # reach the action so that it can clean up after itself.
+            generator = change.run_async()
+            exc = None
+            while True:
+                try:
+                    if exc is not None:
+                        poll, exc = generator.throw(exc), None
+                    else:
+                        poll = next(generator)
+                except StopIteration:
+                    break
+                try:
+                    yield poll
+                except GeneratorExit:
+                    generator.close()
+                    raise
+                except Exception as e:
+                    exc = e
 
     def apply_resources(self):
         dep_map = self.get_execution_order()
@@ -65,12 +284,48 @@ class ActionGoalMixin(object):
     def is_stale(self):
         return len(self.changes) != 0
 
-    def execute(self):
+    def pipeline(self):
+        """
+        Plan and apply in a single pass over the dependency graph. Each
+        resource is planned and its changes applied as soon as everything it
+        depends on has been applied, and unrelated branches are planned in
+        parallel. There is no opportunity to review the plan, so this is for
+        unattended runs only.
+        """
+        if self.execute_in_reverse:
+            raise errors.Error("The {} goal cannot be pipelined".format(self.name))
+
+        if getattr(self.ui, "interactive", False):
+            raise errors.Error("Pipelining skips confirming the plan, so it can only be used with --unattended")
+
+        self.reset_changes()
+        self.visit("Planning and applying...", self.get_plan_order(), self.apply_resource)
+
+        if not any(self.changes.values()):
+            raise errors.NothingChanged("Planning stage found no changes were required.")
+
+    def execute(self, targets=None, plan_in=None, plan_out=None):
+        self.set_targets(targets)
+        if plan_in:
+            self.load_plan(plan_in)
+
         plan = list(self.plan())
 
+        if plan_in:
+            self.check_saved_plan(plan, plan_in)
+        if plan_out:
+            self.save_plan(plan_out)
+
         if not len(plan):
             raise errors.NothingChanged("Planning stage found no changes were required.")
 
+        if plan_out:
+            self.ui.echo("Generated a plan to update infrastructure configuration:")
+            self.ui.echo("")
+            self.ui.render_plan(plan)
+            self.ui.echo("Saved plan to {}".format(plan_out))
+            return
+
         if not self.ui.confirm_plan(plan):
             return
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from touchdown.core import errors
 from touchdown.core.goals import Goal, register
 from touchdown.goals.action import ActionGoalMixin
 
@@ -31,5 +32,31 @@ class Apply(ActionGoalMixin, Goal):
 
         return resource.meta.get_plan("apply") or resource.meta.get_plan("describe") or resource.meta.get_plan("null")
 
+    @classmethod
+    def setup_argparse(cls, parser):
+        super(Apply, cls).setup_argparse(parser)
+        parser.add_argument(
+            "--pipeline",
+            default=False,
+            action="store_true",
+            help="Start applying each resource as soon as it and its dependencies are ready (requires --unattended)",
+        )
+        parser.add_argument(
+            "--skip-unchanged",
+            default=0,
+            type=int,
+            metavar="SECONDS",
+            help="Don't check resources that needed no changes in the last SECONDS and haven't been reconfigured since",
+        )
+
+    def execute(self, targets=None, plan_in=None, plan_out=None, pipeline=False, skip_unchanged=0):
+        self.skip_unchanged = skip_unchanged
+        if pipeline:
+            if plan_in or plan_out:
+                raise errors.Error("--pipeline doesn't build a plan up front, so it can't be saved or loaded")
+            self.set_targets(targets)
+            return self.pipeline()
+        return super(Apply, self).execute(targets, plan_in, plan_out)
+
 
 register(Apply)
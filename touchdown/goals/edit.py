@@ -41,9 +41,9 @@ class Edit(Goal):
         )
 
     def execute(self, name):
-        files = self.collect_as_dict("edit")
-        if name not in files:
+        plan = self.collect_one("edit", name)
+        if not plan:
             raise errors.Error("No such file '{}'".format(name))
-        files[name].execute()
+        plan.execute()
 
 register(Edit)
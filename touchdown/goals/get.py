@@ -39,11 +39,11 @@ class Get(Goal):
         )
 
     def execute(self, name):
-        settings = self.collect_as_dict("get")
-        if name not in settings:
+        plan = self.collect_one("get", name)
+        if not plan:
             raise errors.Error("No such setting '{}'".format(name))
-        val, user_set = settings[name].execute()
-        val = settings[name].to_string(val)
+        val, user_set = plan.execute()
+        val = plan.to_string(val)
 
         if user_set:
             print("{} (overriden by user)".format(val))
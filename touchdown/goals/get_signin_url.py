@@ -39,9 +39,9 @@ class GetSigninUrl(Goal):
         )
 
     def execute(self, resource):
-        resources = self.collect_as_dict("get-signin-url")
-        if resource not in resources:
+        plan = self.collect_one("get-signin-url", resource)
+        if not plan:
             raise errors.Error("No such resource '{}'".format(resource))
-        self.ui.echo(resources[resource].get_signin_url())
+        self.ui.echo(plan.get_signin_url())
 
 register(GetSigninUrl)
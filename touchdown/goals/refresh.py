@@ -41,10 +41,10 @@ class Refresh(Goal):
         )
 
     def execute(self, name):
-        settings = self.collect_as_dict("refresh")
-        if name not in settings:
+        plan = self.collect_one("refresh", name)
+        if not plan:
             raise errors.Error("No such setting '{}'".format(name))
-        settings[name].execute()
+        plan.execute()
 
 
 register(Refresh)
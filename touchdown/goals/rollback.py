@@ -51,12 +51,12 @@ class Rollback(Goal):
         pass
 
     def execute(self, target, from_backup):
-        restorable = self.collect_as_dict("rollback")
-        if target not in restorable:
+        plan = self.collect_one("rollback", target)
+        if not plan:
             raise errors.Error("No such resource '{}'".format(target))
-        restorable[target].check(from_backup)
+        plan.check(from_backup)
         self.pre_restore()
-        restorable[target].rollback(from_backup)
+        plan.rollback(from_backup)
         self.post_restore()
 
 register(Rollback)
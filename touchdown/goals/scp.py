@@ -54,10 +54,10 @@ class Scp(Goal):
         else:
             raise errors.Error("Either source or destination must contain a target server that touchdown knows about")
 
-        boxes = self.collect_as_dict("scp")
-        if server not in boxes:
+        plan = self.collect_one("scp", server)
+        if not plan:
             raise errors.Error("No such host '{}'".format(server))
 
-        boxes[server].execute(source, destination)
+        plan.execute(source, destination)
 
 register(Scp)
@@ -47,9 +47,9 @@ class Set(Goal):
         )
 
     def execute(self, name, value):
-        settings = self.collect_as_dict("set")
-        if name not in settings:
+        plan = self.collect_one("set", name)
+        if not plan:
             raise errors.Error("No such setting '{}'".format(name))
-        settings[name].execute(settings[name].from_string(value))
+        plan.execute(plan.from_string(value))
 
 register(Set)
@@ -44,9 +44,9 @@ class Snapshot(Goal):
         )
 
     def execute(self, target, snapshot_name):
-        snapshotable = self.collect_as_dict("snapshot")
-        if target not in snapshotable:
+        plan = self.collect_one("snapshot", target)
+        if not plan:
             raise errors.Error("No such resource '{}'".format(target))
-        snapshotable[target].snapshot(snapshot_name)
+        plan.snapshot(snapshot_name)
 
 register(Snapshot)
@@ -73,9 +73,9 @@ class Tail(Goal):
         )
 
     def execute(self, stream, start="5m ago", end=None, follow=False):
-        tailers = self.collect_as_dict("tail")
-        if stream not in tailers:
+        plan = self.collect_one("tail", stream)
+        if not plan:
             raise errors.Error("No such log stream '{}'".format(stream))
-        tailers[stream].tail(start, end, follow)
+        plan.tail(start, end, follow)
 
 register(Tail)
@@ -20,8 +20,7 @@ import mock
 import six
 import vcr
 from botocore.endpoint import Endpoint as OldEndpoint
-from botocore.vendored.requests.adapters import HTTPAdapter
-from botocore.vendored.requests.exceptions import ConnectionError
+from botocore.stub import Stubber
 
 from touchdown.core import errors, goals, workspace
 from touchdown.core.map import SerialMap
@@ -39,6 +38,13 @@ try:
 except ImportError:
     from urllib3.response import HTTPResponse
 
+try:
+    from botocore.vendored.requests.adapters import HTTPAdapter
+    from botocore.vendored.requests.exceptions import ConnectionError
+except ImportError:
+    from requests.adapters import HTTPAdapter
+    from requests.exceptions import ConnectionError
+
 
 PROJECT_ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
 
@@ -164,6 +170,41 @@ class TestCase(unittest.TestCase):
         self._patcher.stop()
 
 
+class StubbedTestCase(unittest.TestCase):
+
+    """
+    Sets up a workspace with a dummy AWS account and a goal to plan it with.
+    API calls are answered by ``botocore`` stubbers rather than by AWS.
+    """
+
+    goal_name = "apply"
+
+    def setUp(self):
+        self.workspace = workspace.Workspace()
+        self.aws = self.workspace.add_aws(access_key_id='dummy', secret_access_key='dummy', region='eu-west-1')
+        self.goal = goals.create(
+            self.goal_name,
+            self.workspace,
+            ConsoleFrontend(interactive=False),
+            map=SerialMap
+        )
+        self.stubbers = []
+
+    def stub(self, plan):
+        """
+        Returns an active ``Stubber`` for the client ``plan`` uses. Plans
+        share their clients, so they share stubbers too.
+        """
+        client = plan.client
+        for stubber in self.stubbers:
+            if stubber.client is client:
+                return stubber
+        stubber = Stubber(client)
+        stubber.activate()
+        self.stubbers.append(stubber)
+        return stubber
+
+
 class TestBasicUsage(TestCase):
 
     def setUp(self):
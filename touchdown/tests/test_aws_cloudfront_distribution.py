@@ -17,7 +17,7 @@ import unittest
 import mock
 
 from touchdown.aws.cloudfront import Distribution
-from touchdown.aws.session import session
+from touchdown.aws.session import get_session
 from touchdown.core import errors, serializers
 
 from . import aws
@@ -26,7 +26,7 @@ from . import aws
 class TestMetadata(unittest.TestCase):
 
     def test_waiter_waity_enough(self):
-        waiter = session.get_waiter_model("cloudfront")
+        waiter = get_session().get_waiter_model("cloudfront")
         self.assertEqual(waiter.get_waiter("DistributionDeployed").max_attempts, 50)
 
 
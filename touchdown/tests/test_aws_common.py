@@ -20,7 +20,9 @@ from botocore import xform_name
 
 from touchdown.aws import common
 from touchdown.aws.elasticache import CacheCluster
-from touchdown.core import serializers
+from touchdown.core import registry, serializers
+
+from . import aws
 
 
 class TestGenericAction(unittest.TestCase):
@@ -41,6 +43,161 @@ class TestGenericAction(unittest.TestCase):
         )
 
 
+class TestCachedListings(aws.StubbedTestCase):
+
+    def get_stubbed_plan(self, name):
+        plan = self.goal.get_plan(self.aws.add_role(name=name))
+        return plan, self.stub(plan)
+
+    def role(self, name):
+        return {
+            "Path": "/",
+            "RoleName": name,
+            "RoleId": "AROA0000000000000000" + name,
+            "Arn": "arn:aws:iam::123456789012:role/" + name,
+            "CreateDate": "2016-01-01T00:00:00Z",
+        }
+
+    def test_plans_share_client(self):
+        role1, stub1 = self.get_stubbed_plan("role1")
+        role2, stub2 = self.get_stubbed_plan("role2")
+        self.assertTrue(role1.client is role2.client)
+
+    def test_listing_shared_between_plans(self):
+        role1, stub1 = self.get_stubbed_plan("role1")
+        role2, stub2 = self.get_stubbed_plan("role2")
+
+        stub1.add_response("list_roles", {"Roles": [self.role("role1"), self.role("role2")]})
+
+        self.assertEqual(role1.describe_object()["RoleName"], "role1")
+        self.assertEqual(role2.describe_object()["RoleName"], "role2")
+        stub1.assert_no_pending_responses()
+
+    def test_mutation_invalidates_listing(self):
+        role1, stub1 = self.get_stubbed_plan("role1")
+        role2, stub2 = self.get_stubbed_plan("role2")
+
+        stub1.add_response("list_roles", {"Roles": [self.role("role1")]})
+        self.assertEqual(role1.describe_object()["RoleName"], "role1")
+
+        stub2.add_response("create_role", {"Role": self.role("role2")})
+        role2.client.create_role(RoleName="role2", AssumeRolePolicyDocument="{}")
+
+        stub2.add_response("list_roles", {"Roles": [self.role("role1"), self.role("role2")]})
+        self.assertEqual(role2.describe_object()["RoleName"], "role2")
+        stub2.assert_no_pending_responses()
+
+    def test_coalesced_filters(self):
+        vpc = self.aws.add_vpc(name='test-vpc')
+        self.goal.get_plan(vpc).object = {"VpcId": "vpc-1"}
+
+        plans = []
+        for name in ("group1", "group2"):
+            plans.append(self.goal.get_plan(vpc.add_security_group(name=name, description=name)))
+
+        stubber = self.stub(plans[0])
+        stubber.add_response(
+            "describe_security_groups",
+            {"SecurityGroups": [
+                {"GroupId": "sg-1", "GroupName": "group1", "VpcId": "vpc-1"},
+                {"GroupId": "sg-2", "GroupName": "group2", "VpcId": "vpc-1"},
+                {"GroupId": "sg-3", "GroupName": "group3", "VpcId": "vpc-1"},
+            ]},
+            expected_params={"Filters": [{"Name": "vpc-id", "Values": ["vpc-1"]}]},
+        )
+
+        self.assertEqual(plans[0].describe_object()["GroupId"], "sg-1")
+        self.assertEqual(plans[1].describe_object()["GroupId"], "sg-2")
+        stubber.assert_no_pending_responses()
+
+    def test_coalesced_by_name_within_vpc(self):
+        vpc = self.aws.add_vpc(name='test-vpc')
+        self.goal.get_plan(vpc).object = {"VpcId": "vpc-1"}
+
+        plans = [self.goal.get_plan(vpc.add_route_table(name=name)) for name in ("rt1", "rt2")]
+
+        stubber = self.stub(plans[0])
+        stubber.add_response(
+            "describe_route_tables",
+            {"RouteTables": [
+                {"RouteTableId": "rtb-1", "VpcId": "vpc-1", "Tags": [{"Key": "Name", "Value": "rt1"}]},
+                {"RouteTableId": "rtb-2", "VpcId": "vpc-1", "Tags": [{"Key": "Name", "Value": "rt2"}]},
+            ]},
+            expected_params={"Filters": [{"Name": "vpc-id", "Values": ["vpc-1"]}]},
+        )
+
+        self.assertEqual(plans[0].describe_object()["RouteTableId"], "rtb-1")
+        self.assertEqual(plans[1].describe_object()["RouteTableId"], "rtb-2")
+        stubber.assert_no_pending_responses()
+
+    def test_not_coalesced_without_shared_filters(self):
+        plans = [self.goal.get_plan(self.aws.add_vpc(name=name)) for name in ("vpc1", "vpc2")]
+
+        stubber = self.stub(plans[0])
+        for i, name in enumerate(("vpc1", "vpc2"), 1):
+            stubber.add_response(
+                "describe_vpcs",
+                {"Vpcs": [{"VpcId": "vpc-{}".format(i), "Tags": [{"Key": "Name", "Value": name}]}]},
+                expected_params={"Filters": [{"Name": "tag:Name", "Values": [name]}]},
+            )
+
+        self.assertEqual(plans[0].describe_object()["VpcId"], "vpc-1")
+        self.assertEqual(plans[1].describe_object()["VpcId"], "vpc-2")
+        stubber.assert_no_pending_responses()
+
+
+class TestWaiterBatching(aws.StubbedTestCase):
+
+    def setUp(self):
+        super(TestWaiterBatching, self).setUp()
+        self.vpc = self.aws.add_vpc(name='test-vpc', cidr_block='10.0.0.0/16')
+
+    def get_waiter(self, name, subnet_id):
+        subnet = self.vpc.add_subnet(name=name, cidr_block='10.0.{}.0/24'.format(subnet_id[-1]))
+        plan = self.goal.get_plan(subnet)
+        plan.object = {"SubnetId": subnet_id}
+        return plan.get_waiter(["Waiting for resource to exist"], "subnet_available")
+
+    def test_waiters_share_polls(self):
+        waiter1 = self.get_waiter("subnet1", "subnet-1")
+        waiter2 = self.get_waiter("subnet2", "subnet-2")
+
+        stubber = self.stub(waiter1.plan)
+        stubber.add_response(
+            "describe_subnets",
+            {"Subnets": [{"SubnetId": "subnet-1", "State": "pending"}]},
+            expected_params={"SubnetIds": ["subnet-1"]},
+        )
+        stubber.add_response(
+            "describe_subnets",
+            {"Subnets": [
+                {"SubnetId": "subnet-1", "State": "pending"},
+                {"SubnetId": "subnet-2", "State": "available"},
+            ]},
+            expected_params={"SubnetIds": ["subnet-1", "subnet-2"]},
+        )
+
+        self.assertEqual(waiter1.ready(), False)
+        self.assertEqual(waiter2.ready(), True)
+        # The response that included subnet-1 is still fresh
+        self.assertEqual(waiter1.ready(), False)
+        stubber.assert_no_pending_responses()
+
+    def test_bad_id_falls_back(self):
+        waiter = self.get_waiter("subnet1", "subnet-1")
+        self.goal.get_plan(self.vpc).object = {"VpcId": "vpc-1"}
+
+        stubber = self.stub(waiter.plan)
+        stubber.add_client_error("describe_subnets", "InvalidSubnetID.NotFound")
+        stubber.add_response(
+            "describe_subnets",
+            {"Subnets": [{"SubnetId": "subnet-1", "State": "available"}]},
+        )
+
+        self.assertEqual(waiter.ready(), True)
+        stubber.assert_no_pending_responses()
+
+
 class TestSimpleDescribeImplementations(unittest.TestCase):
 
     ignore = (
@@ -49,6 +206,7 @@ class TestSimpleDescribeImplementations(unittest.TestCase):
     )
 
     def test_valid(self):
+        registry.import_all()
         session = botocore.session.get_session()
         for impl in common.SimpleDescribe.__subclasses__():
             if issubclass(impl, self.ignore):
@@ -14,11 +14,11 @@
 
 import unittest
 
-from touchdown.aws.session import session
+from touchdown.aws.session import get_session
 
 
 class TestMetadata(unittest.TestCase):
 
     def test_waiter_waity_enough(self):
-        waiter = session.get_waiter_model("ec2")
+        waiter = get_session().get_waiter_model("ec2")
         self.assertEqual(waiter.get_waiter("ImageAvailable").max_attempts, 160)
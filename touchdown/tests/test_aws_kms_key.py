@@ -0,0 +1,73 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from . import aws
+
+
+class TestKeyIndex(aws.StubbedTestCase):
+
+    def metadata(self, key_id, description, enabled=True):
+        return {"KeyMetadata": {
+            "KeyId": key_id,
+            "Description": description,
+            "Enabled": enabled,
+        }}
+
+    def test_keys_described_once(self):
+        plans = [
+            self.goal.get_plan(self.aws.add_key(name=name))
+            for name in ("key1", "key2")
+        ]
+        for plan in plans:
+            plan.describe_concurrency = 1
+
+        stubber = self.stub(plans[0])
+        stubber.add_response("list_keys", {"Keys": [
+            {"KeyId": "1"},
+            {"KeyId": "2"},
+            {"KeyId": "3"},
+        ]})
+        stubber.add_response("describe_key", self.metadata("1", "key1"))
+        stubber.add_response("describe_key", self.metadata("2", "key2"))
+        stubber.add_response("describe_key", self.metadata("3", "key1", enabled=False))
+
+        self.assertEqual(plans[0].describe_object()["KeyId"], "1")
+        self.assertEqual(plans[1].describe_object()["KeyId"], "2")
+        stubber.assert_no_pending_responses()
+
+    def test_using_key_keeps_index(self):
+        key = self.aws.add_key(name="key1")
+        key_plan = self.goal.get_plan(key)
+        key_plan.describe_concurrency = 1
+        # The alias shares the key's client
+        alias_plan = self.goal.get_plan(self.aws.add_alias(name="alias/key1", key=key))
+        self.assertTrue(alias_plan.client is key_plan.client)
+
+        stubber = self.stub(key_plan)
+        stubber.add_response("list_keys", {"Keys": [{"KeyId": "1"}]})
+        stubber.add_response("describe_key", self.metadata("1", "key1"))
+        self.assertEqual(key_plan.describe_object()["KeyId"], "1")
+
+        stubber.add_response("decrypt", {"KeyId": "1", "Plaintext": b"secret"})
+        self.assertEqual(key_plan.decrypt_data_key(b"blob"), b"secret")
+
+        # Still indexed, so no more API calls
+        self.assertEqual(key_plan.describe_object()["KeyId"], "1")
+        stubber.assert_no_pending_responses()
+
+        stubber.add_response("schedule_key_deletion", {"KeyId": "1"})
+        alias_plan.client.schedule_key_deletion(KeyId="1")
+        stubber.add_response("list_keys", {"Keys": []})
+        self.assertEqual(key_plan.describe_object(), {})
+        stubber.assert_no_pending_responses()
@@ -0,0 +1,72 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from touchdown.aws.loader import CachingLoader
+
+
+class TestCachingLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.write_model({"version": 1})
+
+    def write_model(self, model):
+        path = os.path.join(self.data_dir, "fake", "2016-01-01")
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        with open(os.path.join(path, "service-2.json"), "w") as fp:
+            json.dump(model, fp)
+
+    def get_loader(self):
+        return CachingLoader(
+            self.cache_dir,
+            extra_search_paths=[self.data_dir],
+            include_default_search_paths=False,
+        )
+
+    def test_model_cached(self):
+        self.assertEqual(self.get_loader().load_service_model("fake", "service-2")["version"], 1)
+
+        loader = self.get_loader()
+        loader.load_data = None
+        self.assertEqual(loader.load_service_model("fake", "service-2")["version"], 1)
+
+    def test_override_change_invalidates(self):
+        self.get_loader().load_service_model("fake", "service-2")
+        self.write_model({"version": 2})
+        self.assertEqual(self.get_loader().load_service_model("fake", "service-2")["version"], 2)
+
+    def test_corrupt_cache_ignored(self):
+        loader = self.get_loader()
+        path = loader.get_cache_path("fake", "service-2", None)
+        os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as fp:
+            fp.write(b"not a pickle")
+        self.assertEqual(loader.load_service_model("fake", "service-2")["version"], 1)
+
+    def test_unpicklable_model_not_cached(self):
+        loader = self.get_loader()
+        path = loader.get_cache_path("fake", "service-2", None)
+        loader.write_cache(path, {"version": lambda: None})
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(os.listdir(os.path.dirname(path)), [])
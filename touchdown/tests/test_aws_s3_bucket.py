@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from touchdown.aws.s3 import bucket
+from touchdown.core import errors
 from touchdown.core.errors import InvalidParameter
 
 from . import aws
@@ -39,3 +41,66 @@ class TestBucketValidation(aws.RecordedBotoCoreTest):
 
     def test_upper(self):
         self.assertRaises(InvalidParameter, self.aws.add_bucket, name="FOO")
+
+
+class TestEmptyBucket(aws.StubbedTestCase):
+
+    goal_name = "destroy"
+
+    def setUp(self):
+        super(TestEmptyBucket, self).setUp()
+        self.bucket = self.aws.add_bucket(name="my-bucket")
+        self.plan = self.goal.get_plan(self.bucket)
+        self.plan.delete_concurrency = 1
+        self.stubber = self.stub(self.plan)
+
+    def test_empty_bucket_not_emptied(self):
+        self.stubber.add_response("list_object_versions", {}, {"Bucket": "my-bucket", "MaxKeys": 1})
+        self.assertFalse(self.plan.has_objects())
+
+    def test_versions_and_delete_markers(self):
+        self.stubber.add_response("list_object_versions", {
+            "Versions": [{"Key": "a", "VersionId": "1"}, {"Key": "a", "VersionId": "2"}],
+            "DeleteMarkers": [{"Key": "b", "VersionId": "3"}],
+            "IsTruncated": False,
+        })
+        self.stubber.add_response("delete_objects", {}, {
+            "Bucket": "my-bucket",
+            "Delete": {"Objects": [{"Key": "a", "VersionId": "1"}, {"Key": "a", "VersionId": "2"}], "Quiet": True},
+        })
+        self.stubber.add_response("delete_objects", {}, {
+            "Bucket": "my-bucket",
+            "Delete": {"Objects": [{"Key": "b", "VersionId": "3"}], "Quiet": True},
+        })
+
+        action = bucket.EmptyBucket(self.plan)
+        action.batch_size = 2
+        action.run()
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(action.deleted, 3)
+
+    def test_delete_errors(self):
+        self.stubber.add_response("list_object_versions", {
+            "Versions": [{"Key": "a", "VersionId": "1"}],
+            "IsTruncated": False,
+        })
+        self.stubber.add_response("delete_objects", {"Errors": [
+            {"Key": "a", "VersionId": "1", "Code": "AccessDenied", "Message": "Access Denied"},
+        ]})
+        self.assertRaises(errors.Error, bucket.EmptyBucket(self.plan).run)
+
+    def test_versions_access_denied(self):
+        self.stubber.add_client_error("list_object_versions", "AccessDenied")
+        self.stubber.add_response("list_objects_v2", {"Contents": [{"Key": "a"}]}, {"Bucket": "my-bucket", "MaxKeys": 1})
+        self.assertTrue(self.plan.has_objects())
+
+        self.stubber.add_response("list_objects_v2", {
+            "Contents": [{"Key": "a"}, {"Key": "b"}],
+            "IsTruncated": False,
+        })
+        self.stubber.add_response("delete_objects", {}, {
+            "Bucket": "my-bucket",
+            "Delete": {"Objects": [{"Key": "a"}, {"Key": "b"}], "Quiet": True},
+        })
+        bucket.EmptyBucket(self.plan).run()
+        self.stubber.assert_no_pending_responses()
@@ -0,0 +1,93 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+
+from . import aws
+
+
+class TestFileIndex(aws.StubbedTestCase):
+
+    def setUp(self):
+        super(TestFileIndex, self).setUp()
+        self.bucket = self.aws.add_bucket(name="my-bucket")
+        patcher = mock.patch.object(self.goal.get_plan(self.bucket), "object", {"Name": "my-bucket"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_point_lookup(self):
+        plan = self.goal.get_plan(self.bucket.add_file(name="config/app.cfg", contents="a"))
+        stubber = self.stub(plan)
+        stubber.add_response("list_objects_v2", {"Contents": [{"Key": "config/app.cfg", "Size": 1}]}, {
+            "Bucket": "my-bucket",
+            "Prefix": "config/app.cfg",
+            "MaxKeys": 1,
+        })
+        self.assertEqual(plan.describe_object()["Size"], 1)
+        stubber.assert_no_pending_responses()
+
+    def test_missing(self):
+        plan = self.goal.get_plan(self.bucket.add_file(name="config/app.cfg", contents="a"))
+        stubber = self.stub(plan)
+        stubber.add_response("list_objects_v2", {"Contents": [{"Key": "config/app.cfg.bak", "Size": 1}]})
+        self.assertEqual(plan.describe_object(), {})
+
+    def test_shared_listing(self):
+        plans = [
+            self.goal.get_plan(self.bucket.add_file(name=name, contents="a"))
+            for name in ("config/app.cfg", "config/db.cfg", "config/web.cfg")
+        ]
+        stubber = self.stub(plans[0])
+        stubber.add_response("list_objects_v2", {"Contents": [
+            {"Key": "config/app.cfg", "Size": 1},
+            {"Key": "config/cache.cfg", "Size": 2},
+            {"Key": "config/web.cfg", "Size": 3},
+            {"Key": "config/zzz.cfg", "Size": 4},
+        ]}, {
+            "Bucket": "my-bucket",
+            "Prefix": "config/",
+            "StartAfter": "config/app.cf",
+        })
+
+        self.assertEqual(plans[0].describe_object()["Size"], 1)
+        self.assertEqual(plans[1].describe_object(), {})
+        self.assertEqual(plans[2].describe_object()["Size"], 3)
+        stubber.assert_no_pending_responses()
+
+    def test_no_shared_prefix(self):
+        plans = [
+            self.goal.get_plan(self.bucket.add_file(name=name, contents="a"))
+            for name in ("robots.txt", "static/app.js", "zzz.txt")
+        ]
+        stubber = self.stub(plans[0])
+        for name, size in (("robots.txt", 1), ("zzz.txt", 3)):
+            stubber.add_response("list_objects_v2", {"Contents": [{"Key": name, "Size": size}]}, {
+                "Bucket": "my-bucket",
+                "Prefix": name,
+                "MaxKeys": 1,
+            })
+
+        self.assertEqual(plans[0].describe_object()["Size"], 1)
+        self.assertEqual(plans[2].describe_object()["Size"], 3)
+        stubber.assert_no_pending_responses()
+
+    def test_siblings_found_once(self):
+        plans = [
+            self.goal.get_plan(self.bucket.add_file(name=name, contents="a"))
+            for name in ("config/app.cfg", "config/db.cfg")
+        ]
+        with mock.patch.object(self.goal, "get_plan_order", wraps=self.goal.get_plan_order) as get_plan_order:
+            for plan in plans:
+                self.assertEqual(plan.get_sibling_keys(), ["config/app.cfg", "config/db.cfg"])
+        self.assertEqual(get_plan_order.call_count, 1)
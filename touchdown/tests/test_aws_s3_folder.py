@@ -0,0 +1,183 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import hashlib
+import os
+import shutil
+import tempfile
+
+import mock
+from botocore.stub import ANY
+
+from touchdown.aws.s3 import folder, hashing
+from touchdown.core import errors, goals
+from touchdown.core.map import SerialMap
+from touchdown.frontends import ConsoleFrontend
+
+from . import aws
+
+MB = 1024 * 1024
+
+
+class TestFolder(aws.StubbedTestCase):
+
+    def setUp(self):
+        super(TestFolder, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.bucket = self.aws.add_bucket(name="my-bucket")
+        self.folder = self.bucket.add_folder(name="static", source=self.directory, part_size=5 * MB)
+        self.plan = self.goal.get_plan(self.folder)
+        cache_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_directory)
+        self.plan.hash_cache_path = os.path.join(cache_directory, "hashes.db")
+        self.stubber = self.stub(self.plan)
+
+    def write(self, name, contents):
+        path = os.path.join(self.directory, name)
+        with open(path, "wb") as fp:
+            fp.write(contents)
+        return path
+
+    def get_etag(self, contents, part_size):
+        parts = [hashlib.md5(contents[i:i + part_size]).digest() for i in range(0, len(contents), part_size)]
+        return "{}-{}".format(hashlib.md5(b"".join(parts)).hexdigest(), len(parts))
+
+    def upload(self, path):
+        action = folder.UploadFile(self.plan, "Add", path, Bucket="my-bucket", Key="static/a")
+        action.run()
+        self.stubber.assert_no_pending_responses()
+
+    def test_upload_small_file(self):
+        path = self.write("a", b"x" * 100)
+        self.stubber.add_response("put_object", {}, {"Bucket": "my-bucket", "Key": "static/a", "Body": ANY})
+        self.upload(path)
+
+    def test_upload_in_parts(self):
+        path = self.write("a", b"x" * (11 * MB))
+        self.stubber.add_response("create_multipart_upload", {"UploadId": "1"})
+        for part in range(1, 4):
+            self.stubber.add_response("upload_part", {"ETag": str(part)}, {
+                "Bucket": "my-bucket",
+                "Key": "static/a",
+                "UploadId": "1",
+                "PartNumber": part,
+                "Body": ANY,
+            })
+        self.stubber.add_response("complete_multipart_upload", {}, {
+            "Bucket": "my-bucket",
+            "Key": "static/a",
+            "UploadId": "1",
+            "MultipartUpload": {"Parts": [{"ETag": str(part), "PartNumber": part} for part in range(1, 4)]},
+        })
+        self.upload(path)
+
+    def test_upload_in_parts_aborted(self):
+        path = self.write("a", b"x" * (11 * MB))
+        self.stubber.add_response("create_multipart_upload", {"UploadId": "1"})
+        self.stubber.add_client_error("upload_part", "InternalError")
+        self.stubber.add_response("abort_multipart_upload", {}, {"Bucket": "my-bucket", "Key": "static/a", "UploadId": "1"})
+        self.assertRaises(Exception, self.upload, path)
+        self.stubber.assert_no_pending_responses()
+
+    def test_unchanged_multipart(self):
+        contents = b"x" * (11 * MB)
+        self.write("a", contents)
+        local = self.plan.get_local_contents()["a"]
+        self.assertEqual(local["ETag"], self.get_etag(contents, 5 * MB))
+        self.assertTrue(self.plan.is_unchanged(local, {"Md5": self.get_etag(contents, 5 * MB), "Size": len(contents)}))
+
+    def test_unchanged_multipart_other_part_size(self):
+        contents = b"x" * (11 * MB)
+        self.write("a", contents)
+        local = self.plan.get_local_contents()["a"]
+        self.assertTrue(self.plan.is_unchanged(local, {"Md5": self.get_etag(contents, 8 * MB), "Size": len(contents)}))
+
+    def test_other_part_size_cached(self):
+        contents = b"x" * (11 * MB)
+        self.write("a", contents)
+        remote = {"Md5": self.get_etag(contents, 8 * MB), "Size": len(contents)}
+        self.assertTrue(self.plan.is_unchanged(self.plan.get_local_contents()["a"], remote))
+
+        goal = goals.create("apply", self.workspace, ConsoleFrontend(interactive=False), map=SerialMap)
+        plan = goal.get_plan(self.folder)
+        plan.hash_cache_path = self.plan.hash_cache_path
+        with mock.patch.object(hashing, "hash_file") as hash_file:
+            self.assertTrue(plan.is_unchanged(plan.get_local_contents()["a"], remote))
+        self.assertEqual(hash_file.call_count, 0)
+
+    def test_changed_multipart(self):
+        contents = b"x" * (11 * MB)
+        self.write("a", contents)
+        local = self.plan.get_local_contents()["a"]
+        self.assertFalse(self.plan.is_unchanged(local, {"Md5": self.get_etag(b"y" * (11 * MB), 8 * MB), "Size": len(contents)}))
+
+    def test_sync(self):
+        self.write("a", b"aaa")
+        self.write("b", b"bbb")
+        self.plan.transfer_concurrency = 1
+        self.plan.object = {"Name": "static"}
+
+        self.stubber.add_response("list_objects", {"Contents": [
+            {"Key": "static/b", "LastModified": datetime.datetime(2016, 1, 1), "ETag": '"{}"'.format(hashlib.md5(b"bbb").hexdigest()), "Size": 3},
+            {"Key": "static/c", "LastModified": datetime.datetime(2016, 1, 1), "ETag": '"abc"', "Size": 3},
+            {"Key": "static/d", "LastModified": datetime.datetime(2016, 1, 1), "ETag": '"abc"', "Size": 3},
+        ]})
+        with mock.patch.object(self.goal.get_plan(self.bucket), "object", {"Name": "my-bucket"}):
+            actions = list(self.plan.update_object())
+
+        self.assertEqual(len(actions), 1)
+        self.assertEqual(actions[0].description, [
+            "Upload 1 files and remove 2 files",
+            "Add a (application/octet-stream)",
+            "Remove static/c",
+            "Remove static/d",
+        ])
+
+        self.stubber.add_response("put_object", {}, {
+            "Bucket": "my-bucket",
+            "Key": "static/a",
+            "Body": ANY,
+            "ACL": "private",
+            "CacheControl": "max-age=0",
+            "ContentType": "application/octet-stream",
+        })
+        self.stubber.add_response("delete_objects", {}, {
+            "Bucket": "my-bucket",
+            "Delete": {"Objects": [{"Key": "static/c"}, {"Key": "static/d"}], "Quiet": True},
+        })
+        actions[0].run()
+        self.stubber.assert_no_pending_responses()
+
+    def test_sync_batches_deletes(self):
+        action = folder.SyncFolder(self.plan, [], ["static/{}".format(i) for i in range(5)])
+        action.delete_batch_size = 2
+        self.plan.transfer_concurrency = 1
+        for keys in (["static/0", "static/1"], ["static/2", "static/3"], ["static/4"]):
+            self.stubber.add_response("delete_objects", {}, {
+                "Bucket": "my-bucket",
+                "Delete": {"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            })
+        action.run()
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(action.transferred, 5)
+
+    def test_sync_delete_errors(self):
+        action = folder.SyncFolder(self.plan, [], ["static/a"])
+        self.stubber.add_response("delete_objects", {"Errors": [
+            {"Key": "static/a", "Code": "AccessDenied", "Message": "Access Denied"},
+        ]})
+        self.assertRaises(errors.Error, action.run)
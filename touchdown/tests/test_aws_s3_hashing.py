@@ -0,0 +1,102 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from touchdown.aws.s3 import hashing
+
+
+class TestHashFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.cache = hashing.HashCache(os.path.join(self.directory, "cache", "hashes.db"))
+
+    def write(self, name, contents):
+        path = os.path.join(self.directory, name)
+        with open(path, "wb") as fp:
+            fp.write(contents)
+        return path
+
+    def md5(self, contents):
+        md5 = hashlib.md5(contents).hexdigest()
+        return md5, md5
+
+    def test_hash_file(self):
+        path = self.write("a", b"x" * 100)
+        self.assertEqual(hashing.hash_file(path, chunk_size=7), self.md5(b"x" * 100))
+
+    def test_hash_file_parts(self):
+        path = self.write("a", b"x" * 100)
+        md5, etag = hashing.hash_file(path, part_size=40, chunk_size=7)
+        self.assertEqual(md5, hashlib.md5(b"x" * 100).hexdigest())
+        parts = [hashlib.md5(b"x" * 40).digest(), hashlib.md5(b"x" * 40).digest(), hashlib.md5(b"x" * 20).digest()]
+        self.assertEqual(etag, hashlib.md5(b"".join(parts)).hexdigest() + "-3")
+
+    def test_hash_file_one_part(self):
+        path = self.write("a", b"x" * 100)
+        self.assertEqual(hashing.hash_file(path, part_size=100), self.md5(b"x" * 100))
+
+    def test_guess_part_sizes(self):
+        mb = 1024 * 1024
+        self.assertEqual(hashing.guess_part_sizes(20 * mb, 3), [8 * mb, 7 * mb])
+        self.assertEqual(hashing.guess_part_sizes(20 * mb, 2, preferred=[12 * mb]), [12 * mb, 16 * mb, 15 * mb, 10 * mb])
+
+    def test_hash_files(self):
+        a = self.write("a", b"aaa")
+        b = self.write("b", b"bbb")
+        self.assertEqual(hashing.hash_files([a, b], concurrency=2), {
+            a: self.md5(b"aaa"),
+            b: self.md5(b"bbb"),
+        })
+
+    def test_unchanged_files_not_read(self):
+        a = self.write("a", b"aaa")
+        hashing.hash_files([a], cache=self.cache)
+        with mock.patch.object(hashing, "hash_file") as hash_file:
+            self.assertEqual(hashing.hash_files([a], cache=self.cache), {a: self.md5(b"aaa")})
+        self.assertEqual(hash_file.call_count, 0)
+
+    def test_changed_files_read(self):
+        a = self.write("a", b"aaa")
+        hashing.hash_files([a], cache=self.cache)
+        os.unlink(a)
+        a = self.write("a", b"bbbb")
+        self.assertEqual(hashing.hash_files([a], cache=self.cache), {a: self.md5(b"bbbb")})
+
+    def test_part_size_changed(self):
+        a = self.write("a", b"x" * 100)
+        hashing.hash_files([a], part_size=200, cache=self.cache)
+        self.assertEqual(hashing.hash_files([a], part_size=50, cache=self.cache)[a][1][-2:], "-2")
+
+    def test_broken_cache(self):
+        a = self.write("a", b"aaa")
+        cache = hashing.HashCache(os.path.join(a, "hashes.db"))
+        self.assertEqual(hashing.hash_files([a], cache=cache), {a: self.md5(b"aaa")})
+
+    def test_part_sizes_cached_separately(self):
+        a = self.write("a", b"x" * 100)
+        hashing.hash_files([a], part_size=200, cache=self.cache)
+        hashing.hash_files([a], part_size=50, cache=self.cache)
+        with mock.patch.object(hashing, "hash_file") as hash_file:
+            hashing.hash_files([a], part_size=200, cache=self.cache)
+            hashing.hash_files([a], part_size=50, cache=self.cache)
+        self.assertEqual(hash_file.call_count, 0)
@@ -14,13 +14,56 @@
 
 import unittest
 
-from touchdown.aws.session import session
+from botocore.stub import Stubber
+
+from touchdown.aws.session import Session, get_session
+from touchdown.core.cache import MemoryCache
+from touchdown.core.throttle import throttles
 
 
 class TestSimpleDescribeImplementations(unittest.TestCase):
 
     def test_image_retry(self):
         self.assertEquals(
-            session.get_component('data_loader').load_data('_retry')['retry']['__default__']['max_attempts'],
+            get_session().get_component('data_loader').load_data('_retry')['retry']['__default__']['max_attempts'],
             10
         )
+
+
+class TestSessionClients(unittest.TestCase):
+
+    def setUp(self):
+        self.session = Session("dummy", "dummy", None, None, "eu-west-1")
+
+    def test_get_client_shared(self):
+        self.assertTrue(self.session.get_client("ec2") is self.session.get_client("ec2"))
+        self.assertFalse(self.session.get_client("ec2") is self.session.get_client("iam"))
+
+    def test_get_client_follows_region(self):
+        client = self.session.get_client("ec2")
+        self.session.region = "us-east-1"
+        self.assertFalse(client is self.session.get_client("ec2"))
+
+    def test_pool_sized_for_throttle(self):
+        client = self.session.get_client("ec2")
+        self.assertEqual(client.meta.config.max_pool_connections, throttles.get_maximum("ec2"))
+
+    def test_mutation_invalidates_every_cache(self):
+        caches = [MemoryCache(), MemoryCache()]
+        for cache in caches:
+            client = self.session.get_client("iam", cache=cache)
+            cache[("dummy", "eu-west-1", "iam", "list_roles")] = []
+            cache[("dummy", "eu-west-1", "sqs", "list_queues")] = []
+
+        stubber = Stubber(client)
+        stubber.activate()
+        stubber.add_response("list_roles", {"Roles": []})
+        client.list_roles()
+        for cache in caches:
+            self.assertTrue(("dummy", "eu-west-1", "iam", "list_roles") in cache)
+
+        stubber.add_response("delete_role", {})
+        client.delete_role(RoleName="role1")
+        for cache in caches:
+            self.assertFalse(("dummy", "eu-west-1", "iam", "list_roles") in cache)
+            self.assertTrue(("dummy", "eu-west-1", "sqs", "list_queues") in cache)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from touchdown.core import errors
+
 from . import aws
 
 
@@ -43,3 +45,57 @@ class TestSecurityGroup(aws.RecordedBotoCoreTest):
         )
         self.apply()
         self.destroy()
+
+
+class TestDestroyTarget(aws.StubbedTestCase):
+
+    goal_name = "destroy"
+
+    def setUp(self):
+        super(TestDestroyTarget, self).setUp()
+        self.vpc = self.aws.add_vpc(name='test-vpc', cidr_block='192.168.0.0/25')
+        self.security_group = self.vpc.add_security_group(
+            name='test-security-group',
+            description='test-security-group',
+        )
+
+    def test_destroy_target_describes_vpc(self):
+        self.goal.set_targets([("security_group", "test-security-group")])
+
+        vpc = self.goal.get_plan(self.vpc)
+        self.assertEqual(vpc.name, "describe")
+        self.assertIn(self.vpc, self.goal.get_plan_order().map)
+        self.assertNotIn(self.vpc, self.goal.get_execution_order().map)
+
+        stub = self.stub(vpc)
+        stub.add_response(
+            'describe_vpcs',
+            service_response={'Vpcs': [{'VpcId': 'vpc-1'}]},
+        )
+        stub.add_response(
+            'describe_security_groups',
+            service_response={'SecurityGroups': [{
+                'GroupId': 'sg-1',
+                'GroupName': 'test-security-group',
+                'VpcId': 'vpc-1',
+            }]},
+        )
+
+        changes = dict(self.goal.plan())
+        self.assertEqual(list(changes), [self.security_group])
+        self.assertIn(
+            "Destroy security_group 'test-security-group'",
+            "\n".join(
+                line
+                for action in changes[self.security_group]
+                for line in action.description
+            ),
+        )
+
+    def test_ambiguous_target(self):
+        other = self.aws.add_vpc(name='other-vpc', cidr_block='192.168.0.128/25')
+        other.add_security_group(name='test-security-group', description='test-security-group')
+        self.assertRaises(
+            errors.Error,
+            self.goal.set_targets, [("security_group", "test-security-group")],
+        )
@@ -65,6 +65,40 @@ class _Mixins(object):
     def get(self, name):
         return self.get_goal("get").collect_as_dict("get")[name].execute()
 
+    def test_collect_one(self):
+        goal = self.get_goal("get")
+        plan = goal.collect_one("get", "strings.variable1")
+        self.assertIs(plan.resource, self.strings_variable1)
+        # Only the setting and what it depends on were planned
+        self.assertNotIn((self.integer_variable11, "get"), goal.resources)
+        self.assertNotIn((self.list_variable1, "get"), goal.resources)
+
+    def test_collect_one_missing(self):
+        self.assertEqual(self.get_goal("get").collect_one("get", "strings.missing"), None)
+
+    def test_target_apply(self):
+        goal = self.get_goal("apply")
+        goal.set_targets([("string", "strings.variable1")])
+        closure = goal.get_plan_order().map
+        self.assertIn(self.strings_variable1, closure)
+        self.assertIn(self.config, closure)
+        self.assertNotIn(self.integer_variable11, closure)
+        self.assertRaises(
+            errors.NothingChanged,
+            goal.execute, targets=[("string", "strings.variable1")]
+        )
+
+    def test_target_destroy(self):
+        goal = self.get_goal("destroy")
+        goal.set_targets([("string", "strings.variable1")])
+        # The workspace itself depends on every resource
+        closure = goal.get_execution_order().map
+        self.assertEqual(set(closure), set([self.strings_variable1, self.workspace]))
+
+    def test_target_missing(self):
+        goal = self.get_goal("apply")
+        self.assertRaises(errors.Error, goal.set_targets, [("string", "strings.missing")])
+
     def test_apply(self):
         self.assertRaises(
             errors.NothingChanged,
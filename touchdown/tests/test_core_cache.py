@@ -0,0 +1,83 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+from touchdown.core.cache import MemoryCache
+
+
+class TestMemoryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = MemoryCache()
+
+    def test_get_or_create(self):
+        calls = []
+
+        def creator():
+            calls.append(1)
+            return "value"
+
+        self.assertEqual(self.cache.get_or_create("key", creator), "value")
+        self.assertEqual(self.cache.get_or_create("key", creator), "value")
+        self.assertEqual(len(calls), 1)
+        self.assertTrue("key" in self.cache)
+
+    def test_concurrent_callers_share_result(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def creator():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.get_or_create("key", creator)))
+            for i in range(4)
+        ]
+        threads[0].start()
+        started.wait()
+        for t in threads[1:]:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, ["value"] * 4)
+        self.assertEqual(len(calls), 1)
+
+    def test_failure_not_cached(self):
+        def creator():
+            raise ValueError("Boom")
+        self.assertRaises(ValueError, self.cache.get_or_create, "key", creator)
+        self.assertEqual(self.cache.get_or_create("key", lambda: "value"), "value")
+
+    def test_invalidate(self):
+        self.cache[("iam", "list_roles")] = 1
+        self.cache[("s3", "list_buckets")] = 2
+        self.cache.invalidate(lambda key: key[0] == "iam")
+        self.assertFalse(("iam", "list_roles") in self.cache)
+        self.assertEqual(self.cache[("s3", "list_buckets")], 2)
+
+    def test_invalidate_while_pending(self):
+        def creator():
+            self.cache.invalidate(lambda key: True)
+            return "stale"
+        self.assertEqual(self.cache.get_or_create("key", creator), "stale")
+        self.assertFalse("key" in self.cache)
@@ -0,0 +1,42 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from touchdown.core.database import Database
+
+
+class TestDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_schema(self):
+        db = Database(os.path.join(self.directory, "cache", "test.db"), schema=[
+            "CREATE TABLE IF NOT EXISTS things (name TEXT PRIMARY KEY)",
+        ])
+        db.executemany("INSERT INTO things VALUES (?)", [("a", ), ("b", )])
+        self.assertEqual(db.execute("SELECT name FROM things ORDER BY name"), [("a", ), ("b", )])
+
+    def test_unusable(self):
+        path = os.path.join(self.directory, "file")
+        with open(path, "w") as fp:
+            fp.write("not a directory")
+        db = Database(os.path.join(path, "test.db"))
+        db.executemany("INSERT INTO things VALUES (?)", [("a", )])
+        self.assertEqual(db.execute("SELECT name FROM things"), [])
@@ -15,7 +15,7 @@
 import unittest
 
 from touchdown.aws.vpc import SecurityGroup
-from touchdown.core import dependencies
+from touchdown.core import dependencies, errors
 
 
 class TestDependencies(unittest.TestCase):
@@ -43,3 +43,76 @@ class TestDependencies(unittest.TestCase):
 
         dw = dependencies.DependencyMap(d, tips_first=True)
         self.assertEqual(list(dw.all()), [d, c, b, a])
+
+    def test_get_ready_after_complete(self):
+        a = SecurityGroup(None, name="a", description="test")
+        b = SecurityGroup(None, name="b", description="test")
+        c = SecurityGroup(None, name="c", description="test")
+        c.add_dependency(a)
+        c.add_dependency(b)
+
+        dw = dependencies.DependencyMap(c)
+        self.assertEqual(sorted(dw.get_ready()), [a, b])
+        self.assertEqual(len(dw), 3)
+
+        self.assertEqual(dw.complete(a), [])
+        self.assertEqual(list(dw.get_ready()), [b])
+
+        self.assertEqual(dw.complete(b), [c])
+        self.assertEqual(list(dw.get_ready()), [c])
+
+        self.assertEqual(dw.complete(c), [])
+        self.assertTrue(dw.empty())
+
+    def test_closure(self):
+        a = SecurityGroup(None, name="a", description="test")
+        b = SecurityGroup(None, name="b", description="test")
+        b.add_dependency(a)
+        c = SecurityGroup(None, name="c", description="test")
+        c.add_dependency(b)
+        d = SecurityGroup(None, name="d", description="test")
+        d.add_dependency(a)
+        e = SecurityGroup(None, name="e", description="test")
+        e.add_dependency(c)
+        e.add_dependency(d)
+
+        upstream = dependencies.DependencyMap(e).get_closure([b])
+        self.assertEqual(sorted(upstream), [a, b])
+
+        downstream = dependencies.DependencyMap(e, tips_first=True).get_closure([b])
+        self.assertEqual(sorted(downstream), [b, c, e])
+
+        dw = dependencies.DependencyMap(e, nodes=downstream)
+        self.assertEqual(list(dw.all()), [b, c, e])
+
+    def test_cycle(self):
+        a = SecurityGroup(None, name="a", description="test")
+        b = SecurityGroup(None, name="b", description="test")
+        a.add_dependency(b)
+        b.add_dependency(a)
+        c = SecurityGroup(None, name="c", description="test")
+        c.add_dependency(a)
+
+        self.assertRaises(errors.CycleError, dependencies.DependencyMap, c)
+
+    def test_priority_follows_critical_path(self):
+        slow = SecurityGroup(None, name="slow", description="test")
+        slow.expected_duration = 100
+        fast = SecurityGroup(None, name="fast", description="test")
+        a = SecurityGroup(None, name="a", description="test")
+        a.add_dependency(fast)
+        b = SecurityGroup(None, name="b", description="test")
+        b.add_dependency(slow)
+        c = SecurityGroup(None, name="c", description="test")
+        c.add_dependency(a)
+        c.add_dependency(b)
+
+        dw = dependencies.DependencyMap(c)
+        self.assertEqual(dw.priority[c], 1)
+        self.assertEqual(dw.priority[b], 2)
+        self.assertEqual(dw.priority[slow], 102)
+        self.assertEqual(dw.priority[fast], 3)
+
+        dw = dependencies.DependencyMap(c, tips_first=True)
+        self.assertEqual(dw.priority[c], 102)
+        self.assertEqual(dw.priority[slow], 100)
@@ -0,0 +1,55 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from touchdown.core import fingerprint, serializers
+from touchdown.core.workspace import Workspace
+
+
+class TestFingerprints(unittest.TestCase):
+
+    def build(self, cidr_block="10.0.0.0/24"):
+        workspace = Workspace()
+        aws = workspace.add_aws(access_key_id="a", secret_access_key="b", region="eu-west-1")
+        vpc = aws.add_vpc(name="main", cidr_block="10.0.0.0/16")
+        subnet = vpc.add_subnet(name="a", cidr_block=cidr_block)
+        group = vpc.add_security_group(
+            name="web",
+            description=serializers.Expression(lambda runner, obj: "web servers"),
+        )
+        return vpc, subnet, group
+
+    def test_path(self):
+        vpc, subnet, group = self.build()
+        self.assertEqual(fingerprint.get_path(subnet), "aws/vpc 'main'/subnet 'a'")
+
+    def test_stable(self):
+        first, second = self.build(), self.build()
+        for a, b in zip(first, second):
+            self.assertEqual(fingerprint.Fingerprints().get(a), fingerprint.Fingerprints().get(b))
+
+    def test_changed(self):
+        vpc, subnet, group = self.build()
+        vpc2, subnet2, group2 = self.build(cidr_block="10.0.1.0/24")
+        fingerprints = fingerprint.Fingerprints()
+        self.assertEqual(fingerprints.get(vpc), fingerprints.get(vpc2))
+        self.assertNotEqual(fingerprints.get(subnet), fingerprints.get(subnet2))
+
+    def test_changed_dependency(self):
+        vpc, subnet, group = self.build()
+        vpc2, subnet2, group2 = self.build()
+        vpc2.cidr_block = "10.1.0.0/16"
+        fingerprints = fingerprint.Fingerprints()
+        self.assertNotEqual(fingerprints.get(subnet), fingerprints.get(subnet2))
@@ -12,12 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
 import unittest
 
-from touchdown.core.main import main
+from touchdown.core.main import get_state, main, service_limit
 
 
 class TestStringHelpers(unittest.TestCase):
 
     def test_main_help(self):
         self.assertRaises(SystemExit, main, ["--help"])
+
+    def test_service_limit(self):
+        self.assertEqual(service_limit("ec2=4"), ("ec2", 4))
+        self.assertRaises(argparse.ArgumentTypeError, service_limit, "ec2")
+        self.assertRaises(argparse.ArgumentTypeError, service_limit, "ec2=0")
+        self.assertRaises(argparse.ArgumentTypeError, service_limit, "ec2=many")
+
+    def test_no_state_by_default(self):
+        args = argparse.Namespace(state_ttl=0, skip_unchanged=0)
+        self.assertIsNone(get_state(args))
+        args = argparse.Namespace(state_ttl=0)
+        self.assertIsNone(get_state(args))
@@ -0,0 +1,179 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+from touchdown.aws.vpc import SecurityGroup
+from touchdown.core import dependencies, errors
+from touchdown.core.map import ParallelMap, SerialMap
+from touchdown.core.reactor import Poll
+from touchdown.frontends import ConsoleFrontend
+
+
+class TestParallelMap(unittest.TestCase):
+
+    def setUp(self):
+        self.ui = ConsoleFrontend(interactive=False)
+
+    def build_chain(self, length):
+        previous = None
+        for i in range(length):
+            node = SecurityGroup(None, name="test{}".format(i), description="test")
+            if previous:
+                node.add_dependency(previous)
+            previous = node
+        return previous
+
+    def test_visits_in_dependency_order(self):
+        tip = self.build_chain(20)
+        visited = []
+
+        pm = ParallelMap(self.ui, dependencies.DependencyMap(tip), visited.append)
+        pm()
+
+        self.assertEqual(len(visited), 20)
+        for node in visited:
+            for dep in node.dependencies:
+                self.assertTrue(visited.index(dep) < visited.index(node))
+
+    def test_workers_exit(self):
+        tip = self.build_chain(5)
+        pm = ParallelMap(self.ui, dependencies.DependencyMap(tip), lambda resource: None)
+        pm()
+        for thread in pm.threads:
+            self.assertFalse(thread.is_alive())
+
+    def test_error_stops_dispatch(self):
+        tip = self.build_chain(5)
+        visited = []
+        lock = threading.Lock()
+
+        def _(resource):
+            with lock:
+                visited.append(resource)
+            raise errors.Error("Boom")
+
+        pm = ParallelMap(self.ui, dependencies.DependencyMap(tip), _)
+        self.assertRaises(errors.Error, pm)
+        self.assertEqual(len(visited), 1)
+
+    def test_critical_path_first(self):
+        tip = self.build_chain(5)
+        loner = SecurityGroup(None, name="loner", description="test")
+        tip.add_dependency(loner)
+        visited = []
+
+        pm = ParallelMap(self.ui, dependencies.DependencyMap(tip), visited.append)
+        pm.workers = 1
+        pm()
+
+        # loner only blocks the tip, but test0 blocks a chain of 5
+        self.assertEqual([node.name for node in visited[:3]], ["test0", "test1", "test2"])
+        self.assertEqual(visited[-1], tip)
+
+    def test_waiting_frees_worker(self):
+        waiter = SecurityGroup(None, name="waiter", description="test")
+        other = SecurityGroup(None, name="other", description="test")
+        root = SecurityGroup(None, name="root", description="test")
+        root.add_dependency(waiter)
+        root.add_dependency(other)
+        visited = []
+
+        def _(resource):
+            if resource == waiter:
+                # Can only succeed once the single worker has visited other
+                yield Poll(lambda: other in visited, 0.01, 100)
+            visited.append(resource)
+
+        pm = ParallelMap(self.ui, dependencies.DependencyMap(root), _, workers=1)
+        pm()
+
+        self.assertEqual(visited, [other, waiter, root])
+
+    def test_poll_error_stops_dispatch(self):
+        tip = self.build_chain(3)
+        visited = []
+
+        def _(resource):
+            visited.append(resource)
+            yield Poll(lambda: False, 0.01, 2)
+
+        pm = ParallelMap(self.ui, dependencies.DependencyMap(tip), _)
+        self.assertRaises(errors.Error, pm)
+        self.assertEqual(len(visited), 1)
+
+    def test_poll_error_thrown_into_generator(self):
+        resource = SecurityGroup(None, name="test", description="test")
+        cleaned_up = []
+
+        def _(resource):
+            try:
+                yield Poll(lambda: False, 0.01, 2)
+            finally:
+                cleaned_up.append(threading.current_thread().name)
+
+        pm = ParallelMap(self.ui, dependencies.DependencyMap(resource), _)
+        self.assertRaises(errors.Error, pm)
+        # Cleaned up by a worker before the error was reported
+        self.assertEqual(len(cleaned_up), 1)
+        self.assertTrue(cleaned_up[0].startswith("worker"))
+
+    def test_poll_error_handled(self):
+        resource = SecurityGroup(None, name="test", description="test")
+        visited = []
+
+        def _(resource):
+            try:
+                yield Poll(lambda: False, 0.01, 2)
+            except errors.Error:
+                yield Poll(lambda: True, 0.01)
+            visited.append(resource)
+
+        pm = ParallelMap(self.ui, dependencies.DependencyMap(resource), _)
+        pm()
+        self.assertEqual(visited, [resource])
+
+
+class TestSerialMap(unittest.TestCase):
+
+    def test_waits_for_polls(self):
+        checks = []
+
+        def _(resource):
+            yield Poll(lambda: checks.append(resource) or len(checks) == 2, 0)
+
+        resource = SecurityGroup(None, name="test", description="test")
+        sm = SerialMap(ConsoleFrontend(interactive=False), dependencies.DependencyMap(resource), _)
+        list(sm)
+
+        self.assertEqual(checks, [resource, resource])
+
+    def test_poll_error_thrown_into_generator(self):
+        cleaned_up = []
+
+        def _(resource):
+            try:
+                yield Poll(lambda: False, 0, 2)
+            finally:
+                cleaned_up.append(resource)
+
+        resource = SecurityGroup(None, name="test", description="test")
+        sm = SerialMap(ConsoleFrontend(interactive=False), dependencies.DependencyMap(resource), _)
+        try:
+            list(sm)
+        except errors.Error:
+            self.assertEqual(cleaned_up, [resource])
+        else:
+            self.fail("The poll error wasn't raised")
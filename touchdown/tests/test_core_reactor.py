@@ -0,0 +1,145 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import division
+
+import threading
+import time
+import unittest
+
+import mock
+
+from touchdown.core import errors
+from touchdown.core.action import PollingAction
+from touchdown.core.reactor import BackoffPoll, Poll, Reactor, wait_all
+
+
+class TestPoll(unittest.TestCase):
+
+    def test_wait(self):
+        results = [False, False, True]
+        poll = Poll(lambda: results.pop(0), 0)
+        poll.wait()
+        self.assertEqual(poll.attempts, 3)
+
+    def test_too_many_attempts(self):
+        poll = Poll(lambda: False, 0, 3, timeout_message="Too slow")
+        self.assertEqual(poll.check(), False)
+        self.assertEqual(poll.check(), False)
+        self.assertRaises(errors.Error, poll.check)
+
+
+class TestWaitAll(unittest.TestCase):
+
+    def test_error_thrown_into_generator(self):
+        cleaned_up = []
+
+        def _():
+            try:
+                yield Poll(lambda: False, 0, 2)
+            finally:
+                cleaned_up.append(True)
+
+        try:
+            wait_all(_())
+        except errors.Error:
+            # Cleaned up before the error got here, not when the generator
+            # was garbage collected
+            self.assertEqual(cleaned_up, [True])
+        else:
+            self.fail("The poll error wasn't raised")
+
+    def test_error_handled(self):
+        results = []
+
+        def _():
+            try:
+                yield Poll(lambda: False, 0, 2)
+            except errors.Error:
+                results.append("handled")
+            yield Poll(lambda: True, 0)
+            results.append("finished")
+
+        wait_all(_())
+        self.assertEqual(results, ["handled", "finished"])
+
+    def test_polling_action(self):
+        cleaned_up = []
+
+        class Action(PollingAction):
+
+            def run_async(self):
+                try:
+                    yield Poll(lambda: False, 0, 2)
+                except errors.Error:
+                    cleaned_up.append(True)
+                    raise
+
+        try:
+            Action(mock.Mock()).run()
+        except errors.Error:
+            self.assertEqual(cleaned_up, [True])
+        else:
+            self.fail("The poll error wasn't raised")
+
+
+class TestBackoffPoll(unittest.TestCase):
+
+    def test_delay_grows_to_maximum(self):
+        poll = BackoffPoll(lambda: False, 1, 100, max_delay=10)
+        delays = []
+        for i in range(6):
+            poll.check()
+            delays.append(poll.get_delay())
+        for delay, ceiling in zip(delays, [1, 2, 4, 8, 10, 10]):
+            self.assertTrue(ceiling / 2 <= delay <= ceiling)
+
+    def test_time_limit(self):
+        poll = BackoffPoll(lambda: False, 0.01, 1)
+        self.assertEqual(poll.check(), False)
+        time.sleep(0.02)
+        self.assertRaises(errors.Error, poll.check)
+
+
+class TestReactor(unittest.TestCase):
+
+    def setUp(self):
+        self.reactor = Reactor()
+        self.reactor.start()
+        self.addCleanup(self.reactor.stop)
+
+    def test_callback(self):
+        results = [False, True]
+        done = threading.Event()
+        self.reactor.add(Poll(lambda: results.pop(0), 0.01), done.set, None)
+        self.assertTrue(done.wait(5))
+
+    def test_errback(self):
+        failures = []
+        done = threading.Event()
+
+        def errback(e):
+            failures.append(e)
+            done.set()
+
+        self.reactor.add(Poll(lambda: False, 0.01, 1), None, errback)
+        self.assertTrue(done.wait(5))
+        self.assertTrue(isinstance(failures[0], errors.Error))
+
+    def test_stop_abandons_parked(self):
+        self.reactor.add(Poll(lambda: True, 60), None, None)
+        self.assertEqual(len(self.reactor), 1)
+        self.reactor.stop()
+        self.assertEqual(len(self.reactor), 0)
+        self.assertFalse(self.reactor.thread.is_alive())
@@ -0,0 +1,54 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+from touchdown.core import registry, registry_index
+from touchdown.core.workspace import Workspace
+
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_index_up_to_date(self):
+        factories, plans = registry.build_index()
+        self.assertEqual(registry_index.FACTORIES, factories, "Run python -m touchdown.core.registry")
+        self.assertEqual(registry_index.PLANS, plans, "Run python -m touchdown.core.registry")
+
+    def test_unknown_factory(self):
+        self.assertRaises(AttributeError, getattr, Workspace(), "add_no_such_thing")
+
+    def test_only_imports_what_is_used(self):
+        script = textwrap.dedent("""
+            import sys
+            from touchdown.core import workspace
+
+            ws = workspace.Workspace()
+            aws = ws.add_aws(region='eu-west-1')
+            aws.add_load_balancer(name='test-lb', listeners=[])
+            assert "touchdown.aws.elb" in sys.modules
+            assert "touchdown.aws.rds" not in sys.modules
+            assert "touchdown.aws.cost" not in sys.modules
+
+            assert sys.modules["touchdown.aws.elb"].LoadBalancer.meta.get_plan("cost")
+            assert "touchdown.aws.cost" in sys.modules
+        """)
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+        subprocess.check_call([sys.executable, "-c", script], env=env)
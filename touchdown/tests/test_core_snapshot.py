@@ -0,0 +1,93 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import mock
+from dateutil import tz
+
+from touchdown.core import snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_round_trip(self):
+        obj = {
+            "Name": "foo",
+            "CreationDate": datetime.datetime(2016, 5, 1, 12, 30, tzinfo=tz.tzutc()),
+            "Blob": b"\x00\x01",
+            "Tags": [{"Key": "Name", "Value": "foo"}],
+        }
+        self.assertEqual(snapshot.loads(snapshot.dumps(obj)), obj)
+
+
+class TestStateStore(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "state", "state.db")
+        self.store = snapshot.StateStore(self.path, ttl=60, namespace="project")
+
+    def test_round_trip(self):
+        self.store.set("vpc 'main'", "abc", "vpc-123", {"VpcId": "vpc-123"})
+        self.assertEqual(self.store.get("vpc 'main'", "abc"), {"VpcId": "vpc-123"})
+
+    def test_persists(self):
+        self.store.set("vpc 'main'", "abc", "vpc-123", {"VpcId": "vpc-123"})
+        store = snapshot.StateStore(self.path, ttl=60, namespace="project")
+        self.assertEqual(store.get("vpc 'main'", "abc"), {"VpcId": "vpc-123"})
+
+    def test_namespaces(self):
+        self.store.set("vpc 'main'", "abc", "vpc-123", {"VpcId": "vpc-123"})
+        store = snapshot.StateStore(self.path, ttl=60, namespace="other")
+        self.assertEqual(store.get("vpc 'main'", "abc"), None)
+
+    def test_reconfigured(self):
+        self.store.set("vpc 'main'", "abc", "vpc-123", {"VpcId": "vpc-123"})
+        self.assertEqual(self.store.get("vpc 'main'", "def"), None)
+
+    def test_expired(self):
+        self.store.set("vpc 'main'", "abc", "vpc-123", {"VpcId": "vpc-123"})
+        with mock.patch("time.time", return_value=time.time() + 61):
+            self.assertEqual(self.store.get("vpc 'main'", "abc"), None)
+
+    def test_no_ttl(self):
+        store = snapshot.StateStore(self.path, namespace="project")
+        store.set("vpc 'main'", "abc", "vpc-123", {"VpcId": "vpc-123"})
+        self.assertEqual(store.get("vpc 'main'", "abc"), None)
+
+    def test_discard(self):
+        self.store.set("vpc 'main'", "abc", "vpc-123", {"VpcId": "vpc-123"})
+        self.store.discard("vpc 'main'")
+        self.assertEqual(self.store.get("vpc 'main'", "abc"), None)
+
+    def test_converged(self):
+        self.store.set("vpc 'main'", "abc", "vpc-123", {"VpcId": "vpc-123"})
+        self.assertEqual(self.store.get_converged("vpc 'main'", "abc", 60), None)
+
+        self.store.mark_converged("vpc 'main'", "abc")
+        self.assertEqual(self.store.get_converged("vpc 'main'", "abc", 60), {"VpcId": "vpc-123"})
+        self.assertEqual(self.store.get_converged("vpc 'main'", "def", 60), None)
+        with mock.patch("time.time", return_value=time.time() + 61):
+            self.assertEqual(self.store.get_converged("vpc 'main'", "abc", 60), None)
+
+        # Describing it again means it has to be planned again
+        self.store.set("vpc 'main'", "abc", "vpc-123", {"VpcId": "vpc-123"})
+        self.assertEqual(self.store.get_converged("vpc 'main'", "abc", 60), None)
@@ -0,0 +1,70 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from touchdown.core.throttle import Throttle, ThrottleRegistry
+
+
+class TestThrottle(unittest.TestCase):
+
+    def test_throttled_halves_limit(self):
+        t = Throttle(8)
+        generation = t.acquire()
+        t.throttled(generation)
+        self.assertEqual(int(t.limit), 4)
+
+    def test_throttled_once_per_generation(self):
+        t = Throttle(8)
+        first = t.acquire()
+        second = t.acquire()
+        t.throttled(first)
+        t.throttled(second)
+        self.assertEqual(int(t.limit), 4)
+
+        t.throttled(t.acquire())
+        self.assertEqual(int(t.limit), 2)
+
+    def test_never_below_minimum(self):
+        t = Throttle(2)
+        for i in range(5):
+            t.throttled(t.generation)
+        self.assertEqual(int(t.limit), 1)
+
+    def test_success_grows_to_maximum(self):
+        t = Throttle(4)
+        t.throttled(t.generation)
+        self.assertEqual(int(t.limit), 2)
+        # Roughly one extra slot per "window" of successful calls
+        for i in range(3):
+            t.success()
+        self.assertEqual(int(t.limit), 3)
+        for i in range(100):
+            t.success()
+        self.assertEqual(t.limit, 4)
+
+
+class TestThrottleRegistry(unittest.TestCase):
+
+    def test_shared_per_key(self):
+        r = ThrottleRegistry(maximum=16)
+        self.assertIs(r.get("ec2", "eu-west-1"), r.get("ec2", "eu-west-1"))
+        self.assertIsNot(r.get("ec2", "eu-west-1"), r.get("ec2", "us-east-1"))
+
+    def test_service_limit(self):
+        r = ThrottleRegistry()
+        r.configure(16, {"ec2": 4, "s3": 64})
+        self.assertEqual(r.get("ec2").maximum, 4)
+        self.assertEqual(r.get("s3").maximum, 16)
+        self.assertEqual(r.get("iam").maximum, 16)
@@ -0,0 +1,114 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from touchdown.core.workspace import (
+    Touchdownfile,
+    WorkspaceCache,
+    _modules_unchanged,
+    _stat_modules,
+)
+
+TOUCHDOWNFILE = """
+folder = workspace.add_local_folder(name="files")
+folder.add_file(name="hello.txt")
+"""
+
+
+class TestTouchdownfile(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        cwd = os.getcwd()
+        os.chdir(self.directory)
+        self.addCleanup(os.chdir, cwd)
+        self.write(TOUCHDOWNFILE)
+
+    def write(self, source):
+        with open("Touchdownfile", "w") as fp:
+            fp.write(source)
+
+    def load(self, cache_graph=False):
+        workspace = Touchdownfile()
+        workspace.cache_directory = os.path.join(self.directory, "cache")
+        workspace.load(cache_graph=cache_graph)
+        return workspace
+
+    def get_folder(self, workspace):
+        folder, = (r for r in workspace.dependencies if r.resource_name == "local_folder")
+        return folder
+
+    def assert_graph(self, workspace):
+        folder = self.get_folder(workspace)
+        self.assertEqual(folder.name, os.path.join(self.directory, "files"))
+        self.assertIs(folder.parent, workspace)
+        self.assertIs(folder.workspace, workspace)
+
+    def test_bytecode_is_reused(self):
+        self.assert_graph(self.load())
+        with mock.patch("touchdown.core.workspace.compile", create=True) as compile:
+            self.assert_graph(self.load())
+        self.assertFalse(compile.called)
+
+    def test_graph_is_reused(self):
+        self.assert_graph(self.load(cache_graph=True))
+        with mock.patch.object(WorkspaceCache, "load_code") as load_code:
+            self.assert_graph(self.load(cache_graph=True))
+        self.assertFalse(load_code.called)
+
+    def test_graph_not_reused_by_default(self):
+        self.load(cache_graph=True)
+        with mock.patch.object(WorkspaceCache, "load_graph") as load_graph:
+            self.assert_graph(self.load())
+        self.assertFalse(load_graph.called)
+
+    def test_changed_touchdownfile(self):
+        self.load(cache_graph=True)
+        self.write(TOUCHDOWNFILE.replace('"files"', '"other"'))
+        folder = self.get_folder(self.load(cache_graph=True))
+        self.assertEqual(folder.name, os.path.join(self.directory, "other"))
+
+    def test_unpicklable_graph(self):
+        self.write(
+            "from touchdown.core import serializers\n"
+            "workspace.add_local_folder(name=serializers.Expression(lambda r, o: 'x'))\n"
+        )
+        self.load(cache_graph=True)
+        self.assertEqual([name for name in os.listdir("cache") if name.endswith(".graph")], [])
+        folder = self.get_folder(self.load(cache_graph=True))
+        self.assertEqual(folder.name.render(None, None), "x")
+
+
+class TestModuleFingerprints(unittest.TestCase):
+
+    def test_changed_module(self):
+        fd, path = tempfile.mkstemp(suffix=".py")
+        os.close(fd)
+        self.addCleanup(os.unlink, path)
+
+        module = mock.Mock(__file__=path)
+        with mock.patch.dict("sys.modules", {"fake_module": module}):
+            modules = _stat_modules(["fake_module"])
+        self.assertTrue(_modules_unchanged(modules))
+
+        with open(path, "w") as fp:
+            fp.write("changed = True\n")
+        self.assertFalse(_modules_unchanged(modules))
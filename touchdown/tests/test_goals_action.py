@@ -0,0 +1,239 @@
+# Copyright 2016 Isotoma Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from touchdown.core import (
+    action,
+    argument,
+    errors,
+    fingerprint,
+    goals,
+    plan,
+    resource,
+    snapshot,
+    workspace,
+)
+from touchdown.core.map import ParallelMap, SerialMap
+from touchdown.core.reactor import Poll
+from touchdown.frontends import ConsoleFrontend
+
+REMOTE = {}
+
+
+class Thing(resource.Resource):
+
+    resource_name = "thing"
+
+    name = argument.String()
+    size = argument.Integer()
+    root = argument.Resource(workspace.Workspace)
+
+
+class Resize(action.Action):
+
+    @property
+    def description(self):
+        yield "Resize {} to {}".format(self.resource, self.resource.size)
+
+    def run(self):
+        REMOTE[self.resource.name] = self.resource.size
+
+
+class Apply(plan.Plan):
+
+    resource = Thing
+    name = "apply"
+
+    describes = 0
+
+    def describe_object(self):
+        Apply.describes += 1
+        return {"Size": REMOTE[self.resource.name]}
+
+    def get_actions(self):
+        self.object = self.runner.get_remote_object(self)
+        if self.object["Size"] != self.resource.size:
+            yield Resize(self)
+
+
+class Describe(plan.Plan):
+
+    resource = Thing
+    name = "describe"
+
+    def describe_object(self):
+        Apply.describes += 1
+        return {"Size": REMOTE[self.resource.name]}
+
+    def get_actions(self):
+        self.object = self.runner.get_remote_object(self)
+        return []
+
+
+class TestStateStore(unittest.TestCase):
+
+    def setUp(self):
+        REMOTE.clear()
+        REMOTE.update({"a": 1, "b": 1})
+        Apply.describes = 0
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.state = snapshot.StateStore(os.path.join(directory, "state.db"), ttl=60)
+
+        self.workspace = workspace.Workspace()
+        self.a = self.workspace.add_thing(name="a", size=2)
+        self.b = self.workspace.add_thing(name="b", size=1, ensure=["never-create"])
+
+    def apply(self, **kwargs):
+        goal = goals.create("apply", self.workspace, ConsoleFrontend(interactive=False), map=SerialMap)
+        goal.state = self.state
+        goal.execute(**kwargs)
+
+    def test_describe_uses_state(self):
+        self.apply()
+        self.assertEqual(Apply.describes, 2)
+        Apply.describes = 0
+        self.assertRaises(errors.NothingChanged, self.apply)
+        # Only the resource that might be changed is described again
+        self.assertEqual(Apply.describes, 1)
+
+    def test_changed_resource_forgotten(self):
+        self.apply()
+        fingerprints = fingerprint.Fingerprints()
+        self.assertEqual(self.state.get("thing 'a'", fingerprints.get(self.a)), None)
+        self.assertEqual(self.state.get("thing 'b'", fingerprints.get(self.b)), {"Size": 1})
+
+    def test_skip_unchanged(self):
+        self.apply(skip_unchanged=60)
+        self.assertEqual(Apply.describes, 2)
+
+        # 'a' was just changed so has to be checked again
+        Apply.describes = 0
+        self.assertRaises(errors.NothingChanged, self.apply, skip_unchanged=60)
+        self.assertEqual(Apply.describes, 1)
+
+        Apply.describes = 0
+        self.assertRaises(errors.NothingChanged, self.apply, skip_unchanged=60)
+        self.assertEqual(Apply.describes, 0)
+
+    def test_skip_unchanged_reconfigured(self):
+        self.apply()
+        self.assertRaises(errors.NothingChanged, self.apply)
+
+        Apply.describes = 0
+        self.a.size = 3
+        self.apply(skip_unchanged=60)
+        self.assertEqual(Apply.describes, 1)
+        self.assertEqual(REMOTE["a"], 3)
+
+    def test_skip_unchanged_drift(self):
+        self.apply()
+        self.assertRaises(errors.NothingChanged, self.apply)
+
+        # Without --skip-unchanged everything is checked
+        REMOTE["a"] = 5
+        self.apply()
+        self.assertEqual(REMOTE["a"], 2)
+
+
+class TestSavedPlans(unittest.TestCase):
+
+    def setUp(self):
+        REMOTE.clear()
+        REMOTE.update({"a": 1, "b": 1})
+        Apply.describes = 0
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "plan.json")
+
+        self.workspace = workspace.Workspace()
+        self.a = self.workspace.add_thing(name="a", size=2)
+        self.b = self.workspace.add_thing(name="b", size=1)
+
+    def get_goal(self, name="apply"):
+        return goals.create(name, self.workspace, ConsoleFrontend(interactive=False), map=SerialMap)
+
+    def test_plan_out(self):
+        self.get_goal().execute(plan_out=self.path)
+        self.assertEqual(REMOTE["a"], 1)
+
+        with open(self.path) as fp:
+            saved = json.load(fp)
+        self.assertEqual(saved["goal"], "apply")
+        self.assertEqual(saved["resources"]["thing 'a'"]["actions"], [["Resize thing 'a' to 2"]])
+        self.assertEqual(saved["resources"]["thing 'a'"]["object"], {"Size": 1})
+        self.assertEqual(saved["resources"]["thing 'b'"]["actions"], [])
+
+    def test_plan_in_skips_describe(self):
+        self.get_goal().execute(plan_out=self.path)
+        Apply.describes = 0
+
+        self.get_goal().execute(plan_in=self.path)
+        self.assertEqual(Apply.describes, 0)
+        self.assertEqual(REMOTE["a"], 2)
+
+    def test_plan_in_describes_changed_resources(self):
+        self.get_goal().execute(plan_out=self.path)
+        Apply.describes = 0
+
+        self.b.size = 3
+        self.assertRaises(errors.Error, self.get_goal().execute, plan_in=self.path)
+        self.assertEqual(Apply.describes, 1)
+        self.assertEqual(REMOTE["a"], 1)
+
+    def test_plan_in_wrong_goal(self):
+        self.get_goal().execute(plan_out=self.path)
+        self.assertRaises(errors.Error, self.get_goal("destroy").execute, plan_in=self.path)
+
+
+class TestPollErrors(unittest.TestCase):
+
+    def setUp(self):
+        REMOTE.clear()
+        REMOTE.update({"a": 1})
+        self.workspace = workspace.Workspace()
+        self.workspace.add_thing(name="a", size=2)
+
+    def assert_action_cleans_up(self, map):
+        cleaned_up = []
+
+        def run_async(action):
+            try:
+                yield Poll(lambda: False, 0.01, 2)
+            finally:
+                cleaned_up.append(True)
+
+        goal = goals.create("apply", self.workspace, ConsoleFrontend(interactive=False), map=map)
+        with mock.patch.object(Resize, "run_async", run_async):
+            try:
+                goal.execute()
+            except errors.Error:
+                self.assertEqual(cleaned_up, [True])
+            else:
+                self.fail("The poll error wasn't raised")
+
+    def test_serial(self):
+        self.assert_action_cleans_up(SerialMap)
+
+    def test_parallel(self):
+        self.assert_action_cleans_up(ParallelMap)
@@ -59,6 +59,42 @@ class TestCase(unittest.TestCase):
             self.assertTrue(os.path.exists(fp.name))
             self.assertEquals(open(fp.name, "r").read(), "hello")
 
+    def test_file_apply_pipeline(self):
+        with tempfile.NamedTemporaryFile(delete=True) as fp:
+            fp.close()
+
+            bundle = self.workspace.add_fuselage_bundle(
+                target=self.workspace.add_local(),
+            )
+            bundle.add_file(
+                name=fp.name,
+                contents="hello",
+            )
+            self.apply_runner = goals.create(
+                "apply",
+                self.workspace,
+                ConsoleFrontend(interactive=False),
+            )
+            self.apply_runner.execute(pipeline=True)
+            self.assertEqual(open(fp.name, "r").read(), "hello")
+
+    def test_pipeline_nothing_changed(self):
+        self.apply_runner = goals.create(
+            "apply",
+            self.workspace,
+            ConsoleFrontend(interactive=False),
+        )
+        self.assertRaises(errors.NothingChanged, self.apply_runner.execute, pipeline=True)
+
+    def test_pipeline_requires_unattended(self):
+        self.apply_runner = goals.create(
+            "apply",
+            self.workspace,
+            ConsoleFrontend(interactive=True),
+            map=SerialMap
+        )
+        self.assertRaises(errors.Error, self.apply_runner.execute, pipeline=True)
+
     def test_file_apply_serializers(self):
         with tempfile.NamedTemporaryFile(delete=True) as fp:
             fp.close()
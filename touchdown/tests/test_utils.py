@@ -12,9 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import shutil
+import tempfile
 import unittest
 
-from touchdown.core.utils import force_bytes, force_str, force_unicode
+from touchdown.core.utils import (
+    force_bytes,
+    force_str,
+    force_unicode,
+    write_atomically,
+)
 
 
 class TestStringHelpers(unittest.TestCase):
@@ -54,3 +62,28 @@ class TestStringHelpers(unittest.TestCase):
 
     def test_bytes_exception(self):
         self.assertRaises(ValueError, force_bytes, [])
+
+
+class TestWriteAtomically(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "cache", "file")
+
+    def test_write(self):
+        write_atomically(self.path, lambda fp: fp.write(b"foo"))
+        with open(self.path, "rb") as fp:
+            self.assertEqual(fp.read(), b"foo")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["file"])
+
+    def test_failed_write_cleaned_up(self):
+        def writer(fp):
+            fp.write(b"bar")
+            raise ValueError("Can't finish writing")
+
+        write_atomically(self.path, lambda fp: fp.write(b"foo"))
+        self.assertRaises(ValueError, write_atomically, self.path, writer)
+        with open(self.path, "rb") as fp:
+            self.assertEqual(fp.read(), b"foo")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["file"])